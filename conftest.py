@@ -13,6 +13,7 @@ from saleor.tests.utils import prepare_test_db_connections
 TEST_DATABASES = {
     settings.DATABASE_CONNECTION_DEFAULT_NAME,
     settings.DATABASE_CONNECTION_REPLICA_NAME,
+    settings.DATABASE_CONNECTION_REPLICA_FALLBACK_NAME,
 }
 # Here, we trick Django test cases into using multiple databases.
 # Thanks to this, we do not have to mark all tests
@@ -41,7 +41,7 @@ def cors_handler(application: ASGI3Application) -> ASGI3Application:
                 (
                     b"access-control-allow-headers",
                     b"Origin, Content-Type, Accept, Authorization, "
-                    b"Authorization-Bearer",
+                    b"Authorization-Bearer, Saleor-Read-After",
                 ),
                 (b"access-control-allow-methods", b"POST, OPTIONS"),
                 (b"access-control-max-age", b"600"),
@@ -78,6 +78,7 @@ def cors_handler(application: ASGI3Application) -> ASGI3Application:
                         not in {
                             b"access-control-allow-credentials",
                             b"access-control-allow-origin",
+                            b"access-control-expose-headers",
                             b"vary",
                         }
                     ]
@@ -99,6 +100,9 @@ def cors_handler(application: ASGI3Application) -> ASGI3Application:
                                 request_origin.encode("latin1"),
                             )
                         )
+                        response_headers.append(
+                            (b"access-control-expose-headers", b"Saleor-Read-After")
+                        )
                         if b"Origin" not in vary_header:
                             if vary_header:
                                 vary_header += b", Origin"
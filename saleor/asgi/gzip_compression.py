@@ -1,9 +1,13 @@
 # adapted from Starlette's GZipMiddleware
 # Starlette does not work with Django's case-sensitive headers
 
+import asyncio
 import gzip
+import hashlib
 import io
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
 
 from asgiref.typing import (
     ASGI3Application,
@@ -14,10 +18,160 @@ from asgiref.typing import (
     Scope,
 )
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies larger than this are compressed in a thread, so the event loop keeps
+# serving other connections in the meantime.
+THREAD_COMPRESSION_MIN_SIZE = 64 * 1024
+# Bodies larger than this are compressed with faster, less effective settings.
+LARGE_BODY_SIZE = 1024 * 1024
+LARGE_BODY_GZIP_COMPRESSLEVEL = 6
+BROTLI_QUALITY = 5
+LARGE_BODY_BROTLI_QUALITY = 4
+# Number of compressed bodies kept for responses marked with
+# `CACHE_COMPRESSED_BODY_HEADER`, like the cached schema introspection.
+COMPRESSED_BODY_CACHE_SIZE = 8
+# Set by the application on responses that are sent again and again with the same
+# body; it's removed before the response is sent.
+CACHE_COMPRESSED_BODY_HEADER = "Saleor-Cache-Compressed-Body"
+
+_compressed_bodies: OrderedDict[tuple[str, int, bytes], bytes] = OrderedDict()
+_compressed_bodies_lock = threading.Lock()
+
+
+class GzipEncoder:
+    def __init__(self, compresslevel: int):
+        self.buffer = io.BytesIO()
+        self.file = gzip.GzipFile(
+            mode="wb", fileobj=self.buffer, compresslevel=compresslevel
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        self.file.write(data)
+        return self._flush_buffer()
+
+    def finish(self) -> bytes:
+        self.file.close()
+        return self._flush_buffer()
+
+    def _flush_buffer(self) -> bytes:
+        data = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+
+def choose_encoding(accept_encoding: bytes) -> Optional[str]:
+    """Return the supported encoding accepted by the client, preferring Brotli."""
+    accepted = set()
+    for item in accept_encoding.lower().split(b","):
+        encoding, _, params = item.partition(b";")
+        params = params.strip()
+        if params.startswith(b"q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(encoding.strip())
+    if brotli is not None and b"br" in accepted:
+        return "br"
+    if b"gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def get_encoder(
+    encoding: str, size: int, compresslevel: int
+) -> Union[GzipEncoder, BrotliEncoder]:
+    large = size >= LARGE_BODY_SIZE
+    if encoding == "br":
+        return BrotliEncoder(LARGE_BODY_BROTLI_QUALITY if large else BROTLI_QUALITY)
+    if large:
+        compresslevel = min(compresslevel, LARGE_BODY_GZIP_COMPRESSLEVEL)
+    return GzipEncoder(compresslevel)
+
+
+def compress_body(encoding: str, body: bytes, compresslevel: int) -> bytes:
+    encoder = get_encoder(encoding, len(body), compresslevel)
+    return encoder.compress(body) + encoder.finish()
+
+
+def compress_body_cached(encoding: str, body: bytes, compresslevel: int) -> bytes:
+    key = (encoding, compresslevel, hashlib.sha1(body).digest())
+    with _compressed_bodies_lock:
+        compressed_body = _compressed_bodies.get(key)
+        if compressed_body is not None:
+            _compressed_bodies.move_to_end(key)
+            return compressed_body
+    compressed_body = compress_body(encoding, body, compresslevel)
+    with _compressed_bodies_lock:
+        _compressed_bodies[key] = compressed_body
+        while len(_compressed_bodies) > COMPRESSED_BODY_CACHE_SIZE:
+            _compressed_bodies.popitem(last=False)
+    return compressed_body
+
+
+async def compress_complete_body(
+    encoding: str, body: bytes, compresslevel: int, cache_body: bool = False
+) -> bytes:
+    compress = compress_body_cached if cache_body else compress_body
+    if len(body) < THREAD_COMPRESSION_MIN_SIZE:
+        return compress(encoding, body, compresslevel)
+    return await asyncio.to_thread(compress, encoding, body, compresslevel)
+
+
+def pop_cache_compressed_body_header(start_message: HTTPResponseStartEvent) -> bool:
+    header = CACHE_COMPRESSED_BODY_HEADER.lower().encode("latin-1")
+    headers = [
+        (key, value) for key, value in start_message["headers"] if key.lower() != header
+    ]
+    found = len(headers) != len(start_message["headers"])
+    start_message["headers"] = headers
+    return found
+
+
+def set_content_encoding(start_message: HTTPResponseStartEvent, encoding: str):
+    headers = [
+        (key, value)
+        for key, value in start_message["headers"]
+        if key.lower() not in (b"content-length", b"content-encoding")
+    ]
+    headers.append((b"content-encoding", encoding.encode("latin-1")))
+    for index, (key, value) in enumerate(headers):
+        if key.lower() == b"vary":
+            if b"Accept-Encoding" not in value:
+                headers[index] = (key, value + b", Accept-Encoding")
+            break
+    start_message["headers"] = headers
+
 
 def gzip_compression(
     app: ASGI3Application, minimum_size: int = 500, compresslevel: int = 9
 ) -> ASGI3Application:
+    """Compress responses with Brotli or gzip, depending on `Accept-Encoding`.
+
+    Brotli is used only when the optional `brotli` package is installed, e.g. with
+    the `brotli` extra of Saleor. Bodies larger than `THREAD_COMPRESSION_MIN_SIZE`
+    are compressed in a thread and bodies larger than `LARGE_BODY_SIZE` use a faster
+    compression level. Compressed bodies of responses marked with
+    `CACHE_COMPRESSED_BODY_HEADER` are cached.
+    """
+
     async def gzip_compression_wrapper(
         scope: Scope, receive: ASGIReceiveCallable, send: ASGISendCallable
     ) -> None:
@@ -30,21 +184,33 @@ def gzip_compression(
                 ),
                 b"",
             )
-            if b"gzip" in accepted_encoding:
+            encoding = choose_encoding(accepted_encoding)
+            if encoding:
                 start_message: Optional[HTTPResponseStartEvent] = None
+                cache_body = False
                 content_encoding_set = False
                 started = False
-                gzip_buffer = io.BytesIO()
-                gzip_file = gzip.GzipFile(
-                    mode="wb", fileobj=gzip_buffer, compresslevel=compresslevel
-                )
+                encoder: Union[GzipEncoder, BrotliEncoder, None] = None
+
+                async def compress_chunk(data: bytes, more_body: bool) -> bytes:
+                    assert encoder is not None
+                    if len(data) < THREAD_COMPRESSION_MIN_SIZE:
+                        chunk = encoder.compress(data)
+                    else:
+                        chunk = await asyncio.to_thread(encoder.compress, data)
+                    if not more_body:
+                        chunk += encoder.finish()
+                    return chunk
 
                 async def send_compressed(message: ASGISendEvent) -> None:
+                    nonlocal cache_body
                     nonlocal content_encoding_set
+                    nonlocal encoder
                     nonlocal start_message
                     nonlocal started
                     if message["type"] == "http.response.start":
                         start_message = message
+                        cache_body = pop_cache_compressed_body_header(start_message)
                         headers = start_message["headers"]
                         content_encoding_set = any(
                             value
@@ -65,82 +231,52 @@ def gzip_compression(
                         body = message.get("body", b"")
                         more_body = message.get("more_body", False)
                         if len(body) < minimum_size and not more_body:
-                            # Don't apply GZip to small outgoing responses.
+                            # Don't compress small outgoing responses.
                             await send(start_message)
                             await send(message)
                         elif not more_body:
-                            # Standard GZip response.
-                            gzip_file.write(body)
-                            gzip_file.close()
-                            body = gzip_buffer.getvalue()
-
-                            headers = start_message["headers"]
-                            headers = [
-                                (key, value)
-                                for key, value in headers
-                                if key.lower()
-                                not in (b"content-length", b"content-encoding")
-                            ]
-                            headers.append((b"content-encoding", b"gzip"))
-                            headers.append(
+                            # Standard compressed response.
+                            body = await compress_complete_body(
+                                encoding, body, compresslevel, cache_body
+                            )
+                            set_content_encoding(start_message, encoding)
+                            start_message["headers"].append(
                                 (
                                     b"content-length",
                                     str(len(body)).encode("latin-1"),
                                 )
                             )
-                            for key, value in headers:
-                                if key.lower() == b"vary":
-                                    if b"Accept-Encoding" not in value:
-                                        value += b", Accept-Encoding"
-                                        break
-                            start_message["headers"] = headers
-
                             message["body"] = body
 
                             await send(start_message)
                             await send(message)
                         else:
-                            # Initial body in streaming GZip response.
-                            headers = start_message["headers"]
-                            headers = [
-                                (key, value)
-                                for key, value in headers
-                                if key.lower()
-                                not in (b"content-length", b"content-encoding")
-                            ]
-                            headers.append((b"content-encoding", b"gzip"))
-                            for key, value in headers:
-                                if key.lower() == b"vary":
-                                    if b"Accept-Encoding" not in value:
-                                        value += b", Accept-Encoding"
-                                        break
-                            start_message["headers"] = headers
-
-                            gzip_file.write(body)
-                            message["body"] = gzip_buffer.getvalue()
-                            gzip_buffer.seek(0)
-                            gzip_buffer.truncate()
+                            # Initial body in streaming compressed response.
+                            set_content_encoding(start_message, encoding)
+                            encoder = get_encoder(encoding, len(body), compresslevel)
+                            message["body"] = await compress_chunk(body, more_body)
 
                             await send(start_message)
                             await send(message)
 
                     elif message["type"] == "http.response.body":
-                        # Remaining body in streaming GZip response.
+                        # Remaining body in streaming compressed response.
                         body = message.get("body", b"")
                         more_body = message.get("more_body", False)
-
-                        gzip_file.write(body)
-                        if not more_body:
-                            gzip_file.close()
-
-                        message["body"] = gzip_buffer.getvalue()
-                        gzip_buffer.seek(0)
-                        gzip_buffer.truncate()
+                        message["body"] = await compress_chunk(body, more_body)
 
                         await send(message)
 
                 await app(scope, receive, send_compressed)
                 return
+
+            async def send_without_cache_header(message: ASGISendEvent) -> None:
+                if message["type"] == "http.response.start":
+                    pop_cache_compressed_body_header(message)
+                await send(message)
+
+            await app(scope, receive, send_without_cache_header)
+            return
         await app(scope, receive, send)
 
     return gzip_compression_wrapper
@@ -62,7 +62,7 @@ async def test_access_control_header_preflight(asgi_app: ASGI3Application, setti
                 (
                     b"access-control-allow-headers",
                     b"Origin, Content-Type, Accept, Authorization, "
-                    b"Authorization-Bearer",
+                    b"Authorization-Bearer, Saleor-Read-After",
                 ),
                 (b"access-control-allow-methods", b"POST, OPTIONS"),
                 (b"access-control-allow-origin", b"http://localhost:3000"),
@@ -86,6 +86,7 @@ async def test_access_control_header_simple(asgi_app: ASGI3Application, settings
             headers=[
                 (b"access-control-allow-credentials", b"true"),
                 (b"access-control-allow-origin", b"http://localhost:3000"),
+                (b"access-control-expose-headers", b"Saleor-Read-After"),
                 (b"content-type", b"text/plain"),
                 (b"vary", b"Origin"),
             ],
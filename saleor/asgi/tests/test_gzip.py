@@ -1,5 +1,8 @@
+import asyncio
 import gzip
+from unittest.mock import patch
 
+import pytest
 from asgiref.typing import (
     ASGI3Application,
     ASGIReceiveEvent,
@@ -8,7 +11,14 @@ from asgiref.typing import (
     HTTPScope,
 )
 
-from ..gzip_compression import gzip_compression
+from ..gzip_compression import (
+    CACHE_COMPRESSED_BODY_HEADER,
+    LARGE_BODY_SIZE,
+    choose_encoding,
+    compress_body,
+    compress_body_cached,
+    gzip_compression,
+)
 
 
 def build_scope(origin: str, encodings: bytes) -> HTTPScope:
@@ -86,3 +96,97 @@ async def test_with_supported_compression(large_asgi_app: ASGI3Application, sett
             type="http.response.body", body=expected_payload, more_body=False
         ),
     ]
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected_encoding"),
+    [
+        (b"identity", None),
+        (b"gzip, deflate", "gzip"),
+        (b"gzip, br", "br"),
+        (b"gzip, br;q=0", "gzip"),
+        (b"gzip;q=0", None),
+    ],
+)
+def test_choose_encoding(accept_encoding, expected_encoding):
+    pytest.importorskip("brotli")
+
+    # when
+    encoding = choose_encoding(accept_encoding)
+
+    # then
+    assert encoding == expected_encoding
+
+
+async def test_brotli_compression(large_asgi_app: ASGI3Application):
+    # given
+    brotli = pytest.importorskip("brotli")
+    app = gzip_compression(large_asgi_app)
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"gzip, br"))
+
+    # then
+    assert (b"content-encoding", b"br") in events[0]["headers"]
+    assert brotli.decompress(events[1]["body"]) == 10000 * b"x"
+
+
+def build_large_app(body: bytes, headers: list[tuple[bytes, bytes]]):
+    async def large_app(scope, receive, send) -> None:
+        await send(
+            HTTPResponseStartEvent(
+                type="http.response.start",
+                status=200,
+                headers=[(b"content-type", b"text/plain"), *headers],
+                trailers=False,
+            )
+        )
+        await send(
+            HTTPResponseBodyEvent(type="http.response.body", body=body, more_body=False)
+        )
+
+    return large_app
+
+
+async def test_large_body_compressed_in_thread():
+    # given
+    body = LARGE_BODY_SIZE * b"x"
+    app = gzip_compression(build_large_app(body, []))
+
+    # when
+    with patch(
+        "saleor.asgi.gzip_compression.asyncio.to_thread", wraps=asyncio.to_thread
+    ) as to_thread_mock:
+        events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    to_thread_mock.assert_called_once_with(compress_body, "gzip", body, 9)
+    assert gzip.decompress(events[1]["body"]) == body
+
+
+async def test_marked_body_compressed_once():
+    # given
+    body = LARGE_BODY_SIZE * b"y"
+    header = (CACHE_COMPRESSED_BODY_HEADER.encode("latin-1"), b"1")
+    app = gzip_compression(build_large_app(body, [header]))
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"gzip"))
+
+    # then
+    assert header not in events[0]["headers"]
+    assert gzip.decompress(events[1]["body"]) == body
+    # the compressed body is reused for the same response
+    assert compress_body_cached("gzip", body, 9) is events[1]["body"]
+
+
+async def test_cache_header_removed_without_compression():
+    # given
+    header = (CACHE_COMPRESSED_BODY_HEADER.encode("latin-1"), b"1")
+    app = gzip_compression(build_large_app(b"x", [header]))
+
+    # when
+    events = await run_app(app, build_scope("http://localhost:3000", b"identity"))
+
+    # then
+    assert events[0]["headers"] == [(b"content-type", b"text/plain")]
@@ -1,5 +1,6 @@
 import logging
 import os
+from fnmatch import fnmatch
 
 from celery import Celery
 from celery.signals import setup_logging
@@ -21,6 +22,61 @@ def setup_celery_logging(loglevel=None, **kwargs):
         logging.getLogger(CELERY_LOGGER_NAME).setLevel(loglevel)
 
 
+# Tasks grouped by priority class. The tasks of a class are sent to the queue
+# defined by the setting, so a big export can't delay the payment processing.
+# Classes are matched in order, so the cleanup tasks of the bulk class take
+# precedence over the wildcard patterns of the other classes.
+TASK_PRIORITY_CLASSES = {
+    "BULK_CELERY_QUEUE_NAME": [
+        "export-products",
+        "export-gift-cards",
+        "export-voucher-codes",
+        "saleor.csv.tasks.*",
+        "saleor.core.tasks.*",
+        "saleor.checkout.tasks.delete_expired_checkouts",
+        "saleor.order.tasks.expire_orders_task",
+        "saleor.order.tasks.delete_expired_orders_task",
+        "saleor.warehouse.tasks.*",
+        "saleor.giftcard.tasks.deactivate_expired_cards_task",
+        "saleor.payment.tasks.delete_processed_gateway_notifications_task",
+        "saleor.app.tasks.remove_apps_task",
+        "saleor.*.migrations.tasks.*",
+    ],
+    "CRITICAL_CELERY_QUEUE_NAME": [
+        "saleor.payment.tasks.*",
+        "saleor.order.tasks.recalculate_orders_task",
+        "saleor.order.tasks.send_order_updated",
+        "saleor.plugins.user_email.tasks.send_order_*",
+        "saleor.plugins.user_email.tasks.send_payment_confirmation_email_task",
+        "saleor.plugins.user_email.tasks.send_fulfillment_*",
+        "saleor.plugins.admin_email.tasks.send_staff_order_confirmation_email_task",
+    ],
+    "INDEXING_CELERY_QUEUE_NAME": [
+        "saleor.core.search_tasks.*",
+        "saleor.*.tasks.update_*_search_vector_task",
+        "saleor.product.tasks.*discounted_price*",
+        "saleor.product.tasks.update_variant_relations_for_active_promotion_rules_task",
+        "saleor.product.tasks.update_variants_names",
+        "saleor.discount.tasks.handle_promotion_toggle",
+        "saleor.discount.tasks.clear_promotion_rule_variants_task",
+    ],
+}
+
+
+def route_task(name, args, kwargs, options, task=None, **kw):
+    """Route the task to the queue of its priority class.
+
+    Tasks sent to a specific queue are not rerouted.
+    """
+    if options.get("queue"):
+        return None
+    for setting_name, task_patterns in TASK_PRIORITY_CLASSES.items():
+        queue = getattr(settings, setting_name)
+        if queue and any(fnmatch(name, pattern) for pattern in task_patterns):
+            return {"queue": queue}
+    return None
+
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
 
 app = Celery("saleor")
@@ -1,52 +1,39 @@
 import logging
+import time
 from decimal import Decimal
+from typing import Optional
+from uuid import UUID
 
+import opentracing
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Exists, OuterRef, Q, QuerySet, Subquery
 from django.utils import timezone
 
 from ..celeryconf import app
-from ..payment.models import TransactionItem
-from .models import Checkout, CheckoutLine
+from ..discount.models import CheckoutDiscount, CheckoutLineDiscount
+from ..payment.models import Payment, TransactionItem
+from ..warehouse.models import PreorderReservation, Reservation
+from .models import Checkout, CheckoutLine, CheckoutMetadata
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
 
-@app.task
-def delete_expired_checkouts(
-    batch_size: int = 2000,
-    batch_count: int = 5,
-    invocation_count: int = 1,
-    invocation_limit: int = 500,
-) -> tuple[int, bool]:
-    """Delete inactive checkouts from the database.
-
-    Inactivity is based on the "Checkout.last_change" datetime column.
-
-    Deletes:
-    - Anonymous checkouts after 30 days of inactivity no matter if it has lines or not,
-      configurable through ``settings.ANONYMOUS_CHECKOUTS_TIMEDELTA``.
-    - Users checkouts after 90 days of inactivity no matter if it has lines or not,
-      configurable via``settings.USER_CHECKOUTS_TIMEDELTA``.
-    - All anonymous and users checkouts after 6h of inactivity
-      if there are no lines associated, refer to ``settings.EMPTY_CHECKOUTS_TIMEDELTA``.
-
-    :param batch_size: The maximum row count that can be deleted per ``DELETE FROM``
-        SQL statement. Around 13.5 KB of memory will be utilized by the Celery
-        worker per row, thus 2000 will be using around 27 MB.
-    :param batch_count: How many batches can be executed in a single task.
-        This limits how long can the task run as there may be lots of checkouts
-        to delete.
-    :param invocation_count: How many times the task re-triggered itself up.
-    :param invocation_limit: The maximum times the task can re-trigger itself up
-        in order to limit how long it may run.
+def get_token_range(
+    partition: int, partition_count: int
+) -> tuple[UUID, Optional[UUID]]:
+    """Return the range of checkout tokens handled by the given partition.
 
-    :return: A tuple containing row count deleted (int)
-             and whether there is more to delete (bool).
+    Tokens are random UUIDs, so equal ranges hold a similar number of checkouts.
     """
-    now = timezone.now()
+    start = UUID(int=(partition << 128) // partition_count)
+    if partition == partition_count - 1:
+        return start, None
+    return start, UUID(int=((partition + 1) << 128) // partition_count)
+
 
+def get_expired_checkouts(now) -> QuerySet[Checkout]:
     expired_anonymous_checkouts = (
         Q(last_change__lt=now - settings.ANONYMOUS_CHECKOUTS_TIMEDELTA)
         & Q(email__isnull=True)
@@ -77,34 +64,170 @@ def delete_expired_checkouts(
         )
     )
 
-    qs: QuerySet[Checkout] = Checkout.objects.filter(
-        (empty_checkouts | expired_anonymous_checkouts | expired_user_checkout)
+    return Checkout.objects.filter(
+        # the shortest inactivity period comes first, so the range scan of the
+        # `last_change` index narrows down the checkouts to check
+        Q(last_change__lt=now - get_min_checkouts_timedelta())
+        & (empty_checkouts | expired_anonymous_checkouts | expired_user_checkout)
         & ~Q(Exists(with_transactions))
     )
-    qs = qs.only("pk").order_by()[:batch_size]
+
+
+def get_min_checkouts_timedelta():
+    return min(
+        settings.ANONYMOUS_CHECKOUTS_TIMEDELTA,
+        settings.USER_CHECKOUTS_TIMEDELTA,
+        settings.EMPTY_CHECKOUTS_TIMEDELTA,
+    )
+
+
+def delete_checkouts(tokens: list[UUID]) -> int:
+    """Delete the checkouts and their related objects.
+
+    Related objects are removed with set-based deletes instead of being loaded
+    into memory by the Django deletion collector, so no signals are sent.
+    """
+    lines = CheckoutLine.objects.filter(checkout_id__in=tokens)
+    reserved_line_id = OuterRef("checkout_line_id")
+    querysets_to_delete: list[QuerySet] = [
+        Reservation.objects.filter(Exists(lines.filter(id=reserved_line_id))),
+        PreorderReservation.objects.filter(Exists(lines.filter(id=reserved_line_id))),
+        CheckoutLineDiscount.objects.filter(
+            Exists(lines.filter(id=OuterRef("line_id")))
+        ),
+        lines,
+        CheckoutDiscount.objects.filter(checkout_id__in=tokens),
+        CheckoutMetadata.objects.filter(checkout_id__in=tokens),
+        Checkout.gift_cards.through.objects.filter(checkout_id__in=tokens),
+    ]
+    for queryset in querysets_to_delete:
+        queryset._raw_delete(queryset.db)  # type: ignore[attr-defined] # raw access
+    Payment.objects.filter(checkout_id__in=tokens).update(checkout=None)
+    TransactionItem.objects.filter(checkout_id__in=tokens).update(checkout=None)
+
+    checkouts = Checkout.objects.filter(pk__in=tokens)
+    return checkouts._raw_delete(checkouts.db)  # type: ignore[attr-defined] # raw access
+
+
+@app.task
+def delete_expired_checkouts(
+    batch_size: int = 2000,
+    batch_count: int = 5,
+    invocation_count: int = 1,
+    invocation_limit: int = 500,
+    partition: Optional[int] = None,
+    partition_count: int = 1,
+) -> tuple[int, bool]:
+    """Delete inactive checkouts from the database.
+
+    Inactivity is based on the "Checkout.last_change" datetime column.
+
+    Deletes:
+    - Anonymous checkouts after 30 days of inactivity no matter if it has lines or not,
+      configurable through ``settings.ANONYMOUS_CHECKOUTS_TIMEDELTA``.
+    - Users checkouts after 90 days of inactivity no matter if it has lines or not,
+      configurable via``settings.USER_CHECKOUTS_TIMEDELTA``.
+    - All anonymous and users checkouts after 6h of inactivity
+      if there are no lines associated, refer to ``settings.EMPTY_CHECKOUTS_TIMEDELTA``.
+
+    When ``settings.DELETE_EXPIRED_CHECKOUTS_PARTITIONS`` is greater than one,
+    the task triggers a separate task for each range of checkout tokens, so the
+    checkouts are deleted in parallel.
+
+    :param batch_size: The maximum row count that can be deleted per ``DELETE FROM``
+        SQL statement.
+    :param batch_count: How many batches can be executed in a single task.
+        This limits how long can the task run as there may be lots of checkouts
+        to delete.
+    :param invocation_count: How many times the task re-triggered itself up.
+    :param invocation_limit: The maximum times the task can re-trigger itself up
+        in order to limit how long it may run.
+    :param partition: The range of checkout tokens handled by the task,
+        see ``get_token_range``.
+    :param partition_count: The number of ranges the checkout tokens are split to.
+
+    :return: A tuple containing row count deleted (int)
+             and whether there is more to delete (bool).
+    """
+    now = timezone.now()
+    if partition is None and invocation_count == 1:
+        # Counted once per run, in the task dispatching the partitions; it's the
+        # upper limit of checkouts waiting to be deleted.
+        backlog = Checkout.objects.filter(
+            last_change__lt=now - get_min_checkouts_timedelta()
+        ).count()
+        task_logger.info("Expired checkouts backlog: up to %d checkouts.", backlog)
+
+    if partition is None and settings.DELETE_EXPIRED_CHECKOUTS_PARTITIONS > 1:
+        partition_count = settings.DELETE_EXPIRED_CHECKOUTS_PARTITIONS
+        for partition_number in range(partition_count):
+            delete_expired_checkouts.delay(
+                batch_size=batch_size,
+                batch_count=batch_count,
+                invocation_count=invocation_count,
+                invocation_limit=invocation_limit,
+                partition=partition_number,
+                partition_count=partition_count,
+            )
+        return 0, True
+
+    started_at = time.monotonic()
+    qs = get_expired_checkouts(now)
+    if partition is not None:
+        token_from, token_to = get_token_range(partition, partition_count)
+        qs = qs.filter(token__gte=token_from)
+        if token_to is not None:
+            qs = qs.filter(token__lt=token_to)
 
     total_deleted: int = 0
     has_more: bool = True
-    for batch_number in range(batch_count):
-        deleted_count, _ = Checkout.objects.filter(pk__in=qs.values_list("pk")).delete()
-        total_deleted += deleted_count
-
-        # Stop deleting inactive checkouts if there was no match.
-        if deleted_count < batch_size:
-            has_more = False
-            break
+    with opentracing.global_tracer().start_active_span(
+        "checkout.delete_expired"
+    ) as scope:
+        span = scope.span
+        span.set_tag(opentracing.tags.COMPONENT, "tasks")
+        span.set_tag("checkout.partition", partition or 0)
+        for batch_number in range(batch_count):
+            with transaction.atomic():
+                # Checkouts locked by other workers or by the checkout
+                # completion are skipped.
+                tokens = list(
+                    qs.select_for_update(of=("self",), skip_locked=True)
+                    .order_by()
+                    .values_list("pk", flat=True)[:batch_size]
+                )
+                deleted_count = delete_checkouts(tokens) if tokens else 0
+            total_deleted += deleted_count
+
+            # Stop deleting inactive checkouts if there was no match.
+            if deleted_count < batch_size:
+                has_more = False
+                break
+        span.set_tag("checkout.deleted_count", total_deleted)
 
     if total_deleted:
-        task_logger.debug("Deleted %d checkouts.", total_deleted)
+        duration = time.monotonic() - started_at
+        task_logger.info(
+            "Deleted %d checkouts in %.2f seconds (%.1f checkouts per second).",
+            total_deleted,
+            duration,
+            total_deleted / duration if duration else total_deleted,
+        )
 
     if has_more:
         if invocation_count < invocation_limit:
             # Continue deleting checkouts as there may be still more to delete.
+            partition_kwargs = (
+                {"partition": partition, "partition_count": partition_count}
+                if partition is not None
+                else {}
+            )
             delete_expired_checkouts.delay(
                 batch_size=batch_size,
                 batch_count=batch_count,
                 invocation_count=invocation_count + 1,
                 invocation_limit=invocation_limit,
+                **partition_kwargs,
             )
         else:
             task_logger.warning("Invocation limit reached, aborting task")
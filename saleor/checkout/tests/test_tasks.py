@@ -6,8 +6,9 @@ from uuid import UUID
 import pytest
 from django.utils import timezone
 
-from ..models import Checkout
-from ..tasks import delete_expired_checkouts
+from ...warehouse.models import Reservation
+from ..models import Checkout, CheckoutLine, CheckoutMetadata
+from ..tasks import delete_expired_checkouts, get_token_range
 
 
 def test_delete_expired_anonymous_checkouts(checkouts_list, variant, customer_user):
@@ -454,3 +455,112 @@ def test_aborts_deleting_checkouts_when_invocation_count_exhausted(
 
     # Should have stopped there
     mocked_task.assert_not_called()
+
+
+def test_delete_expired_checkouts_deletes_related_objects(
+    checkout_line_with_reservation_in_many_stocks,
+):
+    # given
+    checkout = checkout_line_with_reservation_in_many_stocks.checkout
+    CheckoutMetadata.objects.get_or_create(checkout=checkout)
+    Checkout.objects.filter(pk=checkout.pk).update(
+        email=None, user=None, last_change=timezone.now() - timedelta(days=35)
+    )
+
+    # when
+    deleted_count, has_more = delete_expired_checkouts()
+
+    # then
+    assert deleted_count == 1
+    assert has_more is False
+    assert not Checkout.objects.filter(pk=checkout.pk).exists()
+    assert not CheckoutLine.objects.filter(checkout_id=checkout.pk).exists()
+    assert not CheckoutMetadata.objects.filter(checkout_id=checkout.pk).exists()
+    assert not Reservation.objects.exists()
+
+
+def test_delete_expired_checkouts_for_token_range(channel_USD):
+    # given
+    first_half_token = UUID(int=1)
+    second_half_token = UUID(int=2**127 + 1)
+    Checkout.objects.bulk_create(
+        [
+            Checkout(
+                currency=channel_USD.currency_code, channel=channel_USD, token=token
+            )
+            for token in [first_half_token, second_half_token]
+        ]
+    )
+    Checkout.objects.update(last_change=timezone.now() - timedelta(hours=7))
+
+    # when
+    deleted_count, has_more = delete_expired_checkouts(partition=1, partition_count=2)
+
+    # then
+    assert deleted_count == 1
+    assert has_more is False
+    assert list(Checkout.objects.values_list("pk", flat=True)) == [first_half_token]
+
+
+@mock.patch("saleor.checkout.tasks.delete_expired_checkouts.delay")
+def test_delete_expired_checkouts_triggers_task_per_partition(
+    mocked_task: mock.MagicMock, checkout, settings
+):
+    # given
+    settings.DELETE_EXPIRED_CHECKOUTS_PARTITIONS = 2
+    Checkout.objects.update(last_change=timezone.now() - timedelta(hours=7))
+
+    # when
+    delete_expired_checkouts(batch_size=10)
+
+    # then
+    assert Checkout.objects.filter(pk=checkout.pk).exists()
+    mocked_task.assert_has_calls(
+        [
+            mock.call(
+                batch_size=10,
+                batch_count=5,
+                invocation_count=1,
+                invocation_limit=500,
+                partition=partition,
+                partition_count=2,
+            )
+            for partition in range(2)
+        ]
+    )
+
+
+@mock.patch("saleor.checkout.tasks.task_logger.info")
+@mock.patch("saleor.checkout.tasks.delete_expired_checkouts.delay")
+def test_delete_expired_checkouts_logs_backlog_once_per_run(
+    mocked_task: mock.MagicMock, mocked_logger: mock.MagicMock, checkout, settings
+):
+    # given
+    settings.DELETE_EXPIRED_CHECKOUTS_PARTITIONS = 2
+    Checkout.objects.update(last_change=timezone.now() - timedelta(hours=7))
+
+    # when
+    delete_expired_checkouts()
+    delete_expired_checkouts(partition=0, partition_count=2)
+    delete_expired_checkouts(partition=1, partition_count=2)
+
+    # then
+    backlog_logs = [
+        call
+        for call in mocked_logger.call_args_list
+        if call.args[0].startswith("Expired checkouts backlog")
+    ]
+    assert backlog_logs == [
+        mock.call("Expired checkouts backlog: up to %d checkouts.", 1)
+    ]
+
+
+def test_get_token_range():
+    # when
+    ranges = [get_token_range(partition, 3) for partition in range(3)]
+
+    # then
+    assert ranges[0][0] == UUID(int=0)
+    assert ranges[0][1] == ranges[1][0]
+    assert ranges[1][1] == ranges[2][0]
+    assert ranges[2][1] is None
@@ -242,16 +242,24 @@ def add_variants_to_checkout(
     replace=False,
     replace_reservations=False,
     reservation_length: Optional[int] = None,
+    existing_lines: Optional[Iterable[CheckoutLine]] = None,
 ):
     """Add variants to checkout.
 
     If a variant is not placed in checkout, a new checkout line will be created.
     If quantity is set to 0, checkout line will be deleted.
     Otherwise, quantity will be added or replaced (if replace argument is True).
+
+    Pass `existing_lines` with all lines of the checkout, with variants selected, when
+    they are already fetched to avoid fetching them again.
     """
     country_code = checkout.get_country()
 
-    checkout_lines = checkout.lines.select_related("variant")
+    checkout_lines = (
+        list(existing_lines)
+        if existing_lines is not None
+        else list(checkout.lines.select_related("variant"))
+    )
 
     lines_by_id = {str(line.pk): line for line in checkout_lines}
     variants_map = {str(variant.pk): variant for variant in variants}
@@ -269,6 +277,8 @@ def add_variants_to_checkout(
             variant = variants_map[line_data.variant_id]
             _append_line_to_create(to_create, checkout, variant, line_data, line)
 
+    # the line is added twice when both quantity and price are changed
+    to_update = list({line.pk: line for line in to_update}.values())
     if to_delete:
         CheckoutLine.objects.filter(pk__in=[line.pk for line in to_delete]).delete()
     if to_update:
@@ -281,7 +291,7 @@ def add_variants_to_checkout(
     to_reserve = to_create + to_update
 
     if reservation_length and to_reserve:
-        updated_lines_ids = [line.pk for line in to_reserve + to_delete]
+        updated_lines_ids = {line.pk for line in to_reserve + to_delete}
 
         # Validation for stock reservation should be performed on new and updated lines.
         # For already existing lines only reserved_until should be updated.
@@ -1,8 +1,9 @@
 from typing import Callable, Optional
 
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 from django.conf import settings
 from django.db.models import CharField, TextField
+from django.db.models.signals import post_save
 from django.utils.module_loading import import_string
 
 from .db.filters import PostgresILike
@@ -17,6 +18,21 @@ class CoreAppConfig(AppConfig):
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
         self.validate_jwt_manager()
+        self.connect_translation_signals()
+
+    def connect_translation_signals(self) -> None:
+        from .utils.translations import (
+            Translation,
+            invalidate_translations_cache_on_save,
+        )
+
+        for model in apps.get_models():
+            if issubclass(model, Translation):
+                post_save.connect(
+                    invalidate_translations_cache_on_save,
+                    sender=model,
+                    dispatch_uid=f"invalidate_{model._meta.label_lower}_cache",
+                )
 
     def validate_jwt_manager(self) -> None:
         jwt_manager_path = getattr(settings, "JWT_MANAGER_PATH", None)
@@ -0,0 +1,142 @@
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+writer = settings.DATABASE_CONNECTION_DEFAULT_NAME
+
+# Header returned with the writer position after a mutation. Clients send it back
+# to read their own writes from the replicas.
+READ_AFTER_HEADER = "Saleor-Read-After"
+
+REPLICA_STATE_QUERY = """
+    SELECT
+        CASE WHEN pg_is_in_recovery()
+            THEN pg_last_wal_replay_lsn()
+            ELSE pg_current_wal_lsn()
+        END::text,
+        CASE WHEN NOT pg_is_in_recovery()
+            OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+"""
+
+
+@dataclass
+class ReplicaState:
+    checked_at: float
+    # `None` when the replica could not be reached.
+    lsn: Optional[int] = None
+    lag: Optional[float] = None
+
+    @property
+    def is_available(self) -> bool:
+        return self.lsn is not None
+
+
+_replica_states: dict[str, ReplicaState] = {}
+
+
+def parse_lsn(value: str) -> int:
+    """Convert the PostgreSQL log sequence number, e.g. `16/B374D848`, to int."""
+    high, low = value.split("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+
+def format_lsn(lsn: int) -> str:
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+
+def get_read_after_lsn(request) -> Optional[int]:
+    """Return the writer position the request needs to read its own writes."""
+    if not settings.ENABLE_REPLICA_READ_AFTER_WRITE:
+        return None
+    value = request.headers.get(READ_AFTER_HEADER)
+    if not value:
+        return None
+    try:
+        return parse_lsn(value)
+    except ValueError:
+        return None
+
+
+def get_writer_lsn() -> str:
+    with connections[writer].cursor() as cursor:
+        cursor.execute("SELECT pg_current_wal_lsn()::text")
+        return cursor.fetchone()[0]
+
+
+def _fetch_replica_state(connection_name: str) -> ReplicaState:
+    checked_at = time.monotonic()
+    try:
+        with connections[connection_name].cursor() as cursor:
+            cursor.execute(REPLICA_STATE_QUERY)
+            lsn, lag = cursor.fetchone()
+    except DatabaseError:
+        logger.warning(
+            "Unable to check the state of the database replica %s.",
+            connection_name,
+            exc_info=True,
+        )
+        return ReplicaState(checked_at=checked_at)
+    return ReplicaState(
+        checked_at=checked_at,
+        lsn=parse_lsn(lsn),
+        lag=float(lag) if lag is not None else None,
+    )
+
+
+def get_replica_state(connection_name: str, refresh: bool = False) -> ReplicaState:
+    """Return the replication state of the replica, checked once per timeout."""
+    state = _replica_states.get(connection_name)
+    timeout = settings.DATABASE_REPLICA_STATE_TIMEOUT.total_seconds()
+    if refresh or state is None or time.monotonic() - state.checked_at >= timeout:
+        state = _fetch_replica_state(connection_name)
+        _replica_states[connection_name] = state
+    return state
+
+
+def _is_replica_usable(state: ReplicaState, min_lsn: Optional[int]) -> bool:
+    if not state.is_available:
+        return False
+    max_lag = settings.DATABASE_REPLICA_MAX_LAG
+    if max_lag is not None and (state.lag is None or state.lag > max_lag):
+        return False
+    return min_lsn is None or (state.lsn is not None and state.lsn >= min_lsn)
+
+
+def get_replica_connection_name(min_lsn: Optional[int] = None) -> str:
+    """Return the connection name of a replica to read from.
+
+    Replicas lagging more than `DATABASE_REPLICA_MAX_LAG` seconds, and replicas
+    that have not replayed the writer position `min_lsn` yet, are skipped. The
+    reads go to the writer database through the
+    `DATABASE_CONNECTION_REPLICA_FALLBACK_NAME` connection when no replica is usable.
+    """
+    replica_names = settings.DATABASE_CONNECTION_REPLICA_NAMES
+    if settings.DATABASE_REPLICA_MAX_LAG is None and min_lsn is None:
+        return random.choice(replica_names)
+
+    usable_replicas = []
+    for replica_name in replica_names:
+        state = get_replica_state(replica_name)
+        if (
+            min_lsn is not None
+            and state.is_available
+            and state.lsn is not None
+            and state.lsn < min_lsn
+        ):
+            # the cached position may be older than the write the client waits for
+            state = get_replica_state(replica_name, refresh=True)
+        if _is_replica_usable(state, min_lsn):
+            usable_replicas.append(replica_name)
+    if not usable_replicas:
+        return settings.DATABASE_CONNECTION_REPLICA_FALLBACK_NAME
+    return random.choice(usable_replicas)
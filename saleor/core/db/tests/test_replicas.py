@@ -0,0 +1,225 @@
+from unittest.mock import patch
+
+import pytest
+
+from ....app.models import App
+from ....graphql.core.context import SaleorContext, get_database_connection_name
+from ..connection import (
+    UnsafeWriterAccessError,
+    log_writer_usage_middleware,
+    restrict_writer_middleware,
+)
+from ..replicas import (
+    ReplicaState,
+    format_lsn,
+    get_replica_connection_name,
+    get_replica_state,
+    parse_lsn,
+)
+
+
+def test_parse_lsn():
+    # when
+    lsn = parse_lsn("16/B374D848")
+
+    # then
+    assert lsn == (0x16 << 32) + 0xB374D848
+    assert format_lsn(lsn) == "16/B374D848"
+
+
+def test_parse_lsn_invalid_value():
+    # when & then
+    with pytest.raises(ValueError, match="not enough values to unpack"):
+        parse_lsn("invalid")
+
+
+def test_get_replica_connection_name_without_lag_check(settings):
+    # given
+    settings.DATABASE_REPLICA_MAX_LAG = None
+
+    # when
+    with patch("saleor.core.db.replicas.get_replica_state") as get_state_mock:
+        connection_name = get_replica_connection_name()
+
+    # then
+    assert connection_name == settings.DATABASE_CONNECTION_REPLICA_NAME
+    get_state_mock.assert_not_called()
+
+
+def test_get_replica_connection_name_skips_lagging_replicas(settings):
+    # given
+    settings.DATABASE_CONNECTION_REPLICA_NAMES = ["replica", "replica_1"]
+    settings.DATABASE_REPLICA_MAX_LAG = 5
+    states = {
+        "replica": ReplicaState(checked_at=0, lsn=100, lag=10),
+        "replica_1": ReplicaState(checked_at=0, lsn=100, lag=1),
+    }
+
+    # when
+    with patch(
+        "saleor.core.db.replicas.get_replica_state",
+        side_effect=lambda name, refresh=False: states[name],
+    ):
+        connection_name = get_replica_connection_name()
+
+    # then
+    assert connection_name == "replica_1"
+
+
+def test_get_replica_connection_name_falls_back_to_writer(settings):
+    # given
+    settings.DATABASE_CONNECTION_REPLICA_NAMES = ["replica", "replica_1"]
+    settings.DATABASE_REPLICA_MAX_LAG = 5
+    states = {
+        "replica": ReplicaState(checked_at=0, lsn=100, lag=10),
+        # unreachable replica
+        "replica_1": ReplicaState(checked_at=0),
+    }
+
+    # when
+    with patch(
+        "saleor.core.db.replicas.get_replica_state",
+        side_effect=lambda name, refresh=False: states[name],
+    ):
+        connection_name = get_replica_connection_name()
+
+    # then
+    assert connection_name == settings.DATABASE_CONNECTION_REPLICA_FALLBACK_NAME
+
+
+def test_get_replica_connection_name_waits_for_read_after_lsn(settings):
+    # given
+    settings.DATABASE_CONNECTION_REPLICA_NAMES = ["replica", "replica_1"]
+    settings.DATABASE_REPLICA_MAX_LAG = None
+    cached_states = {
+        "replica": ReplicaState(checked_at=0, lsn=100, lag=0),
+        "replica_1": ReplicaState(checked_at=0, lsn=100, lag=0),
+    }
+    refreshed_states = {
+        "replica": ReplicaState(checked_at=1, lsn=150, lag=0),
+        "replica_1": ReplicaState(checked_at=1, lsn=250, lag=0),
+    }
+
+    def get_state(name, refresh=False):
+        return refreshed_states[name] if refresh else cached_states[name]
+
+    # when
+    with patch("saleor.core.db.replicas.get_replica_state", side_effect=get_state):
+        connection_name = get_replica_connection_name(min_lsn=200)
+
+    # then
+    assert connection_name == "replica_1"
+
+
+@patch("saleor.core.db.replicas._fetch_replica_state")
+def test_get_replica_state_is_cached(fetch_state_mock, settings):
+    # given
+    fetch_state_mock.return_value = ReplicaState(checked_at=1e12, lsn=100, lag=0)
+
+    # when
+    get_replica_state("replica_cached")
+    state = get_replica_state("replica_cached")
+
+    # then
+    assert state.lsn == 100
+    fetch_state_mock.assert_called_once_with("replica_cached")
+
+
+def test_get_database_connection_name_keeps_replica_for_request(settings, rf):
+    # given
+    context = rf.request()
+    context.allow_replica = True
+    context.read_after_lsn = None
+
+    # when
+    with patch(
+        "saleor.graphql.core.context.get_replica_connection_name",
+        side_effect=["replica_1", "replica"],
+    ):
+        first_name = get_database_connection_name(context)
+        second_name = get_database_connection_name(context)
+
+    # then
+    assert first_name == second_name == "replica_1"
+
+
+def test_get_database_connection_name_for_mutation(settings):
+    # given
+    context = SaleorContext()
+    context.allow_replica = False
+
+    # when
+    connection_name = get_database_connection_name(context)
+
+    # then
+    assert connection_name == settings.DATABASE_CONNECTION_DEFAULT_NAME
+
+
+def _count_apps_with_request_connection(request):
+    connection_name = get_database_connection_name(request)
+    return connection_name, App.objects.using(connection_name).count()
+
+
+def _lagging_replica_state(name, refresh=False):
+    return ReplicaState(checked_at=0, lsn=100, lag=10)
+
+
+@patch("saleor.core.db.replicas.get_replica_state", side_effect=_lagging_replica_state)
+def test_restrict_writer_middleware_allows_replica_fallback(
+    get_state_mock, settings, rf, app
+):
+    # given
+    settings.DATABASE_CONNECTION_REPLICA_NAMES = ["replica"]
+    settings.DATABASE_REPLICA_MAX_LAG = 5
+    request = rf.request()
+    request.allow_replica = True
+    request.read_after_lsn = None
+    middleware = restrict_writer_middleware(_count_apps_with_request_connection)
+
+    # when
+    connection_name, apps_count = middleware(request)
+
+    # then
+    assert connection_name == settings.DATABASE_CONNECTION_REPLICA_FALLBACK_NAME
+    assert apps_count == 1
+
+
+@patch("saleor.core.db.replicas.get_replica_state", side_effect=_lagging_replica_state)
+def test_restrict_writer_middleware_restricts_writes_after_replica_fallback(
+    get_state_mock, settings, rf, app
+):
+    # given
+    settings.DATABASE_CONNECTION_REPLICA_NAMES = ["replica"]
+    settings.DATABASE_REPLICA_MAX_LAG = 5
+    request = rf.request()
+    request.allow_replica = True
+    request.read_after_lsn = None
+
+    def read_and_write_apps(request):
+        _count_apps_with_request_connection(request)
+        App.objects.filter(pk=app.pk).update(name="New name")
+
+    # when & then
+    with pytest.raises(UnsafeWriterAccessError):
+        restrict_writer_middleware(read_and_write_apps)(request)
+
+
+@patch("saleor.core.db.replicas.get_replica_state", side_effect=_lagging_replica_state)
+def test_log_writer_usage_middleware_replica_fallback_not_logged(
+    get_state_mock, settings, rf, app, caplog
+):
+    # given
+    settings.DATABASE_CONNECTION_REPLICA_NAMES = ["replica"]
+    settings.DATABASE_REPLICA_MAX_LAG = 5
+    request = rf.request()
+    request.allow_replica = True
+    request.read_after_lsn = None
+    middleware = log_writer_usage_middleware(_count_apps_with_request_connection)
+
+    # when
+    connection_name, apps_count = middleware(request)
+
+    # then
+    assert connection_name == settings.DATABASE_CONNECTION_REPLICA_FALLBACK_NAME
+    assert apps_count == 1
+    assert "Unsafe access to the writer DB" not in caplog.text
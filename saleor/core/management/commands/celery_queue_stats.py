@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from ....celeryconf import app
+from ... import EventDeliveryStatus
+from ...models import EventDelivery
+
+# queues which are sharded per app with `WEBHOOK_CELERY_QUEUE_SHARDS`
+WEBHOOK_QUEUE_SETTINGS = [
+    "WEBHOOK_CELERY_QUEUE_NAME",
+    "WEBHOOK_SQS_CELERY_QUEUE_NAME",
+    "WEBHOOK_PUBSUB_CELERY_QUEUE_NAME",
+    "CHECKOUT_WEBHOOK_EVENTS_CELERY_QUEUE_NAME",
+    "ORDER_WEBHOOK_EVENTS_CELERY_QUEUE_NAME",
+]
+
+
+def get_queue_names() -> list[str]:
+    queue_names = {app.conf.task_default_queue}
+    for setting_name in dir(settings):
+        if setting_name.endswith("QUEUE_NAME"):
+            queue_name = getattr(settings, setting_name)
+            if queue_name:
+                queue_names.add(queue_name)
+    if shards := settings.WEBHOOK_CELERY_QUEUE_SHARDS:
+        webhook_queues = {
+            getattr(settings, setting_name) or app.conf.task_default_queue
+            for setting_name in WEBHOOK_QUEUE_SETTINGS
+        }
+        for queue_name in webhook_queues:
+            queue_names.update(f"{queue_name}-{shard}" for shard in range(shards))
+    return sorted(queue_names)
+
+
+class Command(BaseCommand):
+    help = (
+        "Print the number of messages and consumers of the Celery queues, "
+        "and the pending webhook deliveries per app."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queue",
+            action="append",
+            dest="queues",
+            help="Name of the queue to check. Defaults to all configured queues.",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("Queue depths:")
+        with app.connection_for_read() as connection:
+            for queue_name in options["queues"] or get_queue_names():
+                # a failed declaration closes the channel, so use one per queue
+                channel = connection.channel()
+                try:
+                    _, message_count, consumer_count = channel.queue_declare(
+                        queue=queue_name, passive=True
+                    )
+                except connection.channel_errors:
+                    self.stdout.write(f"  {queue_name}: not declared")
+                    continue
+                finally:
+                    channel.close()
+                self.stdout.write(
+                    f"  {queue_name}: {message_count} messages, "
+                    f"{consumer_count} consumers"
+                )
+
+        self.stdout.write("Pending webhook deliveries per app:")
+        now = timezone.now()
+        pending_deliveries = (
+            EventDelivery.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+            .filter(status=EventDeliveryStatus.PENDING)
+            .values("webhook__app_id", "webhook__app__name")
+            .annotate(count=Count("id"), oldest=Min("created_at"))
+            .order_by("-count")
+        )
+        for row in pending_deliveries:
+            self.stdout.write(
+                f"  {row['webhook__app__name']} (ID: {row['webhook__app_id']}): "
+                f"{row['count']} deliveries, "
+                f"oldest {(now - row['oldest']).total_seconds():.0f}s ago"
+            )
@@ -14,6 +14,7 @@ from ...utils.random_data import (
     create_checkout_with_custom_prices,
     create_checkout_with_preorders,
     create_checkout_with_same_variant_in_multiple_lines,
+    create_generated_catalogue,
     create_gift_cards,
     create_menus,
     create_order_promotions,
@@ -53,6 +54,39 @@ class Command(BaseCommand):
             default=False,
             help="Don't create product images",
         )
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=20,
+            help="Number of customers to create.",
+        )
+        parser.add_argument(
+            "--orders",
+            type=int,
+            default=20,
+            help="Number of orders to create.",
+        )
+        parser.add_argument(
+            "--generated-products",
+            type=int,
+            default=0,
+            help=(
+                "Number of generated products to create in addition to the sample "
+                "catalogue. Use it to populate the database with a large catalogue."
+            ),
+        )
+        parser.add_argument(
+            "--variants-per-product",
+            type=int,
+            default=1,
+            help="Number of variants of each generated product.",
+        )
+        parser.add_argument(
+            "--attributes-per-product",
+            type=int,
+            default=0,
+            help="Number of attributes assigned to each generated product.",
+        )
         parser.add_argument(
             "--skipsequencereset",
             action="store_true",
@@ -101,15 +135,22 @@ class Command(BaseCommand):
             self.stdout.write(msg)
         create_products_by_schema(self.placeholders_dir, create_images)
         self.stdout.write("Created products")
+        if options["generated_products"]:
+            for msg in create_generated_catalogue(
+                options["generated_products"],
+                variants_per_product=options["variants_per_product"],
+                attributes_per_product=options["attributes_per_product"],
+            ):
+                self.stdout.write(msg)
         for msg in create_catalogue_promotions(2):
             self.stdout.write(msg)
         for msg in create_order_promotions(2):
             self.stdout.write(msg)
         for msg in create_vouchers():
             self.stdout.write(msg)
-        for msg in create_users(user_password, 20):
+        for msg in create_users(user_password, options["users"]):
             self.stdout.write(msg)
-        for msg in create_orders(20):
+        for msg in create_orders(options["orders"]):
             self.stdout.write(msg)
         for msg in create_gift_cards():
             self.stdout.write(msg)
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.15 on 2024-09-02 10:12
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("core", "0011_eventpayload_payload_file"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="eventpayload",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="eventpayload_created_brin_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventdelivery",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="eventdelivery_created_brin_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="eventdeliveryattempt",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="eventattempt_created_brin_idx"
+            ),
+        ),
+    ]
@@ -3,7 +3,7 @@ from collections.abc import Iterable
 from typing import Any, TypeVar
 
 import pytz
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.core.files.base import ContentFile
 from django.db import models, transaction
 from django.db.models import F, JSONField, Max, Q
@@ -175,6 +175,13 @@ class EventPayload(models.Model):
 
     objects = EventPayloadManager()
 
+    class Meta:
+        indexes = [
+            # Rows are appended in `created_at` order, so a BRIN index lets the
+            # retention task find expired rows without scanning the whole table.
+            BrinIndex(fields=["created_at"], name="eventpayload_created_brin_idx"),
+        ]
+
     def get_payload(self):
         if self.payload_file:
             with self.payload_file.open("rb") as f:
@@ -205,6 +212,9 @@ class EventDelivery(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            BrinIndex(fields=["created_at"], name="eventdelivery_created_brin_idx"),
+        ]
 
 
 class EventDeliveryAttempt(models.Model):
@@ -226,3 +236,6 @@ class EventDeliveryAttempt(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            BrinIndex(fields=["created_at"], name="eventattempt_created_brin_idx"),
+        ]
@@ -3,12 +3,12 @@ import logging
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.storage import default_storage
-from django.db.models import Exists, OuterRef
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
 from ..celeryconf import app
 from . import private_storage
-from .models import EventDelivery, EventPayload
+from .models import EventDelivery, EventDeliveryAttempt, EventPayload
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
@@ -31,8 +31,12 @@ def delete_event_payloads_task(expiration_date=None):
     )
     delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
     valid_deliveries = EventDelivery.objects.filter(created_at__gt=delete_period)
+    # Payloads are always created before their deliveries, so only payloads older
+    # than the delete period are considered. This lets the query use the BRIN index
+    # on `created_at` instead of scanning the whole table on each batch.
     payloads_to_delete = EventPayload.objects.filter(
-        ~Exists(valid_deliveries.filter(payload_id=OuterRef("id")))
+        Q(created_at__lte=delete_period),
+        ~Exists(valid_deliveries.filter(payload_id=OuterRef("id"))),
     ).order_by("-pk")
     ids = list(payloads_to_delete.values_list("pk", flat=True)[:BATCH_SIZE])
     qs = EventPayload.objects.filter(pk__in=ids)
@@ -43,13 +47,30 @@ def delete_event_payloads_task(expiration_date=None):
                 for event_payload in qs.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
                 if event_payload.payload_file
             ]
-            qs.delete()
+            _raw_delete_payloads(qs)
             delete_files_from_private_storage_task.delay(files_to_delete)
             delete_event_payloads_task.delay(expiration_date)
         else:
             task_logger.error("Task invocation time limit reached, aborting task")
 
 
+def _raw_delete_payloads(payloads):
+    """Delete payloads with their deliveries and attempts using set-based queries.
+
+    Deleting with the ORM collector loads all related deliveries and attempts into
+    memory, so the rows are removed directly, starting from the most nested ones.
+    """
+    deliveries = EventDelivery.objects.filter(
+        Exists(payloads.filter(id=OuterRef("payload_id")))
+    )
+    attempts = EventDeliveryAttempt.objects.filter(
+        Exists(deliveries.filter(id=OuterRef("delivery_id")))
+    )
+    attempts._raw_delete(attempts.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+    deliveries._raw_delete(deliveries.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+    payloads._raw_delete(payloads.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+
+
 @app.task
 def delete_files_from_storage_task(paths):
     for path in paths:
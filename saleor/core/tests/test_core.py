@@ -9,7 +9,7 @@ from django.test import RequestFactory, override_settings
 
 from ...account.models import Address, User
 from ...account.utils import create_superuser
-from ...attribute.models import AttributeValue
+from ...attribute.models import AssignedProductAttributeValue, AttributeValue
 from ...channel.models import Channel
 from ...discount.models import (
     Promotion,
@@ -22,8 +22,16 @@ from ...giftcard.models import GiftCard, GiftCardEvent
 from ...order.models import Order
 from ...payment.models import TransactionItem
 from ...product import ProductTypeKind
-from ...product.models import ProductType
+from ...product.models import (
+    Product,
+    ProductChannelListing,
+    ProductType,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
 from ...shipping.models import ShippingZone
+from ...warehouse.models import Stock
+from ..management.commands.celery_queue_stats import get_queue_names
 from ..storages import S3MediaStorage
 from ..utils import (
     build_absolute_uri,
@@ -148,6 +156,38 @@ def test_create_fake_order(db, monkeypatch, image, media_root, warehouse):
     assert Order.objects.all().count() == how_many_orders
 
 
+def test_create_generated_catalogue(db, warehouse):
+    # given
+    for _ in random_data.create_channels():
+        pass
+    channel_count = Channel.objects.count()
+
+    # when
+    for _ in random_data.create_generated_catalogue(
+        5, variants_per_product=3, attributes_per_product=2, batch_size=2
+    ):
+        pass
+
+    # then
+    products = Product.objects.filter(slug__contains="-product-")
+    assert products.count() == 5
+    assert ProductVariant.objects.filter(product__in=products).count() == 15
+    assert (
+        ProductChannelListing.objects.filter(product__in=products).count()
+        == 5 * channel_count
+    )
+    assert (
+        ProductVariantChannelListing.objects.filter(
+            variant__product__in=products
+        ).count()
+        == 15 * channel_count
+    )
+    assert Stock.objects.filter(product_variant__product__in=products).count() == 15
+    assert (
+        AssignedProductAttributeValue.objects.filter(product__in=products).count() == 10
+    )
+
+
 def test_create_catalogue_promotions(db):
     how_many = 5
     channel_count = 0
@@ -462,3 +502,21 @@ def test_prepare_unique_attribute_value_slug_non_existing_slug(color_attribute):
     result = prepare_unique_attribute_value_slug(color_attribute, non_existing_slug)
 
     assert result == non_existing_slug
+
+
+def test_get_queue_names_lists_shards_of_all_webhook_queues(settings):
+    # given
+    settings.WEBHOOK_CELERY_QUEUE_NAME = "webhooks"
+    settings.WEBHOOK_SQS_CELERY_QUEUE_NAME = "webhooks"
+    settings.WEBHOOK_PUBSUB_CELERY_QUEUE_NAME = "webhooks"
+    settings.CHECKOUT_WEBHOOK_EVENTS_CELERY_QUEUE_NAME = "checkout-webhooks"
+    settings.ORDER_WEBHOOK_EVENTS_CELERY_QUEUE_NAME = "order-webhooks"
+    settings.WEBHOOK_CELERY_QUEUE_SHARDS = 2
+
+    # when
+    queue_names = get_queue_names()
+
+    # then
+    for queue_name in ["webhooks", "checkout-webhooks", "order-webhooks"]:
+        assert f"{queue_name}-0" in queue_names
+        assert f"{queue_name}-1" in queue_names
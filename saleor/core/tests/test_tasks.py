@@ -65,6 +65,24 @@ def test_delete_event_payloads_task(webhook, settings):
     assert not private_storage.exists(payload_files[before_delete_period])
 
 
+def test_delete_event_payloads_task_keeps_payloads_within_delete_period(settings):
+    # given
+    delete_period = settings.EVENT_PAYLOAD_DELETE_PERIOD
+    start_time = timezone.now()
+    with freeze_time(start_time - delete_period - timedelta(seconds=1)):
+        old_payload = EventPayload.objects.create(payload="dummy")
+    with freeze_time(start_time - delete_period + timedelta(seconds=1)):
+        recent_payload = EventPayload.objects.create(payload="dummy")
+
+    # when
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert not EventPayload.objects.filter(pk=old_payload.pk).exists()
+    assert EventPayload.objects.filter(pk=recent_payload.pk).exists()
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
@@ -1,9 +1,13 @@
 import collections
+from typing import Any, Callable, Optional
 
 
 class CacheDict(collections.OrderedDict):
-    def __init__(self, capacity: int):
+    def __init__(
+        self, capacity: int, on_evict: Optional[Callable[[Any, Any], None]] = None
+    ):
         self.capacity = capacity
+        self.on_evict = on_evict
         super().__init__()
 
     def __getitem__(self, key):
@@ -17,4 +21,7 @@ class CacheDict(collections.OrderedDict):
 
         while len(self) > self.capacity:
             surplus = next(iter(self))
+            surplus_value = super().__getitem__(surplus)
             super().__delitem__(surplus)
+            if self.on_evict:
+                self.on_evict(surplus, surplus_value)
@@ -1,4 +1,5 @@
 import secrets
+from collections.abc import Iterable
 
 from django.core.exceptions import ValidationError
 
@@ -6,6 +7,8 @@ from ...discount.models import VoucherCode
 from ...giftcard.error_codes import GiftCardErrorCode
 from ...giftcard.models import GiftCard
 
+PROMO_CODE_BATCH_SIZE = 5000
+
 
 class InvalidPromoCode(ValidationError):
     def __init__(self, message=None, **kwargs):
@@ -26,6 +29,20 @@ def generate_promo_code():
     return code
 
 
+def generate_promo_codes(count: int) -> list[str]:
+    """Generate unique promo codes that can be used as voucher or gift card codes.
+
+    Candidates are checked for collisions in batches, with one query per model
+    for each batch instead of two queries for every code.
+    """
+    codes: set[str] = set()
+    while len(codes) < count:
+        batch_size = min(count - len(codes), PROMO_CODE_BATCH_SIZE)
+        candidates = {generate_random_code() for _ in range(batch_size)} - codes
+        codes.update(candidates - get_unavailable_promo_codes(candidates))
+    return list(codes)
+
+
 def generate_random_code():
     # generate code in format "ABCD-EFGH-IJKL"
     code = secrets.token_hex(nbytes=6).upper()
@@ -36,6 +53,21 @@ def is_available_promo_code(code):
     return not (promo_code_is_gift_card(code) or promo_code_is_voucher(code))
 
 
+def get_unavailable_promo_codes(codes: Iterable[str]) -> set[str]:
+    """Return the codes that are already used by vouchers or gift cards."""
+    codes = list(codes)
+    unavailable_codes: set[str] = set()
+    for i in range(0, len(codes), PROMO_CODE_BATCH_SIZE):
+        batch = codes[i : i + PROMO_CODE_BATCH_SIZE]  # noqa: E203
+        unavailable_codes.update(
+            VoucherCode.objects.filter(code__in=batch).values_list("code", flat=True)
+        )
+        unavailable_codes.update(
+            GiftCard.objects.filter(code__in=batch).values_list("code", flat=True)
+        )
+    return unavailable_codes
+
+
 def promo_code_is_voucher(code):
     return VoucherCode.objects.filter(code=code).exists()
 
@@ -29,6 +29,7 @@ from ...account.search import (
     generate_user_fields_search_document_value,
 )
 from ...account.utils import store_user_address
+from ...attribute import AttributeInputType, AttributeType
 from ...attribute.models import (
     AssignedProductAttributeValue,
     AssignedVariantAttribute,
@@ -73,6 +74,7 @@ from ...permission.enums import (
 )
 from ...permission.models import Permission
 from ...plugins.manager import get_plugins_manager
+from ...product import ProductTypeKind
 from ...product.models import (
     Category,
     Collection,
@@ -458,6 +460,152 @@ def create_products_by_schema(placeholder_dir, create_images):
     update_products_search_vector(all_products_qs.values_list("id", flat=True))
 
 
+def create_generated_catalogue(
+    how_many, variants_per_product=1, attributes_per_product=0, batch_size=500
+):
+    """Create a catalogue of generated products with bulk inserts.
+
+    Used to fill the database with thousands of products, for example to measure
+    how queries scale with the catalogue size. Products are listed in all channels
+    and their variants are stocked in all warehouses.
+    """
+    prefix = uuid.uuid4().hex[:8]
+    channels = list(Channel.objects.all())
+    warehouses = list(Warehouse.objects.all())
+    product_type = ProductType.objects.create(
+        name=f"Generated {prefix}",
+        slug=f"generated-{prefix}",
+        kind=ProductTypeKind.NORMAL,
+        has_variants=variants_per_product > 1,
+    )
+    category = Category.objects.create(
+        name=f"Generated {prefix}", slug=f"generated-{prefix}"
+    )
+
+    attributes = Attribute.objects.bulk_create(
+        [
+            Attribute(
+                name=f"Generated {prefix} {index}",
+                slug=f"generated-{prefix}-{index}",
+                type=AttributeType.PRODUCT_TYPE,
+                input_type=AttributeInputType.DROPDOWN,
+            )
+            for index in range(attributes_per_product)
+        ]
+    )
+    AttributeProduct.objects.bulk_create(
+        [
+            AttributeProduct(
+                attribute=attribute, product_type=product_type, sort_order=index
+            )
+            for index, attribute in enumerate(attributes)
+        ]
+    )
+    attribute_values = [
+        AttributeValue.objects.bulk_create(
+            [
+                AttributeValue(
+                    attribute=attribute,
+                    name=f"Value {index}",
+                    slug=f"value-{index}",
+                    sort_order=index,
+                )
+                for index in range(10)
+            ]
+        )
+        for attribute in attributes
+    ]
+
+    created = 0
+    while created < how_many:
+        batch_range = range(created, min(created + batch_size, how_many))
+        products = Product.objects.bulk_create(
+            [
+                Product(
+                    name=f"Generated product {index}",
+                    slug=f"generated-{prefix}-product-{index}",
+                    product_type=product_type,
+                    category=category,
+                    search_index_dirty=True,
+                )
+                for index in batch_range
+            ]
+        )
+        AssignedProductAttributeValue.objects.bulk_create(
+            [
+                AssignedProductAttributeValue(
+                    product=product, value=random.choice(values)
+                )
+                for product in products
+                for values in attribute_values
+            ]
+        )
+        variants = ProductVariant.objects.bulk_create(
+            [
+                ProductVariant(
+                    product=product,
+                    sku=f"{product.slug}-{index}",
+                    name=f"Variant {index}",
+                    sort_order=index,
+                )
+                for product in products
+                for index in range(variants_per_product)
+            ]
+        )
+        prices = {
+            variant.pk: fake.pydecimal(2, 2, positive=True) for variant in variants
+        }
+        ProductVariantChannelListing.objects.bulk_create(
+            [
+                ProductVariantChannelListing(
+                    variant=variant,
+                    channel=channel,
+                    currency=channel.currency_code,
+                    price_amount=prices[variant.pk],
+                    discounted_price_amount=prices[variant.pk],
+                )
+                for variant in variants
+                for channel in channels
+            ]
+        )
+        min_prices: dict[int, Decimal] = {}
+        for variant in variants:
+            price = prices[variant.pk]
+            min_prices[variant.product_id] = min(
+                min_prices.get(variant.product_id, price), price
+            )
+        now = timezone.now()
+        ProductChannelListing.objects.bulk_create(
+            [
+                ProductChannelListing(
+                    product=product,
+                    channel=channel,
+                    currency=channel.currency_code,
+                    is_published=True,
+                    published_at=now,
+                    visible_in_listings=True,
+                    available_for_purchase_at=now,
+                    discounted_price_amount=min_prices[product.pk],
+                )
+                for product in products
+                for channel in channels
+            ]
+        )
+        Stock.objects.bulk_create(
+            [
+                Stock(
+                    product_variant=variant,
+                    warehouse=warehouse,
+                    quantity=random.randint(100, 500),
+                )
+                for variant in variants
+                for warehouse in warehouses
+            ]
+        )
+        created += len(products)
+        yield f"Generated products: {created}/{how_many}"
+
+
 class SaleorProvider(BaseProvider):
     def money(self):
         return Money(fake.pydecimal(2, 2, positive=True), DEFAULT_CURRENCY)
@@ -42,3 +42,16 @@ def test_eviction_order():
     assert 1 in cache
     assert 2 not in cache
     assert 3 in cache
+
+
+def test_on_evict():
+    # given
+    evicted = []
+    cache = CacheDict(1, on_evict=lambda key, value: evicted.append((key, value)))
+    cache[1] = "a"
+
+    # when
+    cache[2] = "b"
+
+    # then
+    assert evicted == [(1, "a")]
@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+from ..promo_code import generate_promo_codes, get_unavailable_promo_codes
+
+
+def test_get_unavailable_promo_codes(voucher, gift_card):
+    # given
+    codes = ["mirumee", "never_expiry", "free-code"]
+
+    # when
+    unavailable_codes = get_unavailable_promo_codes(codes)
+
+    # then
+    assert unavailable_codes == {"mirumee", "never_expiry"}
+
+
+@patch("saleor.core.utils.promo_code.generate_random_code")
+def test_generate_promo_codes_skips_used_codes(
+    generate_random_code_mock, voucher, gift_card, django_assert_num_queries
+):
+    # given
+    generate_random_code_mock.side_effect = [
+        "mirumee",
+        "never_expiry",
+        "code-1",
+        "code-2",
+        "code-3",
+    ]
+
+    # when
+    with django_assert_num_queries(4):
+        codes = generate_promo_codes(3)
+
+    # then
+    assert sorted(codes) == ["code-1", "code-2", "code-3"]
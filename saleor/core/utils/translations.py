@@ -1,7 +1,11 @@
+import uuid
 from typing import Any, Union
 
 from django.conf import settings
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+
+TRANSLATIONS_CACHE_VERSION_KEY = "translations_cache_version_{}"
 
 
 class TranslationWrapper:
@@ -51,3 +55,24 @@ def get_translation(instance, language_code=None) -> TranslationWrapper:
     if not language_code:
         language_code = settings.LANGUAGE_CODE
     return TranslationWrapper(instance, language_code)
+
+
+def get_translations_cache_version(translation_model: type[Translation]) -> str:
+    key = TRANSLATIONS_CACHE_VERSION_KEY.format(translation_model._meta.label_lower)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def invalidate_translations_cache(translation_model: type[Translation]):
+    """Make the cached translations of the model outdated once the changes commit."""
+    key = TRANSLATIONS_CACHE_VERSION_KEY.format(translation_model._meta.label_lower)
+    transaction.on_commit(lambda: cache.set(key, uuid.uuid4().hex, None))
+
+
+def invalidate_translations_cache_on_save(sender, **kwargs):
+    if settings.TRANSLATIONS_CACHE_TIMEOUT:
+        invalidate_translations_cache(sender)
@@ -161,6 +161,7 @@ class CheckoutLinesAdd(BaseMutation):
                 reservation_length=get_reservation_length(
                     site=site, user=info.context.user
                 ),
+                existing_lines=[line_info.line for line_info in lines],
             )
 
         lines, _ = fetch_checkout_lines(checkout)
@@ -374,6 +374,11 @@ def group_lines_input_on_add(
     """
     grouped_checkout_lines_data: list[CheckoutLineData] = []
     checkout_lines_data_map: dict[str, CheckoutLineData] = defaultdict(CheckoutLineData)
+    # index the existing lines once, so the lookups don't depend on the lines count
+    lines_info_by_variant_id = group_lines_info_by_variant_id(existing_lines_info)
+    lines_info_by_id = {
+        str(line_info.line.pk): line_info for line_info in existing_lines_info or []
+    }
 
     for line in lines:
         variant_id = cast(str, line.get("variant_id"))
@@ -392,7 +397,7 @@ def group_lines_input_on_add(
 
             try:
                 line_db_id = find_line_id_when_variant_parameter_used(
-                    variant_db_id, existing_lines_info
+                    variant_db_id, lines_info_by_variant_id
                 )
 
                 if not line_db_id:
@@ -403,7 +408,7 @@ def group_lines_input_on_add(
                     line_data = checkout_lines_data_map[line_db_id]
                     line_data.line_id = line_db_id
                     line_data.variant_id = find_variant_id_when_line_parameter_used(
-                        line_db_id, existing_lines_info
+                        line_db_id, lines_info_by_id
                     )
 
                     if line_data.metadata_list and metadata_list:
@@ -441,6 +446,11 @@ def group_lines_input_data_on_update(
     """
     grouped_checkout_lines_data: list[CheckoutLineData] = []
     checkout_lines_data_map: dict[str, CheckoutLineData] = defaultdict(CheckoutLineData)
+    # index the existing lines once, so the lookups don't depend on the lines count
+    lines_info_by_variant_id = group_lines_info_by_variant_id(existing_lines_info)
+    lines_info_by_id = {
+        str(line_info.line.pk): line_info for line_info in existing_lines_info or []
+    }
 
     for line in lines:
         variant_id = cast(str, line.get("variant_id"))
@@ -453,7 +463,7 @@ def group_lines_input_data_on_update(
         if variant_id:
             _, variant_db_id = graphene.Node.from_global_id(variant_id)
             line_db_id = find_line_id_when_variant_parameter_used(
-                variant_db_id, existing_lines_info
+                variant_db_id, lines_info_by_variant_id
             )
 
         if not line_db_id:
@@ -463,7 +473,7 @@ def group_lines_input_data_on_update(
             line_data = checkout_lines_data_map[line_db_id]
             line_data.line_id = line_db_id
             line_data.variant_id = find_variant_id_when_line_parameter_used(
-                line_db_id, existing_lines_info
+                line_db_id, lines_info_by_id
             )
 
         if (quantity := line.get("quantity")) is not None:
@@ -490,17 +500,23 @@ def check_permissions_for_custom_prices(app, lines):
         raise PermissionDenied(permissions=[CheckoutPermissions.HANDLE_CHECKOUTS])
 
 
+def group_lines_info_by_variant_id(
+    lines_info: Optional[Iterable[CheckoutLineInfo]],
+) -> dict[int, list[CheckoutLineInfo]]:
+    lines_info_by_variant_id: dict[int, list[CheckoutLineInfo]] = defaultdict(list)
+    for line_info in lines_info or []:
+        lines_info_by_variant_id[line_info.variant.pk].append(line_info)
+    return lines_info_by_variant_id
+
+
 def find_line_id_when_variant_parameter_used(
-    variant_db_id: str, lines_info: list[CheckoutLineInfo]
+    variant_db_id: str, lines_info_by_variant_id: dict[int, list[CheckoutLineInfo]]
 ):
     """Return line id when variantId parameter was used.
 
     If variant exists in multiple lines error will be returned.
     """
-    if not lines_info:
-        return
-
-    line_info = list(filter(lambda x: (x.variant.pk == int(variant_db_id)), lines_info))
+    line_info = lines_info_by_variant_id.get(int(variant_db_id))
 
     if not line_info:
         return
@@ -526,14 +542,13 @@ def find_line_id_when_variant_parameter_used(
 
 
 def find_variant_id_when_line_parameter_used(
-    line_db_id: str, lines_info: list[CheckoutLineInfo]
+    line_db_id: str, lines_info_by_id: dict[str, CheckoutLineInfo]
 ):
     """Return variant id when lineId parameter was used."""
-    if not lines_info:
+    if not lines_info_by_id:
         return
 
-    line_info = list(filter(lambda x: (str(x.line.pk) == line_db_id), lines_info))
-    return str(line_info[0].line.variant_id)
+    return str(lines_info_by_id[line_db_id].line.variant_id)
 
 
 def apply_gift_reward_if_applicable_on_checkout_creation(
@@ -181,3 +181,30 @@ def test_group_on_update_when_one_line_and_mixed_parameters_provided(
     assert expected == group_lines_input_data_on_update(
         lines_data, existing_checkout_lines
     )
+
+
+def test_group_on_add_when_variant_exists_in_multiple_lines(checkout_with_item):
+    # given
+    line = checkout_with_item.lines.first()
+    checkout_with_item.lines.create(
+        variant=line.variant, quantity=1, currency=line.currency
+    )
+    variant_id = graphene.Node.to_global_id("ProductVariant", line.variant_id)
+    existing_checkout_lines, _ = fetch_checkout_lines(checkout_with_item)
+
+    lines_data = [{"quantity": 2, "variant_id": variant_id}]
+
+    # when
+    grouped_lines_data = group_lines_input_on_add(lines_data, existing_checkout_lines)
+
+    # then
+    assert grouped_lines_data == [
+        CheckoutLineData(
+            variant_id=str(line.variant_id),
+            line_id=None,
+            quantity=2,
+            quantity_to_update=True,
+            custom_price=None,
+            custom_price_to_update=False,
+        )
+    ]
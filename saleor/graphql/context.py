@@ -8,6 +8,7 @@ from django.utils.functional import SimpleLazyObject
 from ..account.models import User
 from ..app.models import App
 from ..core.auth import get_token_from_request
+from ..core.db.replicas import get_read_after_lsn
 from ..core.jwt import jwt_decode_with_exception_handler
 from .api import API_PATH
 from .app.dataloaders import get_app_promise
@@ -20,6 +21,8 @@ def get_context_value(request: HttpRequest) -> SaleorContext:
         request.dataloaders = {}
     request.allow_replica = getattr(request, "allow_replica", True)
     request.request_time = getattr(request, "request_time", timezone.now())
+    if not hasattr(request, "read_after_lsn"):
+        request.read_after_lsn = get_read_after_lsn(request)
     set_app_on_context(request)
     set_auth_on_context(request)
     set_decoded_auth_token(request)
@@ -11,8 +11,9 @@ from typing import (
 
 import graphene
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import BooleanField, F, Func, Q, QuerySet, Value
 from django.db.models import Model as DjangoModel
-from django.db.models import Q, QuerySet
 from graphene.relay import Connection
 from graphql import GraphQLError
 from graphql.language.ast import FragmentSpread
@@ -23,6 +24,7 @@ from graphql_relay.utils import base64, unbase64
 from ...channel.exceptions import ChannelNotDefined, NoDefaultChannel
 from ..channel import ChannelContext, ChannelQsContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
+from ..core.descriptions import ADDED_IN_320
 from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
@@ -88,6 +90,74 @@ def _prepare_filter_by_rank_expression(
     )
 
 
+class RowValueComparison(Func):
+    """Compare two row values, e.g. `(created_at, id) > ('2024-01-01', 10)`.
+
+    PostgreSQL can answer such a predicate with a single range scan on a compound
+    index, unlike the equivalent `OR`-expanded filter.
+    """
+
+    template = "%(expressions)s"
+    output_field = BooleanField()
+    conditional = True
+
+    def __init__(self, lhs, rhs, operator, **extra):
+        self.arg_joiner = f" {operator} "
+        super().__init__(
+            Func(*lhs, function="ROW"), Func(*rhs, function="ROW"), **extra
+        )
+
+
+def _get_non_nullable_fields(model, sorting_fields: list[str]) -> Optional[list]:
+    """Return model fields used for sorting if all of them are non-nullable columns.
+
+    Fields from related models or annotations are not supported and result
+    in `None`.
+    """
+    fields = []
+    for field_name in sorting_fields:
+        try:
+            if field_name == "pk":
+                field = model._meta.pk
+            else:
+                field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.null or field.is_relation:
+            return None
+        fields.append(field)
+    return fields
+
+
+def _prepare_row_value_filter(
+    qs: QuerySet,
+    cursor: list[str],
+    sorting_fields: list[str],
+    sorting_direction: str,
+) -> Optional[RowValueComparison]:
+    """Create a keyset filter comparing all sorting fields at once.
+
+    Return `None` when the row value comparison cannot be used and the generic,
+    `OR`-expanded filter has to be applied.
+    """
+    if len(sorting_fields) < 2 or any(value is None for value in cursor):
+        return None
+    if qs.query.annotations.keys() & set(sorting_fields):
+        return None
+    fields = _get_non_nullable_fields(qs.model, sorting_fields)
+    if fields is None:
+        return None
+    try:
+        values = [
+            Value(field.to_python(value), output_field=field)
+            for field, value in zip(fields, cursor)
+        ]
+    except (ValidationError, ValueError, TypeError):
+        raise GraphQLError("Received cursor is invalid.")
+    operator = ">" if sorting_direction == "gt" else "<"
+    return RowValueComparison([F(field.attname) for field in fields], values, operator)
+
+
 def _prepare_filter_expression(
     field_name: str,
     index: int,
@@ -278,16 +348,16 @@ def connection_from_queryset_slice(
     sorting_direction = _get_sorting_direction(sort_by, last)
     if cursor and len(cursor) != len(sorting_fields):
         raise GraphQLError("Received cursor is invalid.")
-    filter_kwargs = (
-        _prepare_filter(
+    filter_kwargs: Union[Q, RowValueComparison] = Q()
+    if cursor:
+        filter_kwargs = _prepare_row_value_filter(
+            qs, cursor, sorting_fields, sorting_direction
+        ) or _prepare_filter(
             cursor,
             sorting_fields,
             sorting_direction,
             _get_id_coercion(qs),
         )
-        if cursor
-        else Q()
-    )
     try:
         filtered_qs = qs.filter(filter_kwargs)
     except ValueError:
@@ -299,7 +369,11 @@ def connection_from_queryset_slice(
 
     if "total_count" in connection_type._meta.fields:
 
-        def get_total_count():
+        def get_total_count(limit: Optional[int] = None):
+            if limit is not None:
+                # Count only up to `limit` rows, so the query stops scanning as soon
+                # as the limit is reached instead of visiting every matching row.
+                return qs.order_by()[:limit].count()
             return qs.count()
 
         return connection_type(
@@ -681,10 +755,23 @@ class CountableConnection(NonNullConnection):
     class Meta:
         abstract = True
 
-    total_count = graphene.Int(description="A total count of items in the collection.")
+    total_count = graphene.Int(
+        description="A total count of items in the collection.",
+        limit=graphene.Argument(
+            graphene.Int,
+            description=(
+                "Stop counting after reaching the given number of items. Use it to "
+                "get a cheaper count of large collections; the returned value equal "
+                "to the limit means that the collection may contain more items."
+                + ADDED_IN_320
+            ),
+        ),
+    )
 
     @staticmethod
-    def resolve_total_count(root, _info):
+    def resolve_total_count(root, _info, limit=None):
+        if limit is not None and limit < 1:
+            raise GraphQLError("Argument `limit` must be a positive integer.")
         try:
             if isinstance(root, dict):
                 total_count = root["total_count"]
@@ -694,6 +781,8 @@ class CountableConnection(NonNullConnection):
             return None
 
         if callable(total_count):
-            return total_count()
+            return total_count(limit)
 
+        if limit is not None and total_count is not None:
+            return min(total_count, limit)
         return total_count
@@ -7,6 +7,7 @@ from django.utils.functional import empty
 
 from ...account.models import User
 from ...app.models import App
+from ...core.db.replicas import get_replica_connection_name
 
 if TYPE_CHECKING:
     from .dataloaders import DataLoader
@@ -16,11 +17,17 @@ class SaleorContext(HttpRequest):
     _cached_user: Optional[User]
     decoded_auth_token: Optional[dict[str, Any]]
     allow_replica: bool = True
+    replica_connection_name: Optional[str]
+    read_after_lsn: Optional[int]
     dataloaders: dict[str, "DataLoader"]
     app: Optional[App]
     user: Optional[User]  # type: ignore[assignment]
     requestor: Union[App, User, None]
     request_time: datetime.datetime
+    # Instances reused by `orderBulkCreate` between the batches of an import.
+    order_bulk_create_instances: dict[str, Any]
+    # Set when the response is the cached schema introspection.
+    is_cached_schema_query: bool
 
     def __init__(self, *args, **kwargs):
         if "dataloaders" in kwargs:
@@ -51,11 +58,21 @@ def get_database_connection_name(context: SaleorContext) -> str:
     Add `.using(connection_name)` to use connection name in QuerySet.
     Queryset to main database: `User.objects.all()`.
     Queryset to read replica: `User.objects.using(connection_name).all()`.
+    The replica is chosen once per request, see `get_replica_connection_name`.
     """
     allow_replica = getattr(context, "allow_replica", True)
-    if allow_replica:
-        return settings.DATABASE_CONNECTION_REPLICA_NAME
-    return settings.DATABASE_CONNECTION_DEFAULT_NAME
+    if not allow_replica:
+        return settings.DATABASE_CONNECTION_DEFAULT_NAME
+    connection_name = getattr(context, "replica_connection_name", None)
+    if connection_name is None:
+        connection_name = get_replica_connection_name(
+            getattr(context, "read_after_lsn", None)
+        )
+        try:
+            context.replica_connection_name = connection_name
+        except AttributeError:
+            pass
+    return connection_name
 
 
 def setup_context_user(context: SaleorContext) -> None:
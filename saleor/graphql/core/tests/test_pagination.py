@@ -5,7 +5,11 @@ import graphene
 import pytest
 
 from ....tests.models import Book
-from ..connection import CountableConnection, create_connection_slice
+from ..connection import (
+    CountableConnection,
+    _prepare_row_value_filter,
+    create_connection_slice,
+)
 from ..fields import ConnectionField
 
 
@@ -310,3 +314,83 @@ def test_query_with_pagination_and_fragments_no_first_or_last_raises_an_error(bo
         "the `books` connection."
     )
     assert str(result.errors[0]) == expected_err_msg
+
+
+QUERY_PAGINATION_TOTAL_COUNT = """
+    query BooksTotalCount($first: Int, $limit: Int){
+        books(first: $first) {
+            totalCount(limit: $limit)
+        }
+    }
+"""
+
+
+@pytest.mark.parametrize(("limit", "expected_count"), [(None, 24), (5, 5), (100, 24)])
+def test_pagination_total_count_with_limit(limit, expected_count, books):
+    # given
+    variables = {"first": 1, "limit": limit}
+
+    # when
+    result = schema.execute(QUERY_PAGINATION_TOTAL_COUNT, variables=variables)
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == expected_count
+
+
+def test_pagination_total_count_with_invalid_limit(books):
+    # given
+    variables = {"first": 1, "limit": 0}
+
+    # when
+    result = schema.execute(QUERY_PAGINATION_TOTAL_COUNT, variables=variables)
+
+    # then
+    assert len(result.errors) == 1
+    assert str(result.errors[0]) == "Argument `limit` must be a positive integer."
+
+
+def test_prepare_row_value_filter(books):
+    # given
+    qs = Book.objects.order_by("name", "pk")
+    cursor_book = qs[5]
+    cursor = [cursor_book.name, str(cursor_book.pk)]
+
+    # when
+    row_filter = _prepare_row_value_filter(qs, cursor, ["name", "pk"], "gt")
+
+    # then
+    assert row_filter is not None
+    assert list(qs.filter(row_filter)) == list(qs)[6:]
+
+
+def test_prepare_row_value_filter_descending(books):
+    # given
+    qs = Book.objects.order_by("-name", "-pk")
+    cursor_book = qs[5]
+    cursor = [cursor_book.name, str(cursor_book.pk)]
+
+    # when
+    row_filter = _prepare_row_value_filter(qs, cursor, ["name", "pk"], "lt")
+
+    # then
+    assert row_filter is not None
+    assert list(qs.filter(row_filter)) == list(qs)[6:]
+
+
+@pytest.mark.parametrize(
+    ("sorting_fields", "cursor"),
+    [
+        (["pk"], ["1"]),
+        (["name", "pk"], [None, "1"]),
+        (["name", "unknown"], ["Book1", "1"]),
+    ],
+)
+def test_prepare_row_value_filter_not_applicable(sorting_fields, cursor, books):
+    # when
+    row_filter = _prepare_row_value_filter(
+        Book.objects.all(), cursor, sorting_fields, "gt"
+    )
+
+    # then
+    assert row_filter is None
@@ -7,6 +7,7 @@ from django.test import override_settings
 from graphql.execution.base import ExecutionResult
 
 from .... import __version__ as saleor_version
+from ....asgi.gzip_compression import CACHE_COMPRESSED_BODY_HEADER
 from ....graphql.api import backend, schema
 from ....graphql.utils import INTERNAL_ERROR_MESSAGE
 from ...tests.fixtures import API_PATH
@@ -311,6 +312,26 @@ def test_introspection_query_is_cached_only_once(
     cache_set_mock.assert_not_called()
 
 
+@override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
+def test_introspection_query_response_marked_for_compressed_body_cache(
+    api_client, product, channel_USD
+):
+    # when
+    introspection_response = api_client.post_graphql(INTROSPECTION_QUERY)
+    query_response = api_client.post_graphql(
+        """
+        query ($channel: String) {
+            products(first: 1, channel: $channel) { edges { node { id } } }
+        }
+        """,
+        {"channel": channel_USD.slug},
+    )
+
+    # then
+    assert introspection_response[CACHE_COMPRESSED_BODY_HEADER] == "1"
+    assert not query_response.has_header(CACHE_COMPRESSED_BODY_HEADER)
+
+
 @mock.patch("saleor.graphql.views.cache.set")
 @mock.patch("saleor.graphql.views.cache.get")
 @override_settings(DEBUG=True, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
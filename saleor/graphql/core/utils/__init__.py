@@ -9,6 +9,7 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from graphene import ObjectType
 from graphql.error import GraphQLError
+from graphql.language.ast import FragmentSpread, InlineFragment
 
 from ....plugins.const import APP_ID_PREFIX
 from ....thumbnail import FILE_NAME_MAX_LENGTH
@@ -166,3 +167,29 @@ def message_webhook_events(webhook_events: list[WebhookEventInfo]) -> str:
         if event.description:
             description += f": {event.description}"
     return description
+
+
+def get_nested_field_depth(info, field_name: str, through: tuple = ()) -> int:
+    """Return how many nested levels of `field_name` the query selects.
+
+    The resolved field is the first level. Fields listed in `through` are walked
+    between the levels, e.g. `("edges", "node")` for connection fields.
+    """
+
+    def get_depth(selection_set) -> int:
+        if not selection_set:
+            return 0
+        depth = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FragmentSpread):
+                fragment = info.fragments.get(selection.name.value)
+                depth = max(depth, get_depth(fragment and fragment.selection_set))
+            elif isinstance(selection, InlineFragment):
+                depth = max(depth, get_depth(selection.selection_set))
+            elif selection.name.value == field_name:
+                depth = max(depth, 1 + get_depth(selection.selection_set))
+            elif selection.name.value in through:
+                depth = max(depth, get_depth(selection.selection_set))
+        return depth
+
+    return 1 + max(get_depth(field.selection_set) for field in info.field_asts)
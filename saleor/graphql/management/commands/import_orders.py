@@ -0,0 +1,173 @@
+import json
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from graphql.backend import get_default_backend
+
+from ....app.models import App
+from ...api import schema
+from ...context import get_context_value
+from ...order.bulk_mutations.order_bulk_create import MAX_ORDERS
+from ...webhook.subscription_payload import initialize_request
+
+ORDER_BULK_CREATE_MUTATION = """
+    mutation OrderBulkCreate(
+        $orders: [OrderBulkCreateInput!]!
+        $errorPolicy: ErrorPolicyEnum
+        $stockUpdatePolicy: StockUpdatePolicyEnum
+    ) {
+        orderBulkCreate(
+            orders: $orders
+            errorPolicy: $errorPolicy
+            stockUpdatePolicy: $stockUpdatePolicy
+        ) {
+            count
+            results {
+                order {
+                    id
+                }
+                errors {
+                    path
+                    message
+                    code
+                }
+            }
+            errors {
+                path
+                message
+                code
+            }
+        }
+    }
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Import orders from a file with one `OrderBulkCreateInput` JSON object per "
+        "line. Orders are created in batches with the `orderBulkCreate` mutation "
+        "executed in-process on behalf of the given app."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", type=str, help="Path to the NDJSON file.")
+        parser.add_argument(
+            "--app-id",
+            type=int,
+            required=True,
+            help="ID of the app with the MANAGE_ORDERS_IMPORT permission.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=MAX_ORDERS,
+            help=f"Number of orders created in one transaction (max {MAX_ORDERS}).",
+        )
+        parser.add_argument(
+            "--start-line",
+            type=int,
+            default=1,
+            help="Line of the file to start from. Use it to resume an import.",
+        )
+        parser.add_argument(
+            "--error-policy",
+            default="REJECT_FAILED_ROWS",
+            choices=["REJECT_EVERYTHING", "REJECT_FAILED_ROWS", "IGNORE_FAILED"],
+        )
+        parser.add_argument(
+            "--stock-update-policy",
+            default="SKIP",
+            choices=["SKIP", "UPDATE", "FORCE"],
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if not 0 < batch_size <= MAX_ORDERS:
+            raise CommandError(f"Batch size must be between 1 and {MAX_ORDERS}.")
+        start_line = options["start_line"]
+        if start_line < 1:
+            raise CommandError("Start line must be a positive integer.")
+
+        try:
+            app = App.objects.get(pk=options["app_id"], removed_at__isnull=True)
+        except App.DoesNotExist:
+            raise CommandError(f"App with ID {options['app_id']} does not exist.")
+
+        # The mutation document is parsed and validated only once for all batches.
+        document = get_default_backend().document_from_string(
+            schema, ORDER_BULK_CREATE_MUTATION
+        )
+        # Channels, variants, warehouses, shipping methods and tax classes are
+        # fetched once and reused by the following batches.
+        reusable_instances: dict[str, Any] = {}
+        created_count = failed_count = 0
+        with open(options["path"], encoding="utf-8") as f:
+            for batch in _read_batches(f, batch_size, start_line):
+                line_numbers = [line_number for line_number, _ in batch]
+                first_line, last_line = line_numbers[0], line_numbers[-1]
+                request = initialize_request(requestor=app)
+                request.app = app
+                request.order_bulk_create_instances = reusable_instances
+                result = document.execute(
+                    context=get_context_value(request),
+                    variables={
+                        "orders": [order for _, order in batch],
+                        "errorPolicy": options["error_policy"],
+                        "stockUpdatePolicy": options["stock_update_policy"],
+                    },
+                )
+                if result.errors:
+                    raise CommandError(
+                        f"Import of lines {first_line}-{last_line} failed: "
+                        f"{result.errors[0]}. "
+                        f"Resume the import with --start-line {first_line}."
+                    )
+
+                data = result.data["orderBulkCreate"]
+                if data["errors"]:
+                    raise CommandError(
+                        f"Import of lines {first_line}-{last_line} failed: "
+                        f"{data['errors']}. "
+                        f"Resume the import with --start-line {first_line}."
+                    )
+                for line_number, order_result in zip(line_numbers, data["results"]):
+                    if order_result["order"] is None:
+                        failed_count += 1
+                        self.stderr.write(
+                            f"Line {line_number}: {order_result['errors']}"
+                        )
+                created_count += data["count"]
+                self.stdout.write(
+                    f"Imported lines {first_line}-{last_line}, "
+                    f"created {created_count} orders, {failed_count} failed."
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Import finished: {created_count} orders created, "
+                f"{failed_count} failed."
+            )
+        )
+
+
+def _read_batches(
+    lines: Iterable[str], batch_size: int, start_line: int
+) -> Iterator[list[tuple[int, dict[str, Any]]]]:
+    """Yield batches of parsed orders together with their line numbers."""
+    numbered_lines = islice(enumerate(lines, start=1), start_line - 1, None)
+    while True:
+        batch: list[tuple[int, dict[str, Any]]] = []
+        for line_number, line in numbered_lines:
+            if not line.strip():
+                continue
+            try:
+                batch.append((line_number, json.loads(line)))
+            except json.JSONDecodeError as e:
+                raise CommandError(f"Line {line_number} is not valid JSON: {e}.")
+            if len(batch) == batch_size:
+                break
+        if not batch:
+            return
+        yield batch
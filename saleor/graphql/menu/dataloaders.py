@@ -1,5 +1,7 @@
 from collections import defaultdict
 
+from django.db.models import Exists, OuterRef
+
 from ...menu.models import Menu, MenuItem
 from ..core.dataloaders import DataLoader
 
@@ -20,27 +22,81 @@ class MenuItemByIdLoader(DataLoader):
         return [menu_items.get(menu_item_id) for menu_item_id in keys]
 
 
+def group_menu_items_by_parent_id(menu_items):
+    items_map = defaultdict(list)
+    for menu_item in menu_items:
+        items_map[menu_item.parent_id].append(menu_item)
+    return items_map
+
+
+def prime_menu_item_children(context, menu_items, items_map, depth):
+    """Store children of the items fetched `depth` levels deep.
+
+    Nested levels selected by the query are then served without queries.
+    """
+    if depth < 1:
+        return
+    children_loader = MenuItemChildrenLoader(context)
+    for menu_item in menu_items:
+        children = items_map.get(menu_item.id, [])
+        children_loader.prime((menu_item.id, depth), children)
+        prime_menu_item_children(context, children, items_map, depth - 1)
+
+
 class MenuItemsByParentMenuLoader(DataLoader):
+    """Load top menu items by menu ID and the number of levels to fetch."""
+
     context_key = "menuitems_by_parent_menu"
 
     def batch_load(self, keys):
-        menu_items = MenuItem.objects.using(self.database_connection_name).filter(
-            menu_id__in=keys, level=0
-        )
-        items_map = defaultdict(list)
-        for menu_item in menu_items:
-            items_map[menu_item.menu_id].append(menu_item)
-        return [items_map[menu_id] for menu_id in keys]
+        items = MenuItem.objects.using(self.database_connection_name)
+        keys_by_depth = defaultdict(list)
+        for menu_id, depth in keys:
+            keys_by_depth[depth].append(menu_id)
+
+        top_items_map = {}
+        for depth, menu_ids in keys_by_depth.items():
+            menu_items = items.filter(menu_id__in=menu_ids, level__lt=depth)
+            items_map = group_menu_items_by_parent_id(menu_items)
+            top_items = items_map.get(None, [])
+            prime_menu_item_children(self.context, top_items, items_map, depth - 1)
+            for menu_id in menu_ids:
+                top_items_map[(menu_id, depth)] = []
+            for menu_item in top_items:
+                top_items_map[(menu_item.menu_id, depth)].append(menu_item)
+        return [top_items_map[key] for key in keys]
 
 
 class MenuItemChildrenLoader(DataLoader):
+    """Load menu item children by item ID and the number of levels to fetch."""
+
     context_key = "menuitem_children"
 
     def batch_load(self, keys):
-        menu_items = MenuItem.objects.using(self.database_connection_name).filter(
-            parent_id__in=keys
-        )
-        items_map = defaultdict(list)
-        for menu_item in menu_items:
-            items_map[menu_item.parent_id].append(menu_item)
-        return [items_map[menu_item_id] for menu_item_id in keys]
+        items = MenuItem.objects.using(self.database_connection_name)
+        keys_by_depth = defaultdict(list)
+        for menu_item_id, depth in keys:
+            keys_by_depth[depth].append(menu_item_id)
+
+        children_map = {}
+        for depth, menu_item_ids in keys_by_depth.items():
+            if depth == 1:
+                descendants = items.filter(parent_id__in=menu_item_ids)
+            else:
+                descendants = items.filter(
+                    Exists(
+                        items.filter(
+                            id__in=menu_item_ids,
+                            tree_id=OuterRef("tree_id"),
+                            lft__lt=OuterRef("lft"),
+                            rght__gt=OuterRef("rght"),
+                            level__gte=OuterRef("level") - depth,
+                        )
+                    )
+                )
+            items_map = group_menu_items_by_parent_id(descendants)
+            for menu_item_id in menu_item_ids:
+                children = items_map.get(menu_item_id, [])
+                children_map[(menu_item_id, depth)] = children
+                prime_menu_item_children(self.context, children, items_map, depth - 1)
+        return [children_map[key] for key in keys]
@@ -17,7 +17,7 @@ from ...core.types import MenuError, NonNullList
 from ...core.utils import WebhookEventInfo
 from ...core.utils.reordering import perform_reordering
 from ...plugins.dataloaders import get_plugin_manager_promise
-from ..dataloaders import MenuItemsByParentMenuLoader
+from ..dataloaders import MenuItemChildrenLoader, MenuItemsByParentMenuLoader
 from ..types import Menu, MenuItem, MenuItemMoveInput
 
 
@@ -198,5 +198,6 @@ class MenuItemMove(BaseMutation):
                     cls.call_event(manager.menu_item_updated, menu_item)
 
         menu = qs.get(pk=menu.pk)
-        MenuItemsByParentMenuLoader(info.context).clear(menu.id)
+        MenuItemsByParentMenuLoader(info.context).clear_all()
+        MenuItemChildrenLoader(info.context).clear_all()
         return MenuItemMove(menu=ChannelContext(node=menu, channel_slug=None))
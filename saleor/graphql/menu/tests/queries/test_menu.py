@@ -1,4 +1,6 @@
 import graphene
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from .....menu.models import Menu
 from ....tests.utils import get_graphql_content, get_graphql_content_from_response
@@ -213,3 +215,93 @@ def test_menu_items_query(
     assert not items[0]["collection"]
     assert items[1]["children"][0]["category"]["name"] == category.name
     assert items[1]["children"][1]["collection"]["name"] == published_collection.name
+
+
+QUERY_MENU_WITH_NESTED_ITEMS = """
+    query menu($id: ID!) {
+        menu(id: $id) {
+            items {
+                name
+                children {
+                    name
+                    children {
+                        name
+                        children {
+                            name
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_menu_nested_items_query_fetches_selected_levels_at_once(user_api_client, menu):
+    # given
+    top_item = menu.items.create(name="Level 0")
+    middle_item = menu.items.create(name="Level 1", parent=top_item)
+    bottom_item = menu.items.create(name="Level 2", parent=middle_item)
+    deepest_item = menu.items.create(name="Level 3", parent=bottom_item)
+    menu.items.create(name="Level 4", parent=deepest_item)
+    variables = {"id": graphene.Node.to_global_id("Menu", menu.pk)}
+
+    # when
+    with CaptureQueriesContext(connection) as captured_queries:
+        response = user_api_client.post_graphql(QUERY_MENU_WITH_NESTED_ITEMS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    items = content["data"]["menu"]["items"]
+    assert items[0]["children"][0]["children"][0]["children"][0]["name"] == "Level 3"
+    menu_item_queries = [
+        query
+        for query in captured_queries.captured_queries
+        if 'FROM "menu_menuitem"' in query["sql"]
+    ]
+    assert len(menu_item_queries) == 1
+    assert '"menu_menuitem"."level" < 4' in menu_item_queries[0]["sql"]
+
+
+QUERY_MENU_ITEM_WITH_NESTED_CHILDREN_IN_FRAGMENT = """
+    fragment ItemChildren on MenuItem {
+        children {
+            name
+            children {
+                name
+            }
+        }
+    }
+    query menuItem($id: ID!) {
+        menuItem(id: $id) {
+            ...ItemChildren
+        }
+    }
+"""
+
+
+def test_menu_item_nested_children_in_fragment_fetched_at_once(user_api_client, menu):
+    # given
+    top_item = menu.items.create(name="Level 0")
+    middle_item = menu.items.create(name="Level 1", parent=top_item)
+    bottom_item = menu.items.create(name="Level 2", parent=middle_item)
+    menu.items.create(name="Level 3", parent=bottom_item)
+    variables = {"id": graphene.Node.to_global_id("MenuItem", top_item.pk)}
+
+    # when
+    with CaptureQueriesContext(connection) as captured_queries:
+        response = user_api_client.post_graphql(
+            QUERY_MENU_ITEM_WITH_NESTED_CHILDREN_IN_FRAGMENT, variables
+        )
+
+    # then
+    content = get_graphql_content(response)
+    children = content["data"]["menuItem"]["children"]
+    assert children[0]["name"] == "Level 1"
+    assert children[0]["children"][0]["name"] == "Level 2"
+    menu_item_children_queries = [
+        query
+        for query in captured_queries.captured_queries
+        if 'FROM "menu_menuitem"' in query["sql"] and "EXISTS" in query["sql"]
+    ]
+    assert len(menu_item_children_queries) == 1
@@ -15,6 +15,7 @@ from ..core import ResolveInfo
 from ..core.connection import CountableConnection
 from ..core.doc_category import DOC_CATEGORY_MENU
 from ..core.types import NonNullList
+from ..core.utils import get_nested_field_depth
 from ..meta.types import ObjectWithMetadata
 from ..page.dataloaders import PageByIdLoader
 from ..page.types import Page
@@ -54,7 +55,10 @@ class Menu(ChannelContextTypeWithMetadata[models.Menu]):
 
     @staticmethod
     def resolve_items(root: ChannelContext[models.Menu], info: ResolveInfo):
-        menu_items = MenuItemsByParentMenuLoader(info.context).load(root.node.id)
+        depth = get_nested_field_depth(info, "children")
+        menu_items = MenuItemsByParentMenuLoader(info.context).load(
+            (root.node.id, depth)
+        )
         return menu_items.then(
             lambda menu_items: [
                 ChannelContext(node=menu_item, channel_slug=root.channel_slug)
@@ -133,7 +137,8 @@ class MenuItem(ChannelContextTypeWithMetadata[models.MenuItem]):
 
     @staticmethod
     def resolve_children(root: ChannelContext[models.MenuItem], info: ResolveInfo):
-        menus = MenuItemChildrenLoader(info.context).load(root.node.id)
+        depth = get_nested_field_depth(info, "children")
+        menus = MenuItemChildrenLoader(info.context).load((root.node.id, depth))
         return menus.then(
             lambda menus: [
                 ChannelContext(node=menu, channel_slug=root.channel_slug)
@@ -36,7 +36,6 @@ from ....order import (
 )
 from ....order.error_codes import OrderBulkCreateErrorCode
 from ....order.models import Fulfillment, FulfillmentLine, Order, OrderEvent, OrderLine
-from ....order.search import update_order_search_vector
 from ....order.utils import update_order_display_gross_prices, updates_amounts_for_order
 from ....payment import TransactionEventType
 from ....payment.models import TransactionEvent, TransactionItem
@@ -154,7 +153,7 @@ class OrderBulkCreateData:
     def post_create_order_update(self):
         if self.order:
             updates_amounts_for_order(self.order, save=False)
-            update_order_search_vector(self.order, save=False)
+            self.order.search_index_dirty = True
 
     @property
     def all_order_lines(self) -> list[OrderLine]:
@@ -307,6 +306,22 @@ class ModelIdentifiers:
     app_ids: ModelIdentifier = ModelIdentifier(model="App")
 
 
+# Lookup key prefixes of the instances that are not changed by the mutation. They can
+# be reused between the mutation calls of a single import, see `import_orders`.
+REUSABLE_INSTANCE_LOOKUPS = {
+    "channel_slugs": "Channel.slug",
+    "warehouse_ids": "Warehouse.id",
+    "shipping_method_ids": "ShippingMethod.id",
+    "tax_class_ids": "TaxClass.id",
+    "variant_ids": "ProductVariant.id",
+    "variant_skus": "ProductVariant.id",
+    "variant_external_references": "ProductVariant.external_reference",
+}
+REUSABLE_INSTANCE_MODELS = {
+    prefix.split(".")[0] for prefix in REUSABLE_INSTANCE_LOOKUPS.values()
+}
+
+
 class TaxedMoneyInput(BaseInputObjectType):
     gross = PositiveDecimal(required=True, description="Gross value of an item.")
     net = PositiveDecimal(required=True, description="Net value of an item.")
@@ -597,9 +612,18 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         support_private_meta_field = True
 
     @classmethod
-    def get_all_instances(cls, orders_input) -> dict[str, Any]:
+    def get_all_instances(
+        cls, orders_input, reusable_instances: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
         """Retrieve all required instances to process orders.
 
+        Args:
+            orders_input: list of orders input data
+            reusable_instances: instances resolved by the previous calls, with
+                the same keys as the returned dictionary; they are not fetched
+                again and it is updated with the newly fetched instances of
+                `REUSABLE_INSTANCE_MODELS`
+
         Return:
             Dictionary with keys "{model_name}.{key_name}.{key_value}" and model
             instances as values.
@@ -676,6 +700,15 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                         pass
                 setattr(identifier, "keys", model_ids)
 
+        if reusable_instances:
+            for field_name, lookup_prefix in REUSABLE_INSTANCE_LOOKUPS.items():
+                identifier = getattr(identifiers, field_name)
+                identifier.keys = [
+                    key
+                    for key in identifier.keys
+                    if f"{lookup_prefix}.{key}" not in reusable_instances
+                ]
+
         # Make DB calls
         users = User.objects.filter(
             Q(pk__in=identifiers.user_ids.keys)
@@ -740,6 +773,14 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         for object in [*warehouses, *shipping_methods, *tax_classes, *apps]:
             object_storage[f"{object.__class__.__name__}.id.{object.pk}"] = object
 
+        if reusable_instances is not None:
+            reusable_instances.update(
+                (key, instance)
+                for key, instance in object_storage.items()
+                if key.split(".")[0] in REUSABLE_INSTANCE_MODELS
+            )
+            object_storage.update(reusable_instances)
+
         return object_storage
 
     @classmethod
@@ -2226,7 +2267,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                 "updated_at",
                 "total_authorized_amount",
                 "authorize_status",
-                "search_vector",
+                "search_index_dirty",
             ],
         )
 
@@ -2248,7 +2289,10 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             # Create dictionary, which stores already resolved objects:
             #   - key for instances: "{model_name}.{key_name}.{key_value}"
             #   - key for shipping prices: "shipping_price.{shipping_method_id}"
-            object_storage: dict[str, Any] = cls.get_all_instances(orders_input)
+            object_storage: dict[str, Any] = cls.get_all_instances(
+                orders_input,
+                getattr(info.context, "order_bulk_create_instances", None),
+            )
             for order_input in orders_input:
                 orders_data.append(
                     cls.create_single_order(order_input, object_storage, info)
@@ -4,7 +4,6 @@ from django.core.exceptions import ValidationError
 from ....core.tracing import traced_atomic_transaction
 from ....order import events
 from ....order.error_codes import OrderErrorCode
-from ....order.search import update_order_search_vector
 from ....order.utils import invalidate_order_prices, remove_order_discount_from_order
 from ....permission.enums import OrderPermissions
 from ...app.dataloaders import get_app_promise
@@ -64,9 +63,13 @@ class OrderDiscountDelete(OrderDiscountCommon):
 
             order.refresh_from_db()
 
-            update_order_search_vector(order, save=False)
+            order.search_index_dirty = True
             invalidate_order_prices(order)
             order.save(
-                update_fields=["should_refresh_prices", "search_vector", "updated_at"]
+                update_fields=[
+                    "should_refresh_prices",
+                    "search_index_dirty",
+                    "updated_at",
+                ]
             )
         return OrderDiscountDelete(order=order)
@@ -5,7 +5,6 @@ from ....core.tracing import traced_atomic_transaction
 from ....order import events
 from ....order.error_codes import OrderErrorCode
 from ....order.fetch import OrderLineInfo
-from ....order.search import update_order_search_vector
 from ....order.utils import (
     delete_order_line,
     invalidate_order_prices,
@@ -93,9 +92,9 @@ class OrderLineDelete(EditableOrderValidationMixin, BaseMutation):
 
             invalidate_order_prices(order)
             recalculate_order_weight(order)
-            update_order_search_vector(order, save=False)
+            order.search_index_dirty = True
             updated_fields.extend(
-                ["should_refresh_prices", "weight", "search_vector", "updated_at"]
+                ["should_refresh_prices", "weight", "search_index_dirty", "updated_at"]
             )
             order.save(update_fields=updated_fields)
             call_event_by_order_status(order, manager)
@@ -8,7 +8,6 @@ from ....core.tracing import traced_atomic_transaction
 from ....order import events
 from ....order.error_codes import OrderErrorCode
 from ....order.fetch import fetch_order_lines
-from ....order.search import update_order_search_vector
 from ....order.utils import (
     add_variant_to_order,
     invalidate_order_prices,
@@ -195,12 +194,12 @@ class OrderLinesCreate(EditableOrderValidationMixin, BaseMutation):
 
             invalidate_order_prices(order)
             recalculate_order_weight(order)
-            update_order_search_vector(order, save=False)
+            order.search_index_dirty = True
             order.save(
                 update_fields=[
                     "should_refresh_prices",
                     "weight",
-                    "search_vector",
+                    "search_index_dirty",
                     "updated_at",
                 ]
             )
@@ -14,7 +14,6 @@ from ....order.actions import (
 from ....order.calculations import fetch_order_prices_if_expired
 from ....order.error_codes import OrderErrorCode
 from ....order.events import transaction_mark_order_as_paid_failed_event
-from ....order.search import update_order_search_vector
 from ....payment import PaymentError
 from ....permission.enums import OrderPermissions
 from ...app.dataloaders import get_app_promise
@@ -128,6 +127,7 @@ class OrderMarkAsPaid(BaseMutation):
                 order, user, app, manager, transaction_reference
             )
 
-        update_order_search_vector(order)
+        order.search_index_dirty = True
+        order.save(update_fields=["search_index_dirty", "updated_at"])
 
         return OrderMarkAsPaid(order=order)
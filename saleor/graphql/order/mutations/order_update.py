@@ -2,12 +2,10 @@ import graphene
 from django.core.exceptions import ValidationError
 
 from ....account.models import User
-from ....core.postgres import FlatConcatSearchVector
 from ....core.tracing import traced_atomic_transaction
 from ....order import OrderStatus, models
 from ....order.actions import call_order_event
 from ....order.error_codes import OrderErrorCode
-from ....order.search import prepare_order_search_vector_value
 from ....order.utils import invalidate_order_prices
 from ....permission.enums import OrderPermissions
 from ....webhook.event_types import WebhookEventAsyncType
@@ -99,9 +97,7 @@ class OrderUpdate(DraftOrderCreate, ModelWithExtRefMutation):
             if instance.user_email:
                 user = User.objects.filter(email=instance.user_email).first()
                 instance.user = user
-            instance.search_vector = FlatConcatSearchVector(
-                *prepare_order_search_vector_value(instance)
-            )
+            instance.search_index_dirty = True
             manager = get_plugin_manager_promise(info.context).get()
             if cls.should_invalidate_prices(cleaned_input):
                 invalidate_order_prices(instance)
@@ -73,7 +73,7 @@ def test_delete_order_discount_from_order_with_old_id(
     event = order.events.get()
     assert event.type == OrderEvents.ORDER_DISCOUNT_DELETED
 
-    assert order.search_vector
+    assert order.search_index_dirty
 
 
 ORDER_DISCOUNT_UPDATE = """
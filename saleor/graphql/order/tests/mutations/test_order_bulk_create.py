@@ -1,10 +1,16 @@
 import copy
+import json
 from datetime import datetime, timedelta
 from decimal import Decimal
+from io import StringIO
 from unittest.mock import patch
 
 import graphene
 import pytest
+from django.core.management import CommandError, call_command
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from .....account.models import Address
@@ -3757,3 +3763,107 @@ def test_order_bulk_create_skip_address_validation(
     assert db_order.shipping_address.validation_skipped is True
     assert db_order.billing_address.postal_code == invalid_postal_code
     assert db_order.billing_address.validation_skipped is True
+
+
+def _write_orders_file(path, orders):
+    with open(path, "w") as f:
+        for order in orders:
+            f.write(json.dumps(order, cls=DjangoJSONEncoder) + "\n")
+
+
+def test_import_orders_command(
+    app, permission_manage_orders_import, order_bulk_input, tmp_path
+):
+    # given
+    app.permissions.add(permission_manage_orders_import)
+    orders_count = Order.objects.count()
+    path = tmp_path / "orders.ndjson"
+    _write_orders_file(path, [order_bulk_input] * 3)
+
+    # when
+    call_command("import_orders", str(path), app_id=app.id, batch_size=2)
+
+    # then
+    assert Order.objects.count() == orders_count + 3
+
+
+def test_import_orders_command_reuses_instances_between_batches(
+    app, permission_manage_orders_import, order_bulk_input, tmp_path
+):
+    # given
+    app.permissions.add(permission_manage_orders_import)
+    orders_count = Order.objects.count()
+    path = tmp_path / "orders.ndjson"
+    _write_orders_file(path, [order_bulk_input] * 3)
+
+    # when
+    with CaptureQueriesContext(connection) as queries:
+        call_command("import_orders", str(path), app_id=app.id, batch_size=1)
+
+    # then
+    assert Order.objects.count() == orders_count + 3
+    channel_lookups = [
+        query["sql"]
+        for query in queries.captured_queries
+        if 'FROM "channel_channel" WHERE "channel_channel"."slug" IN' in query["sql"]
+    ]
+    assert len(channel_lookups) == 1
+
+
+def test_import_orders_command_from_start_line(
+    app, permission_manage_orders_import, order_bulk_input, tmp_path
+):
+    # given
+    app.permissions.add(permission_manage_orders_import)
+    orders_count = Order.objects.count()
+    path = tmp_path / "orders.ndjson"
+    _write_orders_file(path, [order_bulk_input] * 3)
+
+    # when
+    call_command("import_orders", str(path), app_id=app.id, start_line=3)
+
+    # then
+    assert Order.objects.count() == orders_count + 1
+
+
+def test_import_orders_command_rejects_failed_rows(
+    app, permission_manage_orders_import, order_bulk_input, tmp_path
+):
+    # given
+    app.permissions.add(permission_manage_orders_import)
+    orders_count = Order.objects.count()
+    invalid_order = copy.deepcopy(order_bulk_input)
+    invalid_order["channel"] = "non-existing-channel"
+    path = tmp_path / "orders.ndjson"
+    _write_orders_file(path, [order_bulk_input, invalid_order])
+    stderr = StringIO()
+
+    # when
+    call_command("import_orders", str(path), app_id=app.id, stderr=stderr)
+
+    # then
+    assert Order.objects.count() == orders_count + 1
+    assert stderr.getvalue().startswith("Line 2:")
+
+
+def test_import_orders_command_without_permission(app, order_bulk_input, tmp_path):
+    # given
+    path = tmp_path / "orders.ndjson"
+    _write_orders_file(path, [order_bulk_input])
+
+    # when & then
+    with pytest.raises(CommandError, match="--start-line 1"):
+        call_command("import_orders", str(path), app_id=app.id)
+
+
+def test_import_orders_command_invalid_json(
+    app, permission_manage_orders_import, tmp_path
+):
+    # given
+    app.permissions.add(permission_manage_orders_import)
+    path = tmp_path / "orders.ndjson"
+    path.write_text("{invalid\n")
+
+    # when & then
+    with pytest.raises(CommandError, match="Line 1 is not valid JSON"):
+        call_command("import_orders", str(path), app_id=app.id)
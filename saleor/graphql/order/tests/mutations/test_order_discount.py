@@ -761,7 +761,7 @@ def test_delete_order_discount_from_order(
     event = order.events.get()
     assert event.type == OrderEvents.ORDER_DISCOUNT_DELETED
 
-    assert order.search_vector
+    assert order.search_index_dirty
 
 
 def test_delete_order_discount_order_is_not_draft(
@@ -866,7 +866,7 @@ def test_delete_order_discount_from_order_by_app(
     event = order.events.get()
     assert event.type == OrderEvents.ORDER_DISCOUNT_DELETED
 
-    assert order.search_vector
+    assert order.search_index_dirty
 
 
 def test_delete_manual_discount_from_order_with_subtotal_promotion(
@@ -85,6 +85,7 @@ def test_order_update(
     assert order.user is None
     assert order.status == OrderStatus.UNFULFILLED
     assert order.external_reference == external_reference
+    assert order.search_index_dirty is True
     order_updated_webhook_mock.assert_called_once_with(order, webhooks=set())
 
 
@@ -15,7 +15,6 @@ from .....order import models as order_models
 from .....order.actions import order_transaction_updated
 from .....order.events import transaction_event as order_transaction_event
 from .....order.fetch import fetch_order_info
-from .....order.search import update_order_search_vector
 from .....order.utils import updates_amounts_for_order
 from .....payment import TransactionEventType
 from .....payment import models as payment_models
@@ -325,10 +324,8 @@ class TransactionCreate(BaseMutation):
             update_fields.append("status")
 
         if update_search_vector:
-            update_order_search_vector(order, save=False)
-            update_fields.append(
-                "search_vector",
-            )
+            order.search_index_dirty = True
+            update_fields.append("search_index_dirty")
 
         if update_fields:
             update_fields.append("updated_at")
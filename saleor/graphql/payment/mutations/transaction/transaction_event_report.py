@@ -13,7 +13,6 @@ from .....core.utils.events import call_event
 from .....order import models as order_models
 from .....order.actions import order_transaction_updated
 from .....order.fetch import fetch_order_info
-from .....order.search import update_order_search_vector
 from .....order.utils import (
     calculate_order_granted_refund_status,
     updates_amounts_for_order,
@@ -409,7 +408,7 @@ class TransactionEventReport(ModelMutation):
             )
             if transaction.order_id:
                 order = cast(order_models.Order, transaction.order)
-                update_order_search_vector(order, save=False)
+                order.search_index_dirty = True
                 updates_amounts_for_order(order, save=False)
                 order.save(
                     update_fields=[
@@ -418,7 +417,7 @@ class TransactionEventReport(ModelMutation):
                         "updated_at",
                         "total_authorized_amount",
                         "authorize_status",
-                        "search_vector",
+                        "search_index_dirty",
                     ]
                 )
                 order_info = fetch_order_info(order)
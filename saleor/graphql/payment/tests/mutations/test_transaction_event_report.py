@@ -1098,7 +1098,7 @@ def test_transaction_event_updates_order_total_authorized(
     assert order.authorize_status == OrderAuthorizeStatusEnum.FULL.value
 
 
-def test_transaction_event_updates_search_vector(
+def test_transaction_event_marks_order_search_index_as_dirty(
     app_api_client,
     permission_manage_payments,
     order_with_lines,
@@ -1150,7 +1150,7 @@ def test_transaction_event_updates_search_vector(
     get_graphql_content(response)
     order.refresh_from_db()
 
-    assert order.search_vector
+    assert order.search_index_dirty
 
 
 def test_transaction_event_report_authorize_event_already_exists(
@@ -661,17 +661,50 @@ class CollectionChannelListingByCollectionIdAndChannelSlugLoader(DataLoader):
 
 
 class CategoryChildrenByCategoryIdLoader(DataLoader):
+    """Load category children by category ID and the number of levels to fetch."""
+
     context_key = "categorychildren_by_category"
 
     def batch_load(self, keys):
-        categories = Category.objects.using(self.database_connection_name).filter(
-            parent_id__in=keys
-        )
-        parent_to_children_mapping = defaultdict(list)
-        for category in categories.iterator():
-            parent_to_children_mapping[category.parent_id].append(category)
-
-        return [parent_to_children_mapping.get(key, []) for key in keys]
+        categories = Category.objects.using(self.database_connection_name)
+        keys_by_depth = defaultdict(list)
+        for category_id, depth in keys:
+            keys_by_depth[depth].append(category_id)
+
+        children_map = {}
+        for depth, category_ids in keys_by_depth.items():
+            if depth == 1:
+                descendants = categories.filter(parent_id__in=category_ids)
+            else:
+                # fetch all levels selected by the query at once and store
+                # children of the fetched categories for the nested levels
+                descendants = categories.filter(
+                    Exists(
+                        categories.filter(
+                            id__in=category_ids,
+                            tree_id=OuterRef("tree_id"),
+                            lft__lt=OuterRef("lft"),
+                            rght__gt=OuterRef("rght"),
+                            level__gte=OuterRef("level") - depth,
+                        )
+                    )
+                )
+            parent_to_children_mapping = defaultdict(list)
+            for category in descendants.iterator():
+                parent_to_children_mapping[category.parent_id].append(category)
+            for category_id in category_ids:
+                children = parent_to_children_mapping.get(category_id, [])
+                children_map[(category_id, depth)] = children
+                self._prime_children(children, parent_to_children_mapping, depth - 1)
+        return [children_map[key] for key in keys]
+
+    def _prime_children(self, categories, parent_to_children_mapping, depth):
+        if depth < 1:
+            return
+        for category in categories:
+            children = parent_to_children_mapping.get(category.id, [])
+            self.prime((category.id, depth), children)
+            self._prime_children(children, parent_to_children_mapping, depth - 1)
 
 
 class ThumbnailByCategoryIdSizeAndFormatLoader(BaseThumbnailBySizeAndFormatLoader):
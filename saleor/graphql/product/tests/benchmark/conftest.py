@@ -1,5 +1,11 @@
+import json
+import os
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from .....core.utils.random_data import create_generated_catalogue
 from .....discount import RewardValueType
 from .....discount.models import Promotion, PromotionRule
 from .....product.models import Category
@@ -263,3 +269,76 @@ def categories_with_children(db):
     )
     categories = Category.objects.bulk_create(categories)
     return categories
+
+
+BENCHMARK_BASELINES_PATH = os.path.join(
+    os.path.dirname(__file__), "generated_catalogue_baselines.json"
+)
+
+
+@pytest.fixture
+def generated_catalogue(channel_USD, warehouse):
+    def create_catalogue(how_many):
+        for _ in create_generated_catalogue(
+            how_many, variants_per_product=3, attributes_per_product=2
+        ):
+            pass
+
+    return create_catalogue
+
+
+@pytest.fixture
+def benchmark_baseline(request):
+    """Fail when a block runs more queries or reads more rows than its baseline.
+
+    Baselines are stored per test in `generated_catalogue_baselines.json`. Run the
+    tests with `UPDATE_BENCHMARK_BASELINES=1` to record them after an intended
+    change.
+    """
+
+    class BenchmarkBaseline(CaptureQueriesContext):
+        def __init__(self):
+            super().__init__(connection)
+            self.rows = 0
+
+        def count_rows(self, execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            cursor = context["cursor"]
+            if cursor.description is not None:
+                self.rows += cursor.rowcount
+            return result
+
+        def __enter__(self):
+            self.rows_wrapper = connection.execute_wrapper(self.count_rows)
+            self.rows_wrapper.__enter__()
+            return super().__enter__()
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            super().__exit__(exc_type, exc_value, traceback)
+            self.rows_wrapper.__exit__(exc_type, exc_value, traceback)
+            if exc_type is None:
+                self.check()
+
+        def check(self):
+            with open(BENCHMARK_BASELINES_PATH) as baselines_file:
+                baselines = json.load(baselines_file)
+            name = request.node.name
+            measured = {"queries": len(self), "rows": self.rows}
+            if os.environ.get("UPDATE_BENCHMARK_BASELINES"):
+                baselines[name] = measured
+                with open(BENCHMARK_BASELINES_PATH, "w") as baselines_file:
+                    json.dump(baselines, baselines_file, indent=2, sort_keys=True)
+                    baselines_file.write("\n")
+                return
+            if name not in baselines:
+                pytest.fail(
+                    f"No benchmark baseline for {name}, record it with "
+                    "UPDATE_BENCHMARK_BASELINES=1."
+                )
+            for key, value in measured.items():
+                assert value <= baselines[name][key], (
+                    f"{name} regressed: {value} {key}, "
+                    f"baseline is {baselines[name][key]}."
+                )
+
+    return BenchmarkBaseline
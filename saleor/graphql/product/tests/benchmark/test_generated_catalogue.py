@@ -0,0 +1,173 @@
+import graphene
+import pytest
+
+from .....product.models import Product
+from ....tests.utils import get_graphql_content
+
+CATALOGUE_SIZES = [10, 100]
+
+PRODUCT_FIELDS_FRAGMENT = """
+    fragment ProductFields on Product {
+      id
+      name
+      thumbnail {
+        url
+      }
+      category {
+        name
+      }
+      attributes {
+        attribute {
+          slug
+        }
+        values {
+          name
+        }
+      }
+      pricing {
+        priceRange {
+          start {
+            gross {
+              amount
+            }
+          }
+        }
+      }
+      variants {
+        id
+        sku
+        quantityAvailable
+        pricing {
+          price {
+            gross {
+              amount
+            }
+          }
+        }
+      }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("how_many", CATALOGUE_SIZES)
+def test_generated_catalogue_products_list(
+    how_many,
+    generated_catalogue,
+    benchmark_baseline,
+    api_client,
+    channel_USD,
+    count_queries,
+):
+    # given
+    generated_catalogue(how_many)
+    query = (
+        PRODUCT_FIELDS_FRAGMENT
+        + """
+        query Products($channel: String) {
+          products(first: 100, channel: $channel) {
+            edges {
+              node {
+                ...ProductFields
+              }
+            }
+          }
+        }
+    """
+    )
+    variables = {"channel": channel_USD.slug}
+
+    # when
+    with benchmark_baseline():
+        response = api_client.post_graphql(query, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["products"]["edges"]) == how_many
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("how_many", CATALOGUE_SIZES)
+def test_generated_catalogue_category_products(
+    how_many,
+    generated_catalogue,
+    benchmark_baseline,
+    api_client,
+    channel_USD,
+    count_queries,
+):
+    # given
+    generated_catalogue(how_many)
+    category = Product.objects.first().category
+    query = (
+        PRODUCT_FIELDS_FRAGMENT
+        + """
+        query Category($id: ID!, $channel: String) {
+          category(id: $id) {
+            products(first: 100, channel: $channel) {
+              totalCount
+              edges {
+                node {
+                  ...ProductFields
+                }
+              }
+            }
+          }
+        }
+    """
+    )
+    variables = {
+        "id": graphene.Node.to_global_id("Category", category.pk),
+        "channel": channel_USD.slug,
+    }
+
+    # when
+    with benchmark_baseline():
+        response = api_client.post_graphql(query, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["category"]["products"]["totalCount"] == how_many
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("how_many", CATALOGUE_SIZES)
+def test_generated_catalogue_product_details(
+    how_many,
+    generated_catalogue,
+    benchmark_baseline,
+    api_client,
+    channel_USD,
+    count_queries,
+):
+    # given
+    generated_catalogue(how_many)
+    product = Product.objects.last()
+    query = (
+        PRODUCT_FIELDS_FRAGMENT
+        + """
+        query Product($slug: String, $channel: String) {
+          product(slug: $slug, channel: $channel) {
+            ...ProductFields
+            description
+            productType {
+              name
+            }
+          }
+        }
+    """
+    )
+    variables = {"slug": product.slug, "channel": channel_USD.slug}
+
+    # when
+    with benchmark_baseline():
+        response = api_client.post_graphql(query, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["id"] == graphene.Node.to_global_id(
+        "Product", product.pk
+    )
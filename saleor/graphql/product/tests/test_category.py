@@ -5,6 +5,8 @@ from unittest.mock import MagicMock, Mock, patch
 import graphene
 import pytest
 from django.core.files import File
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
 from django.utils.text import slugify
@@ -239,6 +241,58 @@ def test_category_query_error_when_no_param(
     assert len(content["errors"]) == 1
 
 
+QUERY_CATEGORY_WITH_NESTED_CHILDREN = """
+    query ($id: ID) {
+        category(id: $id) {
+            children(first: 10) {
+                edges {
+                    node {
+                        name
+                        children(first: 10) {
+                            edges {
+                                node {
+                                    name
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_category_query_nested_children_fetches_selected_levels_at_once(
+    user_api_client,
+):
+    # given
+    parent = Category.objects.create(name="Level 0", slug="level-0")
+    child = parent.children.create(name="Level 1", slug="level-1")
+    grandchild = child.children.create(name="Level 2", slug="level-2")
+    grandchild.children.create(name="Level 3", slug="level-3")
+    variables = {"id": graphene.Node.to_global_id("Category", parent.pk)}
+
+    # when
+    with CaptureQueriesContext(connection) as captured_queries:
+        response = user_api_client.post_graphql(
+            QUERY_CATEGORY_WITH_NESTED_CHILDREN, variables
+        )
+
+    # then
+    content = get_graphql_content(response)
+    children = content["data"]["category"]["children"]["edges"]
+    assert children[0]["node"]["name"] == "Level 1"
+    grandchildren = children[0]["node"]["children"]["edges"]
+    assert grandchildren[0]["node"]["name"] == "Level 2"
+    children_queries = [
+        query
+        for query in captured_queries.captured_queries
+        if 'FROM "product_category"' in query["sql"] and "EXISTS" in query["sql"]
+    ]
+    assert len(children_queries) == 1
+
+
 def test_query_category_product_only_visible_in_listings_as_customer(
     user_api_client, product_list, channel_USD
 ):
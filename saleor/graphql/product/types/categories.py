@@ -33,6 +33,7 @@ from ...core.federation import federated_entity, resolve_federation_references
 from ...core.fields import ConnectionField, FilterConnectionField, JSONString
 from ...core.scalars import DateTime
 from ...core.types import Image, ModelObjectType, ThumbnailField
+from ...core.utils import get_nested_field_depth
 from ...meta.types import ObjectWithMetadata
 from ...translations.fields import TranslationField
 from ...translations.types import CategoryTranslation
@@ -155,9 +156,10 @@ class Category(ModelObjectType[models.Category]):
                 children, info, kwargs, CategoryCountableConnection
             )
 
+        depth = get_nested_field_depth(info, "children", through=("edges", "node"))
         return (
             CategoryChildrenByCategoryIdLoader(info.context)
-            .load(root.pk)
+            .load((root.pk, depth))
             .then(slice_children_categories)
         )
 
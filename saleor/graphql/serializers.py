@@ -0,0 +1,51 @@
+import json
+from functools import cache
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_default(obj: Any) -> Any:
+    return DjangoJSONEncoder().default(obj)
+
+
+def serialize_response_with_json(data: Any) -> bytes:
+    return json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8")
+
+
+def serialize_response_with_orjson(data: Any) -> bytes:
+    # dates are passed to the default encoder to keep the format of
+    # `DjangoJSONEncoder`
+    return orjson.dumps(
+        data,
+        default=_encode_default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def serialize_response(data: Any) -> bytes:
+    """Serialize the GraphQL response to JSON bytes.
+
+    Use `orjson` when it is installed, which encodes straight to bytes, and the
+    standard library encoder otherwise. Both support the types handled by
+    `DjangoJSONEncoder`.
+    """
+    if orjson is not None:
+        try:
+            return serialize_response_with_orjson(data)
+        except TypeError:
+            # e.g. integers larger than 64 bits
+            pass
+    return serialize_response_with_json(data)
+
+
+@cache
+def get_response_serializer() -> Callable[[Any], bytes]:
+    return import_string(settings.GRAPHQL_RESPONSE_SERIALIZER_PATH)
@@ -23,7 +23,7 @@ def resolve_available_shipping_methods(info, *, channel_slug: str, address):
         )
         address.pop("skip_validation", None)
         available = filter_shipping_methods_by_postal_code_rules(
-            available, Address(**address)
+            available.prefetch_related("postal_code_rules"), Address(**address)
         )
 
     if available is not None:
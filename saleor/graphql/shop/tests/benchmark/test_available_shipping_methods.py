@@ -0,0 +1,90 @@
+import pytest
+from prices import Money
+
+from .....shipping import PostalCodeRuleInclusionType, ShippingMethodType
+from .....shipping.models import (
+    ShippingMethod,
+    ShippingMethodChannelListing,
+    ShippingMethodPostalCodeRule,
+)
+from ....account.enums import CountryCodeEnum
+from ....tests.utils import get_graphql_content
+
+AVAILABLE_SHIPPING_METHODS_QUERY = """
+    query Shop($channel: String!, $address: AddressInput){
+        shop {
+            availableShippingMethods(channel: $channel, address: $address) {
+                id
+                name
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_available_shipping_methods_with_many_postal_code_rules(
+    api_client, channel_USD, shipping_zone, count_queries
+):
+    # given
+    methods = ShippingMethod.objects.bulk_create(
+        [
+            ShippingMethod(
+                name=f"Method {i}",
+                type=ShippingMethodType.PRICE_BASED,
+                shipping_zone=shipping_zone,
+            )
+            for i in range(10)
+        ]
+    )
+    ShippingMethodChannelListing.objects.bulk_create(
+        [
+            ShippingMethodChannelListing(
+                shipping_method=method,
+                channel=channel_USD,
+                minimum_order_price=Money(0, "USD"),
+                price=Money(10, "USD"),
+            )
+            for method in methods
+        ]
+    )
+    # UK postal codes are split into sections before they are compared, so the
+    # rules of GB addresses go through the slowest matching path
+    rules = [
+        ShippingMethodPostalCodeRule(
+            shipping_method=method,
+            start=f"BH{district} {sector}AA",
+            end=f"BH{district} {sector}ZZ",
+            inclusion_type=PostalCodeRuleInclusionType.EXCLUDE,
+        )
+        for method in methods
+        for district in range(1, 51)
+        for sector in range(10)
+    ]
+    rules += [
+        ShippingMethodPostalCodeRule(
+            shipping_method=method,
+            start="SW1A 1AA",
+            end="SW1A 1ZZ",
+            inclusion_type=PostalCodeRuleInclusionType.EXCLUDE,
+        )
+        for method in methods[:5]
+    ]
+    ShippingMethodPostalCodeRule.objects.bulk_create(rules)
+    variables = {
+        "channel": channel_USD.slug,
+        "address": {"country": CountryCodeEnum.GB.name, "postalCode": "SW1A 1AA"},
+    }
+
+    # when
+    content = get_graphql_content(
+        api_client.post_graphql(AVAILABLE_SHIPPING_METHODS_QUERY, variables)
+    )
+
+    # then
+    available_methods = content["data"]["shop"]["availableShippingMethods"]
+    assert {method["name"] for method in available_methods} == {
+        "DHL",
+        *(method.name for method in methods[5:]),
+    }
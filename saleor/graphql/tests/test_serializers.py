@@ -0,0 +1,80 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.core.serializers.json import DjangoJSONEncoder
+
+from ..serializers import (
+    serialize_response,
+    serialize_response_with_json,
+    serialize_response_with_orjson,
+)
+
+
+def _build_product_listing_response():
+    created = datetime.datetime(
+        2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc
+    )
+    return {
+        "data": {
+            "products": {
+                "edges": [
+                    {
+                        "node": {
+                            "id": f"UHJvZHVjdDo{product_index}",
+                            "name": f"Product {product_index}",
+                            "created": created,
+                            "variants": [
+                                {
+                                    "id": str(uuid.UUID(int=variant_index)),
+                                    "name": f"Variant {variant_index} – żółw",
+                                    "price": Decimal("10.50"),
+                                    "quantityAvailable": variant_index,
+                                }
+                                for variant_index in range(20)
+                            ],
+                        }
+                    }
+                    for product_index in range(100)
+                ]
+            }
+        },
+        "errors": [{"message": "Error", "locations": [{"line": 1, "column": 2}]}],
+        "extensions": {"cost": {"requestedQueryCost": 2100, "maximumAvailable": 50000}},
+    }
+
+
+def test_serialize_response_with_json():
+    # given
+    data = _build_product_listing_response()
+
+    # when
+    content = serialize_response_with_json(data)
+
+    # then
+    assert content == json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8")
+
+
+def test_serialize_response_with_orjson_matches_json():
+    # given
+    pytest.importorskip("orjson")
+    data = _build_product_listing_response()
+
+    # when
+    content = serialize_response_with_orjson(data)
+
+    # then
+    assert json.loads(content) == json.loads(serialize_response_with_json(data))
+
+
+def test_serialize_response_large_integer():
+    # given
+    data = {"data": {"value": 2**70}}
+
+    # when
+    content = serialize_response(data)
+
+    # then
+    assert json.loads(content) == data
@@ -1,6 +1,10 @@
 from collections import defaultdict
 
+from django.conf import settings
+from django.core.cache import cache
+
 from ...attribute import models as attribute_models
+from ...core.utils.translations import get_translations_cache_version
 from ...discount import models as discount_models
 from ...menu import models as menu_models
 from ...page import models as page_models
@@ -20,6 +24,29 @@ class BaseTranslationByIdAndLanguageCodeLoader(DataLoader):
         if not self.relation_name:
             raise ValueError("Provide a relation_name for this dataloader.")
 
+        timeout = settings.TRANSLATIONS_CACHE_TIMEOUT.total_seconds()
+        if not timeout:
+            return self.fetch_translations(keys)
+
+        version = get_translations_cache_version(self.model)
+        prefix = f"translation_{self.model._meta.label_lower}_{version}"
+        cache_keys = {key: f"{prefix}_{key[1]}_{key[0]}" for key in keys}
+        # translations are cached wrapped in a tuple to tell apart missing ones
+        cached_translations = cache.get_many(list(cache_keys.values()))
+        missing_keys = [
+            key for key in keys if cache_keys[key] not in cached_translations
+        ]
+        if missing_keys:
+            fetched_translations = self.fetch_translations(missing_keys)
+            new_translations = {
+                cache_keys[key]: (translation,)
+                for key, translation in zip(missing_keys, fetched_translations)
+            }
+            cache.set_many(new_translations, timeout)
+            cached_translations.update(new_translations)
+        return [cached_translations[cache_keys[key]][0] for key in keys]
+
+    def fetch_translations(self, keys):
         ids = set([str(key[0]) for key in keys])
         language_codes = set([key[1] for key in keys])
 
@@ -1,6 +1,7 @@
 from collections import defaultdict
 
 import graphene
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.db.models import F, Model, Q
 from graphene.types.mutation import MutationOptions
@@ -9,6 +10,7 @@ from graphql import GraphQLError
 
 from ....attribute import models as attribute_models
 from ....core.tracing import traced_atomic_transaction
+from ....core.utils.translations import invalidate_translations_cache
 from ....discount import models as discount_models
 from ....menu import models as menu_models
 from ....page import models as page_models
@@ -409,6 +411,8 @@ class BaseBulkTranslateMutation(BaseMutation):
         cls._meta.translation_model.objects.bulk_update(
             translations_to_update, cls._meta.translation_fields
         )
+        if settings.TRANSLATIONS_CACHE_TIMEOUT:
+            invalidate_translations_cache(cls._meta.translation_model)
 
         return translations_to_create, translations_to_update
 
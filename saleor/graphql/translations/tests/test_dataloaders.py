@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from ....graphql.core.context import SaleorContext
+from ..dataloaders import ProductTranslationByIdAndLanguageCodeLoader
+
+
+def _load_product_translation(product, language_code):
+    context = SaleorContext()
+    context.allow_replica = True
+    return (
+        ProductTranslationByIdAndLanguageCodeLoader(context)
+        .load((product.id, language_code))
+        .get()
+    )
+
+
+def test_product_translation_loader_uses_cache(
+    product_translation_fr,
+    settings,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.TRANSLATIONS_CACHE_TIMEOUT = timedelta(minutes=5)
+    product = product_translation_fr.product
+    _load_product_translation(product, "fr")
+    _load_product_translation(product, "de")
+
+    # when
+    with django_assert_num_queries(0):
+        translation = _load_product_translation(product, "fr")
+        missing_translation = _load_product_translation(product, "de")
+
+    # then
+    assert translation.name == product_translation_fr.name
+    assert missing_translation is None
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        product_translation_fr.name = "New French name"
+        product_translation_fr.save(update_fields=["name"])
+    translation = _load_product_translation(product, "fr")
+
+    # then
+    assert translation.name == "New French name"
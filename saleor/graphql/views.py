@@ -10,7 +10,7 @@ from django.conf import settings
 from django.core.cache import cache
 from django.db import connection
 from django.db.backends.postgresql.base import DatabaseWrapper
-from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
 from django.shortcuts import render
 from django.views.generic import View
 from graphql import GraphQLBackend, GraphQLDocument, GraphQLSchema
@@ -20,6 +20,9 @@ from jwt.exceptions import PyJWTError
 from requests_hardened.ip_filter import InvalidIPAddress
 
 from .. import __version__ as saleor_version
+from ..asgi.gzip_compression import CACHE_COMPRESSED_BODY_HEADER
+from ..core.db.connection import allow_writer
+from ..core.db.replicas import READ_AFTER_HEADER, get_writer_lsn
 from ..core.exceptions import PermissionDenied
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
 from ..webhook import observability
@@ -27,6 +30,7 @@ from .api import API_PATH, schema
 from .context import clear_context, get_context_value
 from .core.validators.query_cost import validate_query_cost
 from .query_cost_map import COST_MAP
+from .serializers import get_response_serializer
 from .utils import format_error, query_fingerprint, query_identifier
 from .utils.validators import check_if_query_contains_only_schema
 
@@ -128,13 +132,12 @@ class GraphQLView(View):
             },
         )
 
-    def _handle_query(self, request: HttpRequest) -> JsonResponse:
+    def _handle_query(self, request: HttpRequest) -> HttpResponse:
         try:
             data = self.parse_body(request)
         except ValueError:
-            return JsonResponse(
-                data={"errors": [self.format_error("Unable to parse query.")]},
-                status=400,
+            return self.build_response(
+                {"errors": [self.format_error("Unable to parse query.")]}, 400
             )
 
         if isinstance(data, list):
@@ -145,9 +148,31 @@ class GraphQLView(View):
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        response = self.build_response(result, status_code)
+        if not isinstance(data, list) and getattr(
+            request, "is_cached_schema_query", False
+        ):
+            # the same body is sent for every schema query, so its compressed form
+            # can be cached too
+            response[CACHE_COMPRESSED_BODY_HEADER] = "1"
+        if settings.ENABLE_REPLICA_READ_AFTER_WRITE and not getattr(
+            request, "allow_replica", True
+        ):
+            # the response of a mutation tells the client which writer position
+            # the replicas need to reach before it can read its own writes
+            with allow_writer():
+                response[READ_AFTER_HEADER] = get_writer_lsn()
+        return response
 
-    def handle_query(self, request: HttpRequest) -> JsonResponse:
+    @staticmethod
+    def build_response(data: Any, status_code: int) -> HttpResponse:
+        return HttpResponse(
+            get_response_serializer()(data),
+            status=status_code,
+            content_type="application/json",
+        )
+
+    def handle_query(self, request: HttpRequest) -> HttpResponse:
         tracer = opentracing.global_tracer()
 
         # Disable extending spans from header due to:
@@ -320,6 +345,7 @@ class GraphQLView(View):
                     if should_use_cache_for_scheme:
                         key = generate_cache_key(raw_query_string)
                         response = cache.get(key)
+                        context.is_cached_schema_query = True
 
                     if not response:
                         response = document.execute(
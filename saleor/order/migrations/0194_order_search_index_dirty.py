@@ -0,0 +1,28 @@
+# Generated by Django 4.2.15 on 2026-10-19 11:02
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("order", "0193_merge_20240805_0810"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="search_index_dirty",
+            field=models.BooleanField(default=False),
+        ),
+        AddIndexConcurrently(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("search_index_dirty", True)),
+                fields=["updated_at"],
+                name="order_search_index_dirty_idx",
+            ),
+        ),
+    ]
@@ -14,6 +14,17 @@ if TYPE_CHECKING:
     from .models import Order
 
 
+ORDER_FIELDS_TO_PREFETCH = [
+    "user",
+    "billing_address",
+    "shipping_address",
+    "payments",
+    "discounts",
+    "lines",
+    "payment_transactions__events",
+]
+
+
 def update_order_search_vector(order: "Order", *, save: bool = True):
     order.search_vector = FlatConcatSearchVector(
         *prepare_order_search_vector_value(order)
@@ -22,20 +33,24 @@ def update_order_search_vector(order: "Order", *, save: bool = True):
         order.save(update_fields=["search_vector", "updated_at"])
 
 
+def update_orders_search_vector(orders: list["Order"]):
+    """Rebuild the search vector of the orders and clear their dirty flag."""
+    from .models import Order
+
+    prefetch_related_objects(orders, *ORDER_FIELDS_TO_PREFETCH)
+    for order in orders:
+        order.search_vector = FlatConcatSearchVector(
+            *prepare_order_search_vector_value(order, already_prefetched=True)
+        )
+        order.search_index_dirty = False
+    Order.objects.bulk_update(orders, ["search_vector", "search_index_dirty"])
+
+
 def prepare_order_search_vector_value(
     order: "Order", *, already_prefetched=False
 ) -> list[NoValidationSearchVector]:
     if not already_prefetched:
-        prefetch_related_objects(
-            [order],
-            "user",
-            "billing_address",
-            "shipping_address",
-            "payments",
-            "discounts",
-            "lines",
-            "payment_transactions__events",
-        )
+        prefetch_related_objects([order], *ORDER_FIELDS_TO_PREFETCH)
     search_vectors = [
         NoValidationSearchVector(Value(str(order.number)), config="simple", weight="A")
     ]
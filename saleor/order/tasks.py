@@ -18,6 +18,7 @@ from ..webhook.utils import get_webhooks_for_multiple_events
 from . import OrderEvents, OrderStatus
 from .actions import call_order_event, call_order_events
 from .models import Order, OrderEvent
+from .search import update_orders_search_vector
 from .utils import invalidate_order_prices
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,8 @@ EXPIRE_ORDER_BATCH_SIZE = 100
 # It takes +/- 8 secs to delete 5000 orders
 DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
 
+UPDATE_SEARCH_VECTOR_ORDER_BATCH_SIZE = 300
+
 
 @app.task
 def recalculate_orders_task(order_ids: list[int]):
@@ -206,3 +209,19 @@ def delete_expired_orders_task():
 
     Order.objects.filter(id__in=ids_batch).delete()
     delete_expired_orders_task.delay()
+
+
+@app.task(
+    queue=settings.UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME,
+    expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
+)
+def update_orders_search_vector_task():
+    order_ids = (
+        Order.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(search_index_dirty=True)
+        .order_by("updated_at")
+        .values_list("id", flat=True)[:UPDATE_SEARCH_VECTOR_ORDER_BATCH_SIZE]
+    )
+    orders = list(Order.objects.filter(id__in=list(order_ids)))
+    if orders:
+        update_orders_search_vector(orders)
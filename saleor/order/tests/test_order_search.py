@@ -2,7 +2,11 @@ from decimal import Decimal
 
 from ...discount import DiscountValueType
 from ..models import OrderLine
-from ..search import prepare_order_search_vector_value, update_order_search_vector
+from ..search import (
+    prepare_order_search_vector_value,
+    update_order_search_vector,
+    update_orders_search_vector,
+)
 
 
 def test_update_order_search_vector_auto_save(order):
@@ -34,6 +38,22 @@ def test_update_order_search_vector_without_save(order):
     assert not order.search_vector
 
 
+def test_update_orders_search_vector(order_list):
+    # given
+    for order in order_list:
+        order.search_vector = None
+        order.search_index_dirty = True
+
+    # when
+    update_orders_search_vector(order_list)
+
+    # then
+    for order in order_list:
+        order.refresh_from_db()
+        assert order.search_vector
+        assert order.search_index_dirty is False
+
+
 def test_prepare_order_search_vector_value(
     order_with_lines, address_usa, payment_dummy
 ):
@@ -20,6 +20,7 @@ from ..tasks import (
     delete_expired_orders_task,
     expire_orders_task,
     send_order_updated,
+    update_orders_search_vector_task,
 )
 
 
@@ -844,3 +845,22 @@ def test_send_order_updated(
         ]
     )
     assert wrapped_call_order_event.called
+
+
+def test_update_orders_search_vector_task(order_list):
+    # given
+    dirty_order, clean_order, *_ = order_list
+    Order.objects.filter(pk__in=[dirty_order.pk, clean_order.pk]).update(
+        search_vector=None
+    )
+    Order.objects.filter(pk=dirty_order.pk).update(search_index_dirty=True)
+
+    # when
+    update_orders_search_vector_task()
+
+    # then
+    dirty_order.refresh_from_db()
+    clean_order.refresh_from_db()
+    assert dirty_order.search_vector
+    assert dirty_order.search_index_dirty is False
+    assert clean_order.search_vector is None
@@ -0,0 +1 @@
+PLUGIN_ID = "mirumee.payments.adyen"
@@ -29,6 +29,7 @@ from ...interface import (
 )
 from ...models import Payment, Transaction
 from ..utils import get_supported_currencies
+from . import PLUGIN_ID
 from .utils.apple_pay import initialize_apple_pay, make_request_to_initialize_apple_pay
 from .utils.common import (
     AUTH_STATUS,
@@ -53,7 +54,7 @@ ADDITIONAL_ACTION_PATH = "/additional-actions"
 
 
 class AdyenGatewayPlugin(BasePlugin):
-    PLUGIN_ID = "mirumee.payments.adyen"
+    PLUGIN_ID = PLUGIN_ID
     PLUGIN_NAME = GATEWAY_NAME
     CONFIGURATION_PER_CHANNEL = True
     DEFAULT_CONFIGURATION = [
@@ -257,7 +258,7 @@ class AdyenGatewayPlugin(BasePlugin):
             return HttpResponseNotFound()
         config = self._get_gateway_config()
         if path.startswith(WEBHOOK_PATH):
-            return handle_webhook(request, config)
+            return handle_webhook(request, config, self.channel.slug)
         elif path.startswith(ADDITIONAL_ACTION_PATH):
             with opentracing.global_tracer().start_active_span(
                 "adyen.checkout.payment_details"
@@ -0,0 +1,139 @@
+import json
+from unittest import mock
+
+from .....models import PaymentGatewayNotification
+from .....notification_inbox import (
+    process_gateway_notifications,
+    store_gateway_notification,
+)
+from ... import PLUGIN_ID
+from ...webhooks import get_notification_event_id, handle_webhook
+
+
+@mock.patch(
+    "saleor.payment.tasks.process_gateway_notifications_task.apply_async",
+)
+def test_store_gateway_notification_ignores_duplicates(
+    apply_async_mock, notification, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    notification_data = notification()
+    event_id = get_notification_event_id(notification_data)
+    psp_reference = notification_data["merchantReference"]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(2):
+            store_gateway_notification(
+                gateway=PLUGIN_ID,
+                channel_slug=channel_USD.slug,
+                event_id=event_id,
+                psp_reference=psp_reference,
+                payload=notification_data,
+            )
+
+    # then
+    stored_notification = PaymentGatewayNotification.objects.get()
+    assert stored_notification.event_id == event_id
+    assert stored_notification.payload == notification_data
+    assert stored_notification.processed_at is None
+    apply_async_mock.assert_called_with(
+        kwargs={
+            "gateway": PLUGIN_ID,
+            "channel_slug": channel_USD.slug,
+            "psp_reference": psp_reference,
+        },
+        queue=None,
+    )
+
+
+def test_process_gateway_notifications_in_received_order(
+    notification, adyen_plugin, channel_USD
+):
+    # given
+    adyen_plugin()
+    handler_mock = mock.Mock(side_effect=[ValueError("Failed"), None])
+    payloads = [
+        notification(event_code="AUTHORISATION", psp_reference="1"),
+        notification(event_code="AUTHORISATION", psp_reference="2"),
+        notification(event_code="AUTHORISATION", merchant_reference="other"),
+    ]
+    notifications = PaymentGatewayNotification.objects.bulk_create(
+        [
+            PaymentGatewayNotification(
+                gateway=PLUGIN_ID,
+                channel_slug=channel_USD.slug,
+                event_id=get_notification_event_id(payload),
+                psp_reference=payload["merchantReference"],
+                payload=payload,
+            )
+            for payload in payloads
+        ]
+    )
+    psp_reference = payloads[0]["merchantReference"]
+
+    # when
+    with mock.patch.dict(
+        "saleor.payment.gateways.adyen.webhooks.EVENT_MAP",
+        {"AUTHORISATION": handler_mock},
+    ):
+        process_gateway_notifications(PLUGIN_ID, channel_USD.slug, psp_reference)
+
+    # then
+    assert [call.args[0] for call in handler_mock.call_args_list] == payloads[:2]
+    for stored_notification in notifications:
+        stored_notification.refresh_from_db()
+    failed, processed, other = notifications
+    assert failed.processed_at
+    assert failed.error == "Failed"
+    assert processed.processed_at
+    assert processed.error is None
+    assert other.processed_at is None
+
+
+@mock.patch("saleor.payment.gateways.adyen.webhooks.process_notification")
+@mock.patch(
+    "saleor.payment.tasks.process_gateway_notifications_task.apply_async",
+)
+def test_handle_webhook_stores_notification_in_inbox(
+    apply_async_mock,
+    process_notification_mock,
+    notification,
+    adyen_plugin,
+    channel_USD,
+    settings,
+    rf,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.ENABLE_PAYMENT_NOTIFICATIONS_INBOX = True
+    plugin = adyen_plugin()
+    notification_data = notification()
+    request = rf.post(
+        path="/webhooks/",
+        data=json.dumps(
+            {"notificationItems": [{"NotificationRequestItem": notification_data}]}
+        ),
+        content_type="application/json",
+    )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        response = handle_webhook(request, plugin.config, channel_USD.slug)
+
+    # then
+    assert response.content == b"[accepted]"
+    process_notification_mock.assert_not_called()
+    stored_notification = PaymentGatewayNotification.objects.get()
+    assert stored_notification.gateway == PLUGIN_ID
+    assert stored_notification.event_id == get_notification_event_id(notification_data)
+    assert stored_notification.psp_reference == notification_data["merchantReference"]
+    assert stored_notification.payload == notification_data
+    apply_async_mock.assert_called_once_with(
+        kwargs={
+            "gateway": PLUGIN_ID,
+            "channel_slug": channel_USD.slug,
+            "psp_reference": notification_data["merchantReference"],
+        },
+        queue=None,
+    )
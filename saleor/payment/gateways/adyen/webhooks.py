@@ -12,6 +12,7 @@ from urllib.parse import urlencode, urlparse
 
 import Adyen
 import graphene
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
 from django.core.exceptions import ValidationError
 from django.core.handlers.wsgi import WSGIRequest
@@ -47,6 +48,7 @@ from ....plugins.manager import get_plugins_manager
 from ... import ChargeStatus, PaymentError, TransactionKind, gateway
 from ...gateway import payment_refund_or_void
 from ...interface import GatewayConfig, GatewayResponse
+from ...notification_inbox import store_gateway_notification
 from ...utils import (
     create_payment_information,
     create_transaction,
@@ -54,6 +56,7 @@ from ...utils import (
     price_from_minor_unit,
     try_void_or_refund_inactive_payment,
 )
+from . import PLUGIN_ID
 from .utils.common import (
     FAILED_STATUSES,
     api_call,
@@ -982,7 +985,9 @@ def validate_merchant_account(
 
 
 @transaction_with_commit_on_errors()
-def handle_webhook(request: WSGIRequest, gateway_config: "GatewayConfig"):
+def handle_webhook(
+    request: WSGIRequest, gateway_config: "GatewayConfig", channel_slug: str
+):
     try:
         json_data = json.loads(request.body)
     except JSONDecodeError:
@@ -1002,11 +1007,34 @@ def handle_webhook(request: WSGIRequest, gateway_config: "GatewayConfig"):
     if not validate_auth_user(request.headers, gateway_config):
         return HttpResponseBadRequest("Invalid or missing basic auth.")
 
+    if settings.ENABLE_PAYMENT_NOTIFICATIONS_INBOX:
+        store_gateway_notification(
+            gateway=PLUGIN_ID,
+            channel_slug=channel_slug,
+            event_id=get_notification_event_id(notification),
+            psp_reference=notification.get("merchantReference") or "",
+            payload=notification,
+        )
+        return HttpResponse("[accepted]")
+
+    process_notification(notification, gateway_config, channel_slug)
+    return HttpResponse("[accepted]")
+
+
+def get_notification_event_id(notification: dict[str, Any]) -> str:
+    """Return the key that identifies the notification across Adyen retries."""
+    return ":".join(
+        str(notification.get(key, ""))
+        for key in ("eventCode", "pspReference", "success")
+    )
+
+
+def process_notification(
+    notification: dict[str, Any], gateway_config: "GatewayConfig", channel_slug: str
+):
     event_handler = EVENT_MAP.get(notification.get("eventCode", ""))
     if event_handler:
         event_handler(notification, gateway_config)
-        return HttpResponse("[accepted]")
-    return HttpResponse("[accepted]")
 
 
 class HttpResponseRedirectWithTrustedProtocol(HttpResponseRedirect):
@@ -0,0 +1,124 @@
+from unittest.mock import patch
+
+import pytest
+import stripe
+
+from ....models import PaymentGatewayNotification
+from ....notification_inbox import process_gateway_notifications
+from ..consts import PLUGIN_ID, WEBHOOK_REFUND_EVENT, WEBHOOK_SUCCESS_EVENT
+from ..webhooks import handle_webhook
+
+
+def _stripe_event_payload(event_id, event_type, event_object):
+    return {
+        "id": event_id,
+        "object": "event",
+        "type": event_type,
+        "data": {"object": event_object},
+    }
+
+
+def _post_stripe_event(rf, payload):
+    request = rf.post(path="/webhooks/", data=payload, content_type="application/json")
+    request.META["HTTP_STRIPE_SIGNATURE"] = "1234"
+    return request
+
+
+@pytest.mark.parametrize(
+    ("event_type", "event_object"),
+    [
+        (WEBHOOK_SUCCESS_EVENT, {"id": "pi_1", "object": "payment_intent"}),
+        (
+            WEBHOOK_REFUND_EVENT,
+            {"id": "ch_1", "object": "charge", "payment_intent": "pi_1"},
+        ),
+    ],
+)
+@patch("saleor.payment.tasks.process_gateway_notifications_task.apply_async")
+@patch("saleor.payment.gateways.stripe.webhooks.handle_successful_payment_intent")
+@patch("saleor.payment.gateways.stripe.webhooks.handle_refund")
+@patch("saleor.payment.gateways.stripe.stripe_api.stripe.Webhook.construct_event")
+def test_handle_webhook_stores_notification_in_inbox(
+    construct_event_mock,
+    handle_refund_mock,
+    handle_successful_payment_intent_mock,
+    apply_async_mock,
+    event_type,
+    event_object,
+    stripe_plugin,
+    channel_USD,
+    settings,
+    rf,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.ENABLE_PAYMENT_NOTIFICATIONS_INBOX = True
+    plugin = stripe_plugin()
+    payload = _stripe_event_payload("evt_1", event_type, event_object)
+    construct_event_mock.return_value = stripe.Event.construct_from(
+        payload, "secret_key"
+    )
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        responses = [
+            handle_webhook(
+                _post_stripe_event(rf, payload), plugin.config, channel_USD.slug
+            )
+            for _ in range(2)
+        ]
+
+    # then
+    assert [response.status_code for response in responses] == [200, 200]
+    handle_refund_mock.assert_not_called()
+    handle_successful_payment_intent_mock.assert_not_called()
+    stored_notification = PaymentGatewayNotification.objects.get()
+    assert stored_notification.gateway == PLUGIN_ID
+    assert stored_notification.channel_slug == channel_USD.slug
+    assert stored_notification.event_id == "evt_1"
+    assert stored_notification.psp_reference == "pi_1"
+    assert stored_notification.payload == payload
+    apply_async_mock.assert_called_with(
+        kwargs={
+            "gateway": PLUGIN_ID,
+            "channel_slug": channel_USD.slug,
+            "psp_reference": "pi_1",
+        },
+        queue=None,
+    )
+
+
+@patch("saleor.payment.gateways.stripe.webhooks.handle_successful_payment_intent")
+def test_process_gateway_notifications_replays_stripe_event(
+    handle_successful_payment_intent_mock, stripe_plugin, channel_USD
+):
+    # given
+    plugin = stripe_plugin()
+    payload = _stripe_event_payload(
+        "evt_1",
+        WEBHOOK_SUCCESS_EVENT,
+        {"id": "pi_1", "object": "payment_intent", "amount_received": 1000},
+    )
+    notification = PaymentGatewayNotification.objects.create(
+        gateway=PLUGIN_ID,
+        channel_slug=channel_USD.slug,
+        event_id="evt_1",
+        psp_reference="pi_1",
+        payload=payload,
+    )
+
+    # when
+    process_gateway_notifications(PLUGIN_ID, channel_USD.slug, "pi_1")
+
+    # then
+    handle_successful_payment_intent_mock.assert_called_once()
+    payment_intent, gateway_config, channel_slug = (
+        handle_successful_payment_intent_mock.call_args.args
+    )
+    assert payment_intent.id == "pi_1"
+    assert payment_intent.amount_received == 1000
+    assert gateway_config == plugin.config
+    assert channel_slug == channel_USD.slug
+    notification.refresh_from_db()
+    assert notification.processed_at
+    assert notification.error is None
@@ -1,7 +1,9 @@
+import json
 import logging
 from typing import Optional, cast
 
 import stripe
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.handlers.wsgi import WSGIRequest
 from django.db.models import Prefetch
@@ -22,6 +24,7 @@ from ... import ChargeStatus, TransactionKind
 from ...gateway import payment_refund_or_void
 from ...interface import GatewayConfig, GatewayResponse
 from ...models import Payment, Transaction
+from ...notification_inbox import store_gateway_notification
 from ...utils import (
     create_transaction,
     gateway_postprocess,
@@ -31,6 +34,7 @@ from ...utils import (
     update_payment_method_details,
 )
 from .consts import (
+    PLUGIN_ID,
     WEBHOOK_AUTHORIZED_EVENT,
     WEBHOOK_CANCELED_EVENT,
     WEBHOOK_FAILED_EVENT,
@@ -80,6 +84,35 @@ def handle_webhook(
         logger.warning("Invalid signature for Stripe webhook", extra={"error": str(e)})
         return HttpResponse(status=400)
 
+    if settings.ENABLE_PAYMENT_NOTIFICATIONS_INBOX:
+        # Refund events contain a charge object, other handled events contain
+        # the payment intent itself.
+        event_object = event.data.object
+        payment_intent_id = (
+            getattr(event_object, "payment_intent", None) or event_object.id
+        )
+        store_gateway_notification(
+            gateway=PLUGIN_ID,
+            channel_slug=channel_slug,
+            event_id=event.id,
+            psp_reference=payment_intent_id,
+            payload=json.loads(payload),
+        )
+        return HttpResponse(status=200)
+
+    _process_event(event, gateway_config, channel_slug)
+    return HttpResponse(status=200)
+
+
+def process_notification(
+    payload: dict, gateway_config: "GatewayConfig", channel_slug: str
+):
+    api_key = gateway_config.connection_params["secret_api_key"]
+    event = stripe.Event.construct_from(payload, api_key)
+    _process_event(event, gateway_config, channel_slug)
+
+
+def _process_event(event, gateway_config: "GatewayConfig", channel_slug: str):
     webhook_handlers = {
         WEBHOOK_SUCCESS_EVENT: handle_successful_payment_intent,
         WEBHOOK_AUTHORIZED_EVENT: handle_authorized_payment_intent,
@@ -102,7 +135,6 @@ def handle_webhook(
         logger.warning(
             "Received unhandled webhook events", extra={"event_type": event.type}
         )
-    return HttpResponse(status=200)
 
 
 def _channel_slug_is_different_from_payment_channel_slug(
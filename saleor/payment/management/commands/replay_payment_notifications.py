@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...models import PaymentGatewayNotification
+from ...tasks import process_gateway_notifications_task
+
+
+class Command(BaseCommand):
+    help = (
+        "Schedule processing of stored payment gateway notifications. By default "
+        "only pending notifications are scheduled."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--gateway", type=str, help="ID of the gateway plugin.")
+        parser.add_argument(
+            "--psp-reference", type=str, help="Payment reference to replay."
+        )
+        parser.add_argument(
+            "--ids",
+            type=int,
+            nargs="+",
+            help="IDs of notifications to process again, even if already processed.",
+        )
+        parser.add_argument(
+            "--failed",
+            action="store_true",
+            help="Process again the notifications that failed.",
+        )
+
+    def handle(self, *args, **options):
+        notifications = PaymentGatewayNotification.objects.all()
+        if options["gateway"]:
+            notifications = notifications.filter(gateway=options["gateway"])
+        if options["psp_reference"]:
+            notifications = notifications.filter(psp_reference=options["psp_reference"])
+
+        to_replay = PaymentGatewayNotification.objects.none()
+        if options["ids"]:
+            to_replay |= notifications.filter(pk__in=options["ids"])
+        if options["failed"]:
+            to_replay |= notifications.filter(error__isnull=False)
+        to_replay.update(processed_at=None, error=None)
+
+        references = (
+            notifications.filter(processed_at__isnull=True)
+            .values_list("gateway", "channel_slug", "psp_reference")
+            .order_by()
+            .distinct()
+        )
+        count = 0
+        for gateway, channel_slug, psp_reference in references.iterator():
+            process_gateway_notifications_task.apply_async(
+                kwargs={
+                    "gateway": gateway,
+                    "channel_slug": channel_slug,
+                    "psp_reference": psp_reference,
+                },
+                queue=settings.PAYMENT_NOTIFICATIONS_CELERY_QUEUE_NAME,
+            )
+            count += 1
+        self.stdout.write(f"Scheduled processing of {count} payment references.")
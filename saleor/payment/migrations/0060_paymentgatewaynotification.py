@@ -0,0 +1,60 @@
+# Generated by Django 4.2.15 on 2026-10-19 10:12
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payment", "0059_merge_20240802_1125"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PaymentGatewayNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("gateway", models.CharField(max_length=255)),
+                ("channel_slug", models.CharField(max_length=255)),
+                ("event_id", models.CharField(max_length=512)),
+                ("psp_reference", models.CharField(max_length=512)),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ("pk",),
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("processed_at__isnull", True)),
+                        fields=["gateway", "psp_reference"],
+                        name="payment_notification_ref_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("gateway", "event_id"),
+                        name="unique_payment_gateway_notification",
+                    )
+                ],
+            },
+        ),
+    ]
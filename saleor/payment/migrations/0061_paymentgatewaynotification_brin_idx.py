@@ -0,0 +1,19 @@
+# Generated by Django 4.2.15 on 2026-10-19 14:02
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payment", "0060_paymentgatewaynotification"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="paymentgatewaynotification",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="payment_notification_brin_idx"
+            ),
+        ),
+    ]
@@ -4,7 +4,7 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
@@ -462,3 +462,37 @@ class Transaction(models.Model):
 
     def get_amount(self):
         return Money(self.amount, self.currency)
+
+
+class PaymentGatewayNotification(models.Model):
+    """Webhook notification received from a payment gateway plugin.
+
+    Notifications are stored after their signature is verified and are processed
+    asynchronously, one payment reference at a time, in the order they were received.
+    """
+
+    created_at = models.DateTimeField(default=timezone.now)
+    gateway = models.CharField(max_length=255)
+    channel_slug = models.CharField(max_length=255)
+    event_id = models.CharField(max_length=512)
+    psp_reference = models.CharField(max_length=512)
+    payload = JSONField(encoder=DjangoJSONEncoder)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("pk",)
+        indexes = [
+            models.Index(
+                name="payment_notification_ref_idx",
+                fields=["gateway", "psp_reference"],
+                condition=models.Q(processed_at__isnull=True),
+            ),
+            BrinIndex(fields=["created_at"], name="payment_notification_brin_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["gateway", "event_id"],
+                name="unique_payment_gateway_notification",
+            )
+        ]
@@ -0,0 +1,103 @@
+import logging
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from ..plugins.manager import get_plugins_manager
+from .models import PaymentGatewayNotification
+
+logger = logging.getLogger(__name__)
+
+# Functions that process a stored notification, called with the notification
+# payload, the gateway config and the channel slug.
+NOTIFICATION_PROCESSORS = {
+    "mirumee.payments.adyen": (
+        "saleor.payment.gateways.adyen.webhooks.process_notification"
+    ),
+    "saleor.payments.stripe": (
+        "saleor.payment.gateways.stripe.webhooks.process_notification"
+    ),
+}
+
+
+def store_gateway_notification(
+    gateway: str,
+    channel_slug: str,
+    event_id: str,
+    psp_reference: str,
+    payload: dict[str, Any],
+):
+    """Store the verified notification and schedule its processing.
+
+    Notifications already received with the same event ID are ignored, so the
+    retries of the payment gateway are not processed twice.
+    """
+    from .tasks import process_gateway_notifications_task
+
+    PaymentGatewayNotification.objects.bulk_create(
+        [
+            PaymentGatewayNotification(
+                gateway=gateway,
+                channel_slug=channel_slug,
+                event_id=event_id,
+                psp_reference=psp_reference,
+                payload=payload,
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    transaction.on_commit(
+        lambda: process_gateway_notifications_task.apply_async(
+            kwargs={
+                "gateway": gateway,
+                "channel_slug": channel_slug,
+                "psp_reference": psp_reference,
+            },
+            queue=settings.PAYMENT_NOTIFICATIONS_CELERY_QUEUE_NAME,
+        )
+    )
+
+
+def process_gateway_notifications(gateway: str, channel_slug: str, psp_reference: str):
+    """Process pending notifications of the payment reference in received order.
+
+    The oldest pending notification is locked while it is processed, so workers
+    handling the same payment reference wait for each other, while notifications of
+    other payments are processed in parallel.
+    """
+    manager = get_plugins_manager(allow_replica=False)
+    plugin = manager.get_plugin(gateway, channel_slug)
+    if not plugin or not plugin.active:
+        logger.warning(
+            "Payment gateway notifications cannot be processed, plugin is inactive.",
+            extra={"gateway": gateway, "channel_slug": channel_slug},
+        )
+        return
+    process_notification = import_string(NOTIFICATION_PROCESSORS[gateway])
+
+    pending_notifications = PaymentGatewayNotification.objects.filter(
+        gateway=gateway, psp_reference=psp_reference, processed_at__isnull=True
+    ).order_by("pk")
+    while True:
+        with transaction.atomic():
+            notification = pending_notifications.select_for_update().first()
+            if notification is None:
+                return
+            error = None
+            try:
+                with transaction.atomic():
+                    process_notification(
+                        notification.payload, plugin.config, channel_slug
+                    )
+            except Exception as e:
+                logger.exception(
+                    "Processing payment gateway notification failed.",
+                    extra={"gateway": gateway, "notification_id": notification.pk},
+                )
+                error = str(e)
+            notification.processed_at = timezone.now()
+            notification.error = error
+            notification.save(update_fields=["processed_at", "error"])
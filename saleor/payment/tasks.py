@@ -5,18 +5,26 @@ from datetime import datetime
 import pytz
 from django.conf import settings
 from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
 
 from ..celeryconf import app
 from ..channel.models import Channel
 from ..checkout import CheckoutAuthorizeStatus, CheckoutChargeStatus
 from ..checkout.models import Checkout
-from ..payment.models import TransactionEvent, TransactionItem
+from ..payment.models import (
+    PaymentGatewayNotification,
+    TransactionEvent,
+    TransactionItem,
+)
 from ..plugins.manager import get_plugins_manager
 from . import PaymentError, TransactionAction, TransactionEventType
 from .gateway import request_cancelation_action, request_refund_action
+from .notification_inbox import process_gateway_notifications
 
 logger = logging.getLogger(__name__)
 
+DELETE_NOTIFICATIONS_BATCH_SIZE = 1000
+
 
 def checkouts_with_funds_to_release():
     """Fetch checkouts that are ready release the funds.
@@ -156,3 +164,26 @@ def transaction_release_funds_for_checkout_task():
                         transaction.token,
                         str(e),
                     )
+
+
+@app.task
+def process_gateway_notifications_task(gateway, channel_slug, psp_reference):
+    process_gateway_notifications(gateway, channel_slug, psp_reference)
+
+
+@app.task
+def delete_processed_gateway_notifications_task():
+    """Delete processed notifications older than the retention period in batches.
+
+    The notifications are selected by `created_at` to use its BRIN index. Unprocessed
+    notifications are kept, so they can still be replayed.
+    """
+    delete_period = timezone.now() - settings.PAYMENT_GATEWAY_NOTIFICATIONS_TIMEDELTA
+    ids = list(
+        PaymentGatewayNotification.objects.filter(
+            created_at__lte=delete_period, processed_at__isnull=False
+        ).values_list("pk", flat=True)[:DELETE_NOTIFICATIONS_BATCH_SIZE]
+    )
+    if ids:
+        PaymentGatewayNotification.objects.filter(pk__in=ids).delete()
+        delete_processed_gateway_notifications_task.delay()
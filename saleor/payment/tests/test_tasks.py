@@ -8,7 +8,11 @@ from freezegun import freeze_time
 from ...checkout import CheckoutAuthorizeStatus, CheckoutChargeStatus
 from ...checkout.actions import transaction_amounts_for_checkout_updated
 from .. import TransactionAction, TransactionEventType
-from ..tasks import transaction_release_funds_for_checkout_task
+from ..models import PaymentGatewayNotification
+from ..tasks import (
+    delete_processed_gateway_notifications_task,
+    transaction_release_funds_for_checkout_task,
+)
 
 
 @mock.patch("saleor.payment.tasks.request_cancelation_action")
@@ -381,3 +385,68 @@ def test_transaction_release_funds_for_checkout_task_transaction_with_charge(
         request_event=request_event,
         refund_value=transaction_item.charged_value,
     )
+
+
+@mock.patch("saleor.payment.tasks.delete_processed_gateway_notifications_task.delay")
+@mock.patch("saleor.payment.tasks.DELETE_NOTIFICATIONS_BATCH_SIZE", 2)
+@freeze_time("2021-03-18 12:00:00")
+def test_delete_processed_gateway_notifications_task(delay_mock, settings, channel_USD):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_TIMEDELTA = timedelta(days=5)
+    now = datetime.now(tz=pytz.utc)
+    old_date = now - timedelta(days=6)
+    recent_date = now - timedelta(days=4)
+    notifications = PaymentGatewayNotification.objects.bulk_create(
+        [
+            PaymentGatewayNotification(
+                created_at=created_at,
+                processed_at=processed_at,
+                gateway="gateway",
+                channel_slug=channel_USD.slug,
+                event_id=f"evt_{index}",
+                psp_reference="psp_1",
+                payload={},
+            )
+            for index, (created_at, processed_at) in enumerate(
+                [
+                    (old_date, old_date),
+                    (old_date, old_date),
+                    (old_date, None),
+                    (recent_date, recent_date),
+                ]
+            )
+        ]
+    )
+
+    # when
+    delete_processed_gateway_notifications_task()
+
+    # then
+    assert set(PaymentGatewayNotification.objects.values_list("pk", flat=True)) == {
+        notifications[2].pk,
+        notifications[3].pk,
+    }
+    delay_mock.assert_called_once_with()
+
+
+@mock.patch("saleor.payment.tasks.delete_processed_gateway_notifications_task.delay")
+def test_delete_processed_gateway_notifications_task_nothing_to_delete(
+    delay_mock, settings, channel_USD
+):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_TIMEDELTA = timedelta(days=5)
+    PaymentGatewayNotification.objects.create(
+        processed_at=datetime.now(tz=pytz.utc),
+        gateway="gateway",
+        channel_slug=channel_USD.slug,
+        event_id="evt_1",
+        psp_reference="psp_1",
+        payload={},
+    )
+
+    # when
+    delete_processed_gateway_notifications_task()
+
+    # then
+    assert PaymentGatewayNotification.objects.exists()
+    delay_mock.assert_not_called()
@@ -663,7 +663,7 @@ def test_create_transaction_event_from_request_updates_order_charge(
     order.refresh_from_db()
     assert order.total_charged_amount == Decimal(event_amount)
     assert order.charge_status == OrderChargeStatus.PARTIAL
-    assert order.search_vector
+    assert order.search_index_dirty
 
 
 @patch("saleor.plugins.manager.PluginsManager.order_paid")
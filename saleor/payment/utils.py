@@ -30,7 +30,6 @@ from ..core.tracing import traced_atomic_transaction
 from ..graphql.core.utils import str_to_enum
 from ..order.fetch import fetch_order_info
 from ..order.models import Order, OrderGrantedRefund
-from ..order.search import update_order_search_vector
 from ..order.utils import (
     calculate_order_granted_refund_status,
     update_order_authorize_data,
@@ -1163,7 +1162,7 @@ def _get_parsed_transaction_action_data(
 def update_order_with_transaction_details(transaction: TransactionItem):
     if transaction.order_id:
         order = cast(Order, transaction.order)
-        update_order_search_vector(order, save=False)
+        order.search_index_dirty = True
         updates_amounts_for_order(order, save=False)
         order.save(
             update_fields=[
@@ -1172,7 +1171,7 @@ def update_order_with_transaction_details(transaction: TransactionItem):
                 "updated_at",
                 "total_authorized_amount",
                 "authorize_status",
-                "search_vector",
+                "search_index_dirty",
             ]
         )
 
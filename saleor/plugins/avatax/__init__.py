@@ -27,6 +27,7 @@ from ...order.utils import (
     log_address_if_validation_skipped_for_order,
 )
 from ...shipping.models import ShippingMethod
+from ...tax.cache import get_or_fetch_tax_result
 from ...tax.utils import get_charge_taxes_for_checkout
 from ...warehouse.models import Warehouse
 
@@ -596,13 +597,42 @@ def get_cached_response_or_fetch(
         return None
     data_cache_key = CACHE_KEY + token_in_cache
     cached_data = cache.get(data_cache_key)
-    if taxes_need_new_fetch(data, cached_data) or force_refresh:
+    if force_refresh or not _is_shareable_request_data(data):
         response = _fetch_new_taxes_data(data, data_cache_key, config)
+    elif taxes_need_new_fetch(data, cached_data):
+        response = get_or_fetch_tax_result(
+            "avatax",
+            get_shared_cache_data(data, config),
+            lambda: _fetch_new_taxes_data(data, data_cache_key, config),
+            is_valid_result=lambda response: "error" not in response,
+        )
     else:
         _, response = cached_data
     return response
 
 
+def _is_shareable_request_data(data: dict[str, dict]) -> bool:
+    # Only the sales order transactions are not recorded by Avalara, the responses
+    # for other transaction types can't be shared between checkouts and orders.
+    return data["createTransactionModel"]["type"] == TransactionType.ORDER
+
+
+def get_shared_cache_data(data: dict[str, dict], config: AvataxConfiguration) -> dict:
+    """Return the request data without the fields identifying the transaction.
+
+    Taxes don't depend on the transaction code or the customer email, so requests
+    with the same lines and addresses share the response.
+    """
+    transaction_data = data["createTransactionModel"].copy()
+    transaction_data.pop("code", None)
+    transaction_data.pop("email", None)
+    return {
+        "account": config.username_or_account,
+        "use_sandbox": config.use_sandbox,
+        "createTransactionModel": transaction_data,
+    }
+
+
 def get_checkout_tax_data(
     checkout_info: "CheckoutInfo",
     lines_info: Iterable["CheckoutLineInfo"],
@@ -1,12 +1,20 @@
+from copy import deepcopy
+from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import ANY, Mock, patch
+from uuid import uuid4
 
 from django.test import override_settings
 from prices import Money, TaxedMoney
 
 from ....checkout.fetch import fetch_checkout_lines
 from ...manager import get_plugins_manager
-from .. import CACHE_KEY, generate_request_data_from_checkout
+from .. import (
+    CACHE_KEY,
+    TransactionType,
+    generate_request_data_from_checkout,
+    get_cached_response_or_fetch,
+)
 from ..plugin import AvataxPlugin
 
 
@@ -707,3 +715,64 @@ def test_get_checkout_shipping_tax_rate_save_avatax_response_in_cache(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
     mocked_avalara.assert_called_once_with(ANY, avalara_request_data, plugin.config)
+
+
+@override_settings(TAX_RESULT_CACHE_TIMEOUT=timedelta(minutes=5))
+@patch("saleor.plugins.avatax.api_post_request")
+def test_get_cached_response_or_fetch_shares_response_between_checkouts(
+    mock_api_post_request,
+    checkout_with_items_and_shipping,
+    checkout_with_items_and_shipping_info,
+    avatax_config,
+    avalara_response_for_checkout_with_items_and_shipping,
+):
+    # given
+    checkout_info = checkout_with_items_and_shipping_info
+    lines, _ = fetch_checkout_lines(checkout_with_items_and_shipping)
+    mock_api_post_request.return_value = (
+        avalara_response_for_checkout_with_items_and_shipping
+    )
+    data = generate_request_data_from_checkout(checkout_info, lines, avatax_config)
+    other_checkout_data = deepcopy(data)
+    other_checkout_data["createTransactionModel"]["code"] = str(uuid4())
+    other_checkout_data["createTransactionModel"]["email"] = "other@example.com"
+
+    # when
+    response = get_cached_response_or_fetch(data, str(uuid4()), avatax_config)
+    other_checkout_response = get_cached_response_or_fetch(
+        other_checkout_data, str(uuid4()), avatax_config
+    )
+
+    # then
+    assert response == other_checkout_response
+    mock_api_post_request.assert_called_once_with(ANY, data, avatax_config)
+
+
+@override_settings(TAX_RESULT_CACHE_TIMEOUT=timedelta(minutes=5))
+@patch("saleor.plugins.avatax.api_post_request")
+def test_get_cached_response_or_fetch_does_not_share_invoice_response(
+    mock_api_post_request,
+    checkout_with_items_and_shipping,
+    checkout_with_items_and_shipping_info,
+    avatax_config,
+    avalara_response_for_checkout_with_items_and_shipping,
+):
+    # given
+    checkout_info = checkout_with_items_and_shipping_info
+    lines, _ = fetch_checkout_lines(checkout_with_items_and_shipping)
+    mock_api_post_request.return_value = (
+        avalara_response_for_checkout_with_items_and_shipping
+    )
+    data = generate_request_data_from_checkout(
+        checkout_info,
+        lines,
+        avatax_config,
+        transaction_type=TransactionType.INVOICE,
+    )
+
+    # when
+    get_cached_response_or_fetch(data, str(uuid4()), avatax_config)
+    get_cached_response_or_fetch(data, str(uuid4()), avatax_config)
+
+    # then
+    assert mock_api_post_request.call_count == 2
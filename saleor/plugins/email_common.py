@@ -2,6 +2,7 @@ import logging
 import operator
 import os
 import re
+import smtplib
 from dataclasses import asdict, dataclass
 from decimal import Decimal, InvalidOperation
 from email.headerregistry import Address
@@ -18,6 +19,7 @@ from django.core.mail.backends.smtp import EmailBackend
 from django.core.validators import EmailValidator
 from django_prices.utils.locale import get_locale_data
 
+from ..core.utils.cache import CacheDict
 from ..thumbnail.utils import get_thumbnail_size
 from .base_plugin import ConfigurationTypeField
 from .error_codes import PluginErrorCode
@@ -38,6 +40,8 @@ DEFAULT_TEMPLATE_HELP_TEXT = (
 DEFAULT_SUBJECT_HELP_TEXT = "An email subject built with Handlebars template language."
 DEFAULT_EMAIL_VALUE = "DEFAULT"
 DEFAULT_EMAIL_TIMEOUT = 5
+EMAIL_BACKENDS_CACHE_SIZE = 16
+COMPILED_TEMPLATES_CACHE_SIZE = 256
 
 
 @dataclass
@@ -185,6 +189,78 @@ def price(this, net_amount, gross_amount, currency, display_gross=False):
     return pybars.strlist([formatted_price])
 
 
+class PersistentEmailBackend(EmailBackend):
+    """SMTP backend that keeps its connection open between sent messages.
+
+    The connection is checked with NOOP before it is reused, and opened again when
+    the server has closed it in the meantime.
+    """
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+        with self._lock:
+            if self.connection and not self._is_connection_alive():
+                self.close()
+            self.open()
+            return super().send_messages(email_messages)
+
+    def close(self):
+        # the backend can be evicted from the cache while another thread sends
+        with self._lock:
+            super().close()
+
+    def _is_connection_alive(self) -> bool:
+        try:
+            return self.connection.noop()[0] == 250
+        except smtplib.SMTPException:
+            return False
+
+
+def _close_email_backend(key, email_backend: EmailBackend):
+    email_backend.close()
+
+
+_email_backends: CacheDict = CacheDict(
+    EMAIL_BACKENDS_CACHE_SIZE, on_evict=_close_email_backend
+)
+_compiled_templates: CacheDict = CacheDict(COMPILED_TEMPLATES_CACHE_SIZE)
+
+
+def get_email_backend(config: EmailConfig) -> EmailBackend:
+    """Return the process-wide SMTP backend for the given configuration."""
+    key = (
+        config.host,
+        config.port,
+        config.username,
+        config.password,
+        config.use_ssl,
+        config.use_tls,
+    )
+    email_backend = _email_backends.get(key)
+    if email_backend is None:
+        email_backend = PersistentEmailBackend(
+            host=config.host,
+            port=config.port,
+            username=config.username,
+            password=config.password,
+            use_ssl=config.use_ssl,
+            use_tls=config.use_tls,
+            timeout=DEFAULT_EMAIL_TIMEOUT,
+        )
+        _email_backends[key] = email_backend
+    return email_backend
+
+
+def compile_template(template_str: str):
+    """Return the compiled Handlebars template, compiling each template once."""
+    template = _compiled_templates.get(template_str)
+    if template is None:
+        template = pybars.Compiler().compile(template_str)
+        _compiled_templates[template_str] = template
+    return template
+
+
 def send_email(
     config: EmailConfig, recipient_list, context, subject="", template_str=""
 ):
@@ -193,18 +269,9 @@ def send_email(
 
     from_email = str(Address(sender_name, addr_spec=sender_address))
 
-    email_backend = EmailBackend(
-        host=config.host,
-        port=config.port,
-        username=config.username,
-        password=config.password,
-        use_ssl=config.use_ssl,
-        use_tls=config.use_tls,
-        timeout=DEFAULT_EMAIL_TIMEOUT,
-    )
-    compiler = pybars.Compiler()
-    template = compiler.compile(template_str)
-    subject_template = compiler.compile(subject)
+    email_backend = get_email_backend(config)
+    template = compile_template(template_str)
+    subject_template = compile_template(subject)
     helpers = {
         "format_address": format_address,
         "price": price,
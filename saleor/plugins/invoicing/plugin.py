@@ -2,6 +2,7 @@ from typing import Any, Optional
 from uuid import uuid4
 
 from django.core.files.base import ContentFile
+from django.db import transaction
 from django.utils.text import slugify
 
 from ...core import JobStatus
@@ -25,8 +26,10 @@ class InvoicingPlugin(BasePlugin):
         number: Optional[str],
         previous_value: Any,
     ) -> Any:
-        invoice_number = generate_invoice_number()
-        invoice.update_invoice(number=invoice_number)
+        with transaction.atomic():
+            invoice_number = generate_invoice_number()
+            invoice.update_invoice(number=invoice_number)
+            invoice.save(update_fields=["number", "updated_at"])
         file_content, creation_date = generate_invoice_pdf(invoice)
         invoice.created = creation_date
         slugified_invoice_number = slugify(invoice_number)
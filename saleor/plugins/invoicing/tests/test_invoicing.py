@@ -9,6 +9,7 @@ from ..utils import (
     generate_invoice_number,
     generate_invoice_pdf,
     get_gift_cards_payment_amount,
+    get_invoice_stylesheet,
     get_product_limit_first_page,
     make_full_invoice_number,
 )
@@ -49,6 +50,33 @@ def test_generate_invoice_pdf_for_order(fulfilled_order, customer_user, gift_car
     assert content
 
 
+def test_generate_invoice_pdf_reuses_stylesheet(fulfilled_order):
+    # given
+    invoice = fulfilled_order.invoices.first()
+    generate_invoice_pdf(invoice)
+    stylesheet, font_config = get_invoice_stylesheet()
+
+    # when
+    content, _ = generate_invoice_pdf(invoice)
+
+    # then
+    assert content
+    assert get_invoice_stylesheet() == (stylesheet, font_config)
+
+
+def test_generate_invoice_number_increments_last_number(fulfilled_order):
+    # given
+    invoice = fulfilled_order.invoices.last()
+    invoice.number = make_full_invoice_number()
+    invoice.save(update_fields=["number"])
+
+    # when
+    number = generate_invoice_number()
+
+    # then
+    assert number == f"2/{invoice.number.split('/', 1)[1]}"
+
+
 def test_generate_invoice_number_invalid_numeration(fulfilled_order):
     invoice = fulfilled_order.invoices.last()
     invoice.number = "invalid/06/2020"
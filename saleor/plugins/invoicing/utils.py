@@ -2,12 +2,15 @@ import os
 import re
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
 import pytz
 from django.conf import settings
+from django.db import connection
 from django.template.loader import get_template
 from prices import Money
-from weasyprint import HTML
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 
 from ...giftcard import GiftCardEvents
 from ...giftcard.models import GiftCardEvent
@@ -17,6 +20,9 @@ MAX_PRODUCTS_WITH_TABLE = 3
 MAX_PRODUCTS_WITHOUT_TABLE = 4
 MAX_PRODUCTS_PER_PAGE = 13
 
+# Key of the PostgreSQL advisory lock that serializes invoice number allocation.
+INVOICE_NUMBER_LOCK_ID = 0x1A7015E
+
 
 def make_full_invoice_number(number=None, month=None, year=None):
     now = datetime.now()
@@ -38,6 +44,14 @@ def parse_invoice_dates(number: str):
 
 
 def generate_invoice_number():
+    """Return the number for a new invoice.
+
+    Should be called in the transaction that saves the invoice with the returned
+    number, concurrent calls wait until that transaction ends so they don't return
+    the same number.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", [INVOICE_NUMBER_LOCK_ID])
     last_invoice = Invoice.objects.filter(number__isnull=False).last()
     if not last_invoice or not last_invoice.number:
         return make_full_invoice_number()
@@ -81,11 +95,27 @@ def get_gift_cards_payment_amount(order):
     return Money(total_paid, order.currency)
 
 
-def generate_invoice_pdf(invoice):
+@lru_cache(maxsize=1)
+def get_invoice_stylesheet() -> tuple[CSS, FontConfiguration]:
+    """Return the parsed invoice stylesheet and the font configuration it uses.
+
+    Both are created once per process, so the stylesheet isn't parsed and the font
+    isn't loaded again for every generated invoice.
+    """
     font_path = os.path.join(
         settings.PROJECT_ROOT, "templates", "invoices", "inter.ttf"
     )
+    font_config = FontConfiguration()
+    stylesheet = CSS(
+        string=get_template("invoices/invoice.css").render(
+            {"font_path": f"file://{font_path}"}
+        ),
+        font_config=font_config,
+    )
+    return stylesheet, font_config
+
 
+def generate_invoice_pdf(invoice):
     all_products = invoice.order.lines.all()
 
     product_limit_first_page = get_product_limit_first_page(all_products)
@@ -103,9 +133,12 @@ def generate_invoice_pdf(invoice):
             "creation_date": creation_date.strftime("%d %b %Y"),
             "order": order,
             "gift_cards_payment": gift_cards_payment,
-            "font_path": f"file://{font_path}",
             "products_first_page": products_first_page,
             "rest_of_products": rest_of_products,
         }
     )
-    return HTML(string=rendered_template).write_pdf(), creation_date
+    stylesheet, font_config = get_invoice_stylesheet()
+    pdf = HTML(string=rendered_template).write_pdf(
+        stylesheets=[stylesheet], font_config=font_config
+    )
+    return pdf, creation_date
@@ -1,5 +1,6 @@
 import json
-from unittest.mock import patch
+import smtplib
+from unittest.mock import Mock, patch
 
 import pytest
 from django.core.exceptions import ValidationError
@@ -7,7 +8,12 @@ from django.core.exceptions import ValidationError
 from ...order.notifications import get_image_payload
 from ..email_common import (
     DEFAULT_EMAIL_CONFIGURATION,
+    EMAIL_BACKENDS_CACHE_SIZE,
+    EmailConfig,
+    compile_template,
+    get_email_backend,
     get_product_image_thumbnail,
+    send_email,
     validate_default_email_configuration,
 )
 from ..error_codes import PluginErrorCode
@@ -125,3 +131,100 @@ def test_get_product_image_thumbnail_image_missing(product_with_image):
 
     # then
     assert thumbnail is None
+
+
+def test_compile_template_reuses_compiled_template():
+    # when
+    template = compile_template("<p>{{ name }}</p>")
+
+    # then
+    assert compile_template("<p>{{ name }}</p>") is template
+    assert compile_template("<p>{{ other }}</p>") is not template
+    assert template({"name": "Saleor"}) == "<p>Saleor</p>"
+
+
+@patch("saleor.plugins.email_common.PersistentEmailBackend.open")
+def test_get_email_backend_reuses_backend_for_same_config(mocked_open):
+    # given
+    config = EmailConfig(host="smtp.example.com", port="25", username="user-1")
+
+    # when
+    email_backend = get_email_backend(config)
+
+    # then
+    assert get_email_backend(config) is email_backend
+    assert (
+        get_email_backend(
+            EmailConfig(host="smtp.example.com", port="25", username="user-2")
+        )
+        is not email_backend
+    )
+
+
+@patch("django.core.mail.backends.smtp.smtplib.SMTP")
+def test_evicted_email_backend_closes_smtp_connection(mocked_smtp):
+    # given
+    connection = mocked_smtp.return_value
+    email_backend = get_email_backend(
+        EmailConfig(host="smtp-evicted.example.com", port="25")
+    )
+    email_backend.open()
+
+    # when
+    for index in range(EMAIL_BACKENDS_CACHE_SIZE):
+        get_email_backend(EmailConfig(host=f"smtp-{index}.example.com", port="25"))
+
+    # then
+    connection.quit.assert_called_once()
+    assert email_backend.connection is None
+
+
+@patch("django.core.mail.backends.smtp.smtplib.SMTP")
+def test_send_email_reuses_smtp_connection(mocked_smtp):
+    # given
+    connection = mocked_smtp.return_value
+    connection.noop.return_value = (250, b"OK")
+    connection.sendmail.return_value = {}
+    config = EmailConfig(
+        host="smtp-reuse.example.com",
+        port="25",
+        sender_address="noreply@example.com",
+    )
+
+    # when
+    for _ in range(3):
+        send_email(
+            config, ["customer@example.com"], {"name": "Saleor"}, "Hi", "{{ name }}"
+        )
+
+    # then
+    mocked_smtp.assert_called_once()
+    assert connection.sendmail.call_count == 3
+    connection.quit.assert_not_called()
+
+
+@patch("django.core.mail.backends.smtp.smtplib.SMTP")
+def test_send_email_reopens_closed_smtp_connection(mocked_smtp):
+    # given
+    closed_connection = Mock()
+    closed_connection.sendmail.return_value = {}
+    closed_connection.noop.side_effect = smtplib.SMTPServerDisconnected()
+    new_connection = Mock()
+    new_connection.sendmail.return_value = {}
+    mocked_smtp.side_effect = [closed_connection, new_connection]
+    config = EmailConfig(
+        host="smtp-reopen.example.com",
+        port="25",
+        sender_address="noreply@example.com",
+    )
+
+    # when
+    for _ in range(2):
+        send_email(
+            config, ["customer@example.com"], {"name": "Saleor"}, "Hi", "{{ name }}"
+        )
+
+    # then
+    assert mocked_smtp.call_count == 2
+    closed_connection.sendmail.assert_called_once()
+    new_connection.sendmail.assert_called_once()
@@ -21,7 +21,10 @@ from ...core.utils import build_absolute_uri
 from ...core.utils.json_serializer import CustomJsonEncoder
 from ...csv.notifications import get_default_export_payload
 from ...graphql.core.context import SaleorContext
-from ...graphql.webhook.subscription_payload import initialize_request
+from ...graphql.webhook.subscription_payload import (
+    generate_payload_from_subscription,
+    initialize_request,
+)
 from ...graphql.webhook.utils import get_pregenerated_subscription_payload
 from ...payment import PaymentError, TransactionKind
 from ...payment.interface import (
@@ -50,6 +53,7 @@ from ...payment.utils import (
     recalculate_refundable_for_checkout,
 )
 from ...settings import WEBHOOK_SYNC_TIMEOUT
+from ...tax.cache import get_or_fetch_tax_result
 from ...thumbnail.models import Thumbnail
 from ...webhook.const import WEBHOOK_CACHE_DEFAULT_TIMEOUT
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
@@ -82,6 +86,7 @@ from ...webhook.payloads import (
     generate_translation_payload,
 )
 from ...webhook.transport.asynchronous.transport import (
+    get_queue_name_for_webhook,
     send_webhook_request_async,
     trigger_webhooks_async,
 )
@@ -99,6 +104,7 @@ from ...webhook.transport.shipping import (
     parse_list_shipping_methods_response,
 )
 from ...webhook.transport.synchronous.transport import (
+    run_sync_webhook_calls,
     trigger_all_webhooks_sync,
     trigger_webhook_sync,
     trigger_webhook_sync_if_not_cached,
@@ -2453,7 +2459,12 @@ class WebhookPlugin(BasePlugin):
         if not self.active:
             return previous_value
         delivery_update(delivery, status=EventDeliveryStatus.PENDING)
-        send_webhook_request_async.delay(delivery.pk)
+        send_webhook_request_async.apply_async(
+            kwargs={"event_delivery_id": delivery.pk},
+            queue=get_queue_name_for_webhook(
+                delivery.webhook, settings.WEBHOOK_CELERY_QUEUE_NAME
+            ),
+        )
 
     def stored_payment_method_request_delete(
         self,
@@ -3147,17 +3158,48 @@ class WebhookPlugin(BasePlugin):
         pregenerated_subscription_payload = get_pregenerated_subscription_payload(
             webhook, pregenerated_subscription_payloads
         )
-        response = trigger_webhook_sync(
-            event_type=event_type,
-            webhook=webhook,
-            payload=payload_gen(),
-            allow_replica=False,
-            subscribable_object=subscriptable_object,
-            request=request_context,
-            requestor=self.requestor,
-            pregenerated_subscription_payload=pregenerated_subscription_payload,
+        payload = None
+        use_tax_result_cache = (
+            event_type == WebhookEventSyncType.CHECKOUT_CALCULATE_TAXES
+            and settings.TAX_RESULT_CACHE_TIMEOUT
+        )
+        if use_tax_result_cache:
+            # The payload is generated upfront as it is the key of the tax result
+            # shared between checkouts.
+            if not webhook.subscription_query:
+                payload = payload_gen()
+            elif not pregenerated_subscription_payload:
+                pregenerated_subscription_payload = generate_payload_from_subscription(
+                    event_type=event_type,
+                    subscribable_object=subscriptable_object,
+                    subscription_query=webhook.subscription_query,
+                    request=request_context,
+                    app=app,
+                )
+
+        def fetch_tax_data():
+            response = trigger_webhook_sync(
+                event_type=event_type,
+                webhook=webhook,
+                payload=payload if payload is not None else payload_gen(),
+                allow_replica=False,
+                subscribable_object=subscriptable_object,
+                request=request_context,
+                requestor=self.requestor,
+                pregenerated_subscription_payload=pregenerated_subscription_payload,
+            )
+            return parse_tax_data(response)
+
+        if not use_tax_result_cache:
+            return fetch_tax_data()
+        return get_or_fetch_tax_result(
+            app.identifier or str(app.id),
+            {
+                "target_url": webhook.target_url,
+                "payload": pregenerated_subscription_payload or payload,
+            },
+            fetch_tax_data,
         )
-        return parse_tax_data(response)
 
     def get_taxes_for_checkout(
         self,
@@ -3222,19 +3264,25 @@ class WebhookPlugin(BasePlugin):
         if webhooks:
             payload = generate_checkout_payload(checkout, self.requestor)
             cache_data = get_cache_data_for_shipping_list_methods_for_checkout(payload)
-            for webhook in webhooks:
-                response_data = trigger_webhook_sync_if_not_cached(
-                    event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    payload=payload,
-                    webhook=webhook,
-                    cache_data=cache_data,
-                    allow_replica=self.allow_replica,
-                    subscribable_object=checkout,
-                    request_timeout=WEBHOOK_SYNC_TIMEOUT,
-                    cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    requestor=self.requestor,
-                )
-
+            webhooks = list(webhooks)
+            responses = run_sync_webhook_calls(
+                [
+                    partial(
+                        trigger_webhook_sync_if_not_cached,
+                        event_type=event_type,
+                        payload=payload,
+                        webhook=webhook,
+                        cache_data=cache_data,
+                        allow_replica=self.allow_replica,
+                        subscribable_object=checkout,
+                        request_timeout=WEBHOOK_SYNC_TIMEOUT,
+                        cache_timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
+                        requestor=self.requestor,
+                    )
+                    for webhook in webhooks
+                ]
+            )
+            for webhook, response_data in zip(webhooks, responses):
                 if response_data:
                     shipping_methods = parse_list_shipping_methods_response(
                         response_data, webhook.app
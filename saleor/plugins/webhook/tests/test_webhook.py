@@ -49,6 +49,11 @@ from ....webhook.payloads import (
 )
 from ....webhook.transport import signature_for_payload
 from ....webhook.transport.asynchronous.transport import (
+    WEBHOOK_APP_CONCURRENCY_MAX_POSTPONES,
+    WEBHOOK_APP_CONCURRENCY_POSTPONE_DELAY,
+    WEBHOOK_APP_CONCURRENCY_TIMEOUT,
+    acquire_app_delivery_slot,
+    release_app_delivery_slot,
     send_webhook_request_async,
     trigger_webhooks_async,
 )
@@ -1945,17 +1950,40 @@ def test_sale_toggle(
     )
 
 
-@mock.patch("saleor.plugins.webhook.plugin.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.plugin.send_webhook_request_async.apply_async")
 def test_event_delivery_retry(mocked_webhook_send, event_delivery, settings):
     # given
     settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    settings.WEBHOOK_CELERY_QUEUE_NAME = "webhooks"
     manager = get_plugins_manager(allow_replica=False)
 
     # when
     manager.event_delivery_retry(event_delivery)
 
     # then
-    mocked_webhook_send.assert_called_once_with(event_delivery.pk)
+    mocked_webhook_send.assert_called_once_with(
+        kwargs={"event_delivery_id": event_delivery.pk}, queue="webhooks"
+    )
+
+
+@mock.patch("saleor.plugins.webhook.plugin.send_webhook_request_async.apply_async")
+def test_event_delivery_retry_uses_app_queue_shard(
+    mocked_webhook_send, event_delivery, settings
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    settings.WEBHOOK_CELERY_QUEUE_NAME = "webhooks"
+    settings.WEBHOOK_CELERY_QUEUE_SHARDS = 4
+    manager = get_plugins_manager(allow_replica=False)
+    shard = event_delivery.webhook.app_id % 4
+
+    # when
+    manager.event_delivery_retry(event_delivery)
+
+    # then
+    mocked_webhook_send.assert_called_once_with(
+        kwargs={"event_delivery_id": event_delivery.pk}, queue=f"webhooks-{shard}"
+    )
 
 
 @mock.patch(
@@ -2021,6 +2049,121 @@ def test_send_webhook_request_async_with_custom_headers(
     assert custom_headers in mocked_send_response.call_args[0]
 
 
+def test_acquire_app_delivery_slot_respects_max_concurrency(settings, app):
+    # given
+    settings.WEBHOOK_APP_MAX_CONCURRENCY = 2
+    acquire_app_delivery_slot(app.id)
+    acquire_app_delivery_slot(app.id)
+
+    # when
+    acquired = acquire_app_delivery_slot(app.id)
+    release_app_delivery_slot(app.id)
+    acquired_after_release = acquire_app_delivery_slot(app.id)
+
+    # then
+    assert acquired is False
+    assert acquired_after_release is True
+
+
+@mock.patch("saleor.webhook.transport.asynchronous.transport.cache.touch")
+def test_acquire_app_delivery_slot_refreshes_counter_timeout(
+    mocked_touch, settings, app
+):
+    # given
+    settings.WEBHOOK_APP_MAX_CONCURRENCY = 2
+    acquire_app_delivery_slot(app.id)
+
+    # when
+    acquired = acquire_app_delivery_slot(app.id)
+
+    # then
+    assert acquired is True
+    mocked_touch.assert_called_once_with(
+        f"webhook_app_concurrency_{app.id}", WEBHOOK_APP_CONCURRENCY_TIMEOUT
+    )
+    release_app_delivery_slot(app.id)
+    release_app_delivery_slot(app.id)
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_postponed_when_app_at_max_concurrency(
+    mocked_send_response, mocked_apply_async, event_delivery, settings
+):
+    # given
+    settings.WEBHOOK_APP_MAX_CONCURRENCY = 1
+    settings.WEBHOOK_CELERY_QUEUE_NAME = "webhooks"
+    app_id = event_delivery.webhook.app_id
+    assert acquire_app_delivery_slot(app_id)
+
+    # when
+    send_webhook_request_async(event_delivery.pk)
+
+    # then
+    mocked_send_response.assert_not_called()
+    mocked_apply_async.assert_called_once_with(
+        kwargs={"event_delivery_id": event_delivery.pk, "postpone_count": 1},
+        queue="webhooks",
+        countdown=WEBHOOK_APP_CONCURRENCY_POSTPONE_DELAY,
+    )
+    assert not EventDeliveryAttempt.objects.filter(delivery=event_delivery).exists()
+    release_app_delivery_slot(app_id)
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_request_async.apply_async"
+)
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_sent_after_max_postpones(
+    mocked_send_response,
+    mocked_apply_async,
+    event_delivery,
+    webhook_response,
+    settings,
+):
+    # given
+    settings.WEBHOOK_APP_MAX_CONCURRENCY = 1
+    mocked_send_response.return_value = webhook_response
+    app_id = event_delivery.webhook.app_id
+    assert acquire_app_delivery_slot(app_id)
+
+    # when
+    send_webhook_request_async(
+        event_delivery.pk, postpone_count=WEBHOOK_APP_CONCURRENCY_MAX_POSTPONES
+    )
+
+    # then
+    mocked_apply_async.assert_not_called()
+    mocked_send_response.assert_called_once()
+    assert not acquire_app_delivery_slot(app_id)
+    release_app_delivery_slot(app_id)
+
+
+@mock.patch(
+    "saleor.webhook.transport.asynchronous.transport.send_webhook_using_scheme_method"
+)
+def test_send_webhook_request_async_releases_app_slot(
+    mocked_send_response, event_delivery, webhook_response, settings
+):
+    # given
+    settings.WEBHOOK_APP_MAX_CONCURRENCY = 1
+    mocked_send_response.return_value = webhook_response
+
+    # when
+    send_webhook_request_async(event_delivery.pk)
+
+    # then
+    mocked_send_response.assert_called_once()
+    assert acquire_app_delivery_slot(event_delivery.webhook.app_id)
+    release_app_delivery_slot(event_delivery.webhook.app_id)
+
+
 @mock.patch("saleor.webhook.observability.utils.report_event_delivery_attempt")
 @mock.patch("saleor.webhook.transport.utils.clear_successful_delivery")
 def test_send_webhook_request_async_when_webhook_is_disabled(
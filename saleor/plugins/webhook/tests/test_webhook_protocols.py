@@ -12,7 +12,10 @@ from requests_hardened import HTTPSession
 from ....core.models import EventDelivery
 from ....webhook.event_types import WebhookEventAsyncType
 from ....webhook.transport import signature_for_payload
-from ....webhook.transport.asynchronous.transport import trigger_webhooks_async
+from ....webhook.transport.asynchronous.transport import (
+    get_queue_name_for_webhook,
+    trigger_webhooks_async,
+)
 
 
 @pytest.mark.parametrize(
@@ -476,3 +479,36 @@ def test_trigger_webhooks_async_pick_up_queue_based_on_protocol(
         retry_backoff=10,
         retry_kwargs={"max_retries": 5},
     )
+
+
+@pytest.mark.parametrize(
+    ("expected_queue_name", "target_url"),
+    [
+        ("PUBSUB_QUEUE-{}", "gcpubsub://cloud.google.com/projects/saleor/topics/test"),
+        ("webhooks-{}", "https://localhost:8888/webhook-endpoint/"),
+    ],
+)
+def test_get_queue_name_for_webhook_with_shards(
+    expected_queue_name, target_url, settings, webhook
+):
+    # given
+    settings.WEBHOOK_CELERY_QUEUE_SHARDS = 4
+    settings.WEBHOOK_PUBSUB_CELERY_QUEUE_NAME = "PUBSUB_QUEUE"
+    webhook.target_url = target_url
+
+    # when
+    queue_name = get_queue_name_for_webhook(webhook, "webhooks")
+
+    # then
+    assert queue_name == expected_queue_name.format(webhook.app_id % 4)
+
+
+def test_get_queue_name_for_webhook_with_shards_and_default_queue(settings, webhook):
+    # given
+    settings.WEBHOOK_CELERY_QUEUE_SHARDS = 2
+
+    # when
+    queue_name = get_queue_name_for_webhook(webhook, None)
+
+    # then
+    assert queue_name == f"celery-{webhook.app_id % 2}"
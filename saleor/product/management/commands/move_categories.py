@@ -0,0 +1,28 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ....plugins.manager import get_plugins_manager
+from ...utils import move_categories
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves categories to new parents in a single transaction. The file maps "
+        "category IDs to IDs of their new parents, or null for top level categories."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("moves_file", help="Path to the JSON file with moves.")
+
+    def handle(self, *args, **options):
+        with open(options["moves_file"]) as moves_file:
+            moves = {
+                int(category_id): int(parent_id) if parent_id is not None else None
+                for category_id, parent_id in json.load(moves_file).items()
+            }
+        try:
+            move_categories(moves, manager=get_plugins_manager(allow_replica=False))
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(f"Moved {len(moves)} categories.")
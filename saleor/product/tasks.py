@@ -236,9 +236,11 @@ def recalculate_discounted_price_for_products_task():
         .filter(discounted_price_dirty=True)
         .order_by("id")[:DISCOUNTED_PRODUCT_BATCH]
     )
-    listing_details = listings.values_list(
-        "id",
-        "product_id",
+    listing_details = list(
+        listings.values_list(
+            "id",
+            "product_id",
+        )
     )
     products_ids = set([product_id for _, product_id in listing_details])
     listing_ids = set([listing_id for listing_id, _ in listing_details])
@@ -1,10 +1,19 @@
+from datetime import datetime
 from unittest.mock import patch
 
+import pytest
+import pytz
+from freezegun import freeze_time
+
 from ...discount.utils.promotion import get_active_catalogue_promotion_rules
 from ...plugins.manager import get_plugins_manager
 from ...tests.utils import flush_post_commit_hooks
 from ..models import Category
-from ..utils import collect_categories_tree_products, delete_categories
+from ..utils import (
+    collect_categories_tree_products,
+    delete_categories,
+    move_categories,
+)
 
 
 def test_collect_categories_tree_products(categories_tree):
@@ -76,3 +85,86 @@ def test_delete_categories_trigger_product_updated_webhook(
     ).exists()
 
     assert len(product_list) == product_updated_mock.call_count
+
+
+def _get_tree_structure():
+    categories = Category.objects.order_by("pk")
+    trees = {}
+    for category in categories:
+        trees.setdefault(category.tree_id, set()).add(category.pk)
+    return (
+        {
+            category.pk: (
+                category.parent_id,
+                category.level,
+                category.lft,
+                category.rght,
+            )
+            for category in categories
+        },
+        sorted(sorted(tree) for tree in trees.values()),
+    )
+
+
+@patch("saleor.plugins.manager.PluginsManager.category_updated")
+def test_move_categories(category_updated_mock, db):
+    # given
+    root = Category.objects.create(name="Root", slug="root")
+    child = Category.objects.create(name="Child", slug="child", parent=root)
+    grandchild = Category.objects.create(
+        name="Grandchild", slug="grandchild", parent=child
+    )
+    Category.objects.create(name="Sibling", slug="sibling", parent=root)
+    other_root = Category.objects.create(name="Other root", slug="other-root")
+    Category.objects.create(name="Other child", slug="other-child", parent=other_root)
+
+    # when
+    move_categories(
+        {grandchild.pk: other_root.pk, child.pk: None, other_root.pk: root.pk},
+        manager=get_plugins_manager(allow_replica=False),
+    )
+
+    # then
+    child.refresh_from_db()
+    grandchild.refresh_from_db()
+    assert child.parent_id is None
+    assert grandchild.parent_id == other_root.pk
+    structure = _get_tree_structure()
+    Category.tree.rebuild()
+    assert structure == _get_tree_structure()
+    assert category_updated_mock.call_count == 3
+
+
+@freeze_time("2024-05-31 12:00:01")
+def test_move_categories_keeps_siblings_order(db):
+    # given
+    root = Category.objects.create(name="Root", slug="root")
+    first_child = Category.objects.create(name="First", slug="first", parent=root)
+    second_child = Category.objects.create(name="Second", slug="second", parent=root)
+    root.refresh_from_db()
+    second_child.move_to(root, "first-child")
+    other_root = Category.objects.create(name="Other root", slug="other-root")
+    moved_child = Category.objects.create(name="Moved", slug="moved", parent=other_root)
+
+    # when
+    move_categories(
+        {moved_child.pk: root.pk}, manager=get_plugins_manager(allow_replica=False)
+    )
+
+    # then
+    children = list(root.get_children().order_by("lft"))
+    assert children == [second_child, first_child, moved_child]
+    moved_child.refresh_from_db()
+    assert moved_child.updated_at == datetime.now(tz=pytz.utc)
+
+
+def test_move_categories_to_descendant(db):
+    # given
+    root = Category.objects.create(name="Root", slug="root")
+    child = Category.objects.create(name="Child", slug="child", parent=root)
+
+    # when & then
+    with pytest.raises(ValueError, match="cannot be moved to its descendant"):
+        move_categories(
+            {root.pk: child.pk}, manager=get_plugins_manager(allow_replica=False)
+        )
@@ -11,7 +11,13 @@ from prices import Money
 
 from ...discount import RewardValueType
 from ...discount.models import Promotion, PromotionRule
-from ...product.models import Product, VariantChannelListingPromotionRule
+from ...product.models import (
+    Product,
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+    VariantChannelListingPromotionRule,
+)
 from ..utils.variant_prices import update_discounted_prices_for_promotion
 
 
@@ -85,6 +91,45 @@ def test_update_discounted_price_for_promotion_discount_on_variant(
     )
 
 
+def test_update_discounted_price_for_promotion_discount_larger_than_price(
+    product, channel_USD
+):
+    # given
+    variant = product.variants.first()
+    variant_channel_listing = variant.channel_listings.get(channel_id=channel_USD.id)
+    variant_price = Money("9.99", "USD")
+    variant_channel_listing.price = variant_price
+    variant_channel_listing.discounted_price = variant_price
+    variant_channel_listing.save()
+
+    promotion = Promotion.objects.create(name="Promotion")
+    rule = promotion.rules.create(
+        name="Fixed promotion rule",
+        promotion=promotion,
+        catalogue_predicate={
+            "variantPredicate": {
+                "ids": [graphene.Node.to_global_id("ProductVariant", variant.id)]
+            }
+        },
+        reward_value_type=RewardValueType.FIXED,
+        reward_value=Decimal("20"),
+    )
+    rule.channels.add(channel_USD)
+    rule.variants.add(variant)
+
+    # when
+    update_discounted_prices_for_promotion(Product.objects.filter(id__in=[product.id]))
+
+    # then
+    product_channel_listing = product.channel_listings.get(channel_id=channel_USD.id)
+    variant_channel_listing.refresh_from_db()
+    assert product_channel_listing.discounted_price_amount == Decimal("0")
+    assert variant_channel_listing.discounted_price_amount == Decimal("0")
+    assert variant_channel_listing.variantlistingpromotionrule.get(
+        promotion_rule=rule
+    ).discount_amount == Decimal("9.99")
+
+
 def test_update_discounted_price_for_promotion_discount_on_product(
     product, channel_USD
 ):
@@ -664,3 +709,75 @@ def test_update_discounted_prices_for_promotion_only_dirty_products(
     )
     second_listing.refresh_from_db()
     assert second_listing.discounted_price_amount == second_channel_discounted_price
+
+
+def test_update_discounted_prices_for_promotion_skips_not_dirty_listings(
+    product_list, channel_USD
+):
+    # given
+    dirty_product, not_dirty_product = product_list[:2]
+    ProductChannelListing.objects.filter(channel=channel_USD).update(
+        discounted_price_amount=Decimal("123"), discounted_price_dirty=False
+    )
+    ProductChannelListing.objects.filter(
+        product=dirty_product, channel=channel_USD
+    ).update(discounted_price_dirty=True)
+
+    # when
+    update_discounted_prices_for_promotion(
+        Product.objects.filter(id__in=[dirty_product.id, not_dirty_product.id]),
+        only_dirty_products=True,
+    )
+
+    # then
+    dirty_listing = dirty_product.channel_listings.get(channel=channel_USD)
+    variant_listing = dirty_product.variants.first().channel_listings.get(
+        channel=channel_USD
+    )
+    assert dirty_listing.discounted_price_amount == variant_listing.price_amount
+    not_dirty_listing = not_dirty_product.channel_listings.get(channel=channel_USD)
+    assert not_dirty_listing.discounted_price_amount == Decimal("123")
+
+
+def test_update_discounted_price_for_promotion_for_many_products(
+    product_list, channel_USD, django_assert_max_num_queries
+):
+    # given
+    variant_listings = ProductVariantChannelListing.objects.filter(
+        channel=channel_USD, variant__product__in=product_list
+    )
+    variant_listings.update(price_amount=Decimal("10"))
+    reward_value = Decimal("10")
+    promotion = Promotion.objects.create(name="Promotion")
+    rule = promotion.rules.create(
+        name="Percentage promotion rule",
+        promotion=promotion,
+        catalogue_predicate={
+            "productPredicate": {
+                "ids": [
+                    graphene.Node.to_global_id("Product", product.id)
+                    for product in product_list
+                ]
+            }
+        },
+        reward_value_type=RewardValueType.PERCENTAGE,
+        reward_value=reward_value,
+    )
+    rule.channels.add(channel_USD)
+    rule.variants.set(ProductVariant.objects.filter(product__in=product_list))
+
+    # when
+    with django_assert_max_num_queries(15):
+        update_discounted_prices_for_promotion(
+            Product.objects.filter(id__in=[product.id for product in product_list])
+        )
+
+    # then
+    for variant_listing in variant_listings:
+        assert variant_listing.discounted_price_amount == Decimal("9")
+        assert variant_listing.variantlistingpromotionrule.get(
+            promotion_rule=rule
+        ).discount_amount == Decimal("1")
+    for product in product_list:
+        product_listing = product.channel_listings.get(channel=channel_USD)
+        assert product_listing.discounted_price_amount == Decimal("9")
@@ -1,5 +1,9 @@
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
+
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
 
 from ...core.taxes import TaxedMoney, zero_taxed_money
 from ...core.tracing import traced_atomic_transaction
@@ -77,6 +81,140 @@ def collect_categories_tree_products(category: "Category") -> "QuerySet[Product]
     return products
 
 
+# Recompute the nested set numbering of the trees starting at the given roots:
+# nodes are numbered in pre-order, so `lft` is the number of `lft` and `rght`
+# values of the preceding nodes, and `rght` follows the `lft` and `rght` values of
+# all descendants. Siblings keep their previous order by `lft` and the moved nodes
+# are appended after them, in the order of their IDs, like the last child inserted
+# by `move_to`. Each level adds a (moved, previous lft, id) triple to the sort key.
+RENUMBER_CATEGORY_TREES_SQL = """
+    WITH RECURSIVE roots(id, tree_id) AS (
+        SELECT * FROM unnest(%(root_ids)s::int[], %(tree_ids)s::int[])
+    ),
+    nodes AS (
+        SELECT
+            c.id,
+            r.tree_id,
+            0 AS level,
+            ARRAY[c.id] AS path,
+            ARRAY[0, 0, c.id] AS sort_key
+        FROM product_category c
+        JOIN roots r ON r.id = c.id
+        UNION ALL
+        SELECT
+            c.id,
+            n.tree_id,
+            n.level + 1,
+            n.path || c.id,
+            n.sort_key || CASE
+                WHEN c.id = ANY(%(moved_ids)s::int[]) THEN ARRAY[1, 0, c.id]
+                ELSE ARRAY[0, c.lft, c.id]
+            END
+        FROM product_category c
+        JOIN nodes n ON c.parent_id = n.id
+    ),
+    subtree_sizes AS (
+        SELECT ancestor_id AS id, COUNT(*) AS size
+        FROM nodes, unnest(nodes.path) AS ancestor_id
+        GROUP BY ancestor_id
+    ),
+    numbered AS (
+        SELECT
+            n.id,
+            n.tree_id,
+            n.level,
+            2 * (ROW_NUMBER() OVER (PARTITION BY n.tree_id ORDER BY n.sort_key) - 1)
+                - n.level + 1 AS lft,
+            s.size
+        FROM nodes n
+        JOIN subtree_sizes s ON s.id = n.id
+    )
+    UPDATE product_category c
+    SET
+        tree_id = numbered.tree_id,
+        level = numbered.level,
+        lft = numbered.lft,
+        rght = numbered.lft + 2 * numbered.size - 1
+    FROM numbered
+    WHERE c.id = numbered.id
+"""
+
+
+@traced_atomic_transaction()
+def move_categories(moves: dict[int, Optional[int]], manager):
+    """Move categories to the new parents at once.
+
+    `moves` maps the category ID to the ID of its new parent, or `None` to make it
+    a top level category. Instead of renumbering the tree for each moved category,
+    the parents are updated first and the affected trees are renumbered with a
+    single query.
+    """
+    from ..models import Category
+
+    if not moves:
+        return
+    category_ids = set(moves) | {
+        parent_id for parent_id in moves.values() if parent_id is not None
+    }
+    tree_ids = set(
+        Category.objects.filter(id__in=category_ids).values_list("tree_id", flat=True)
+    )
+    parents = dict(
+        Category.objects.select_for_update()
+        .filter(tree_id__in=tree_ids)
+        .order_by("pk")
+        .values_list("id", "parent_id")
+    )
+    missing_ids = category_ids - parents.keys()
+    if missing_ids:
+        raise ValueError(f"Categories {sorted(missing_ids)} do not exist.")
+
+    old_roots = {
+        category_id for category_id, parent_id in parents.items() if not parent_id
+    }
+    parents.update(moves)
+    for category_id in moves:
+        ancestor_id = parents[category_id]
+        visited = {category_id}
+        while ancestor_id is not None:
+            if ancestor_id in visited:
+                raise ValueError(
+                    f"Category {category_id} cannot be moved to its descendant."
+                )
+            visited.add(ancestor_id)
+            ancestor_id = parents[ancestor_id]
+
+    now = timezone.now()
+    categories = Category.objects.in_bulk(moves)
+    for category_id, parent_id in moves.items():
+        categories[category_id].parent_id = parent_id
+        categories[category_id].updated_at = now
+    Category.objects.bulk_update(categories.values(), ["parent", "updated_at"])
+
+    root_tree_ids = dict(
+        Category.objects.filter(id__in=old_roots, parent__isnull=True).values_list(
+            "id", "tree_id"
+        )
+    )
+    next_tree_id = (Category.objects.aggregate(Max("tree_id"))["tree_id__max"] or 0) + 1
+    for category_id, parent_id in moves.items():
+        if parent_id is None and category_id not in root_tree_ids:
+            root_tree_ids[category_id] = next_tree_id
+            next_tree_id += 1
+    with connection.cursor() as cursor:
+        cursor.execute(
+            RENUMBER_CATEGORY_TREES_SQL,
+            {
+                "root_ids": list(root_tree_ids.keys()),
+                "tree_ids": list(root_tree_ids.values()),
+                "moved_ids": list(moves),
+            },
+        )
+
+    for category in Category.objects.filter(id__in=moves):
+        call_event(manager.category_updated, category)
+
+
 def get_products_ids_without_variants(products_list: list["Product"]) -> list[int]:
     """Return list of product's ids without variants."""
     products_ids = [product.id for product in products_list]
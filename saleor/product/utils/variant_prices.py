@@ -1,20 +1,18 @@
 from collections import defaultdict
 from decimal import Decimal
+from itertools import chain
+from typing import Callable, NamedTuple, Optional
 from uuid import UUID
 
 from django.conf import settings
-from django.db import transaction
+from django.db import connection, models, transaction
 from django.db.models import Exists, OuterRef
 from prices import Money
 
-from ...channel.models import Channel
 from ...core.taxes import zero_money
 from ...discount import PromotionRuleInfo
 from ...discount.models import PromotionRule
-from ...discount.utils.promotion import (
-    calculate_discounted_price_for_promotions,
-    get_variants_to_promotion_rules_map,
-)
+from ...discount.utils.promotion import get_variants_to_promotion_rules_map
 from ..managers import ProductsQueryset, ProductVariantQueryset
 from ..models import (
     ProductChannelListing,
@@ -23,6 +21,18 @@ from ..models import (
     VariantChannelListingPromotionRule,
 )
 
+UPDATE_AMOUNTS_BATCH_SIZE = 1000
+
+
+class VariantListingRow(NamedTuple):
+    id: int
+    variant_id: int
+    product_id: int
+    channel_id: int
+    currency: str
+    price_amount: Decimal
+    discounted_price_amount: Optional[Decimal]
+
 
 def update_discounted_prices_for_promotion(
     products: ProductsQueryset, only_dirty_products: bool = False
@@ -37,66 +47,74 @@ def update_discounted_prices_for_promotion(
 
     When only_dirty_products set to True, the prices will be recalculated only for the
     listings marked as dirty.
+
+    The listings are fetched as plain rows instead of model instances and the changed
+    prices are saved with a single `UPDATE` per batch, so the whole catalogue can be
+    recalculated quickly, e.g. after a channel-wide promotion is created.
     """
+    product_channel_listings = ProductChannelListing.objects.using(
+        settings.DATABASE_CONNECTION_REPLICA_NAME
+    ).filter(Exists(products.filter(id=OuterRef("product_id"))))
+    if only_dirty_products:
+        product_channel_listings = product_channel_listings.filter(
+            discounted_price_dirty=True
+        )
+    product_listings = list(
+        product_channel_listings.values_list(
+            "id", "product_id", "channel_id", "discounted_price_amount"
+        )
+    )
+    if not product_listings:
+        return
+
     variant_qs = ProductVariant.objects.using(
         settings.DATABASE_CONNECTION_REPLICA_NAME
     ).filter(Exists(products.filter(id=OuterRef("product_id"))))
     rules_info_per_variant = get_variants_to_promotion_rules_map(variant_qs)
-    product_to_variant_listings_per_channel_map = (
-        _get_product_to_variant_channel_listings_per_channel_map(variant_qs)
-    )
+    product_channel_ids = {
+        (product_id, channel_id) for _, product_id, channel_id, _ in product_listings
+    }
+    variant_listings = [
+        variant_listing
+        for variant_listing in _get_variant_channel_listings_rows(variant_qs)
+        if (variant_listing.product_id, variant_listing.channel_id)
+        in product_channel_ids
+    ]
     variant_listing_to_listing_rule_per_rule_map = (
         _get_variant_listings_to_listing_rule_per_rule_id_map(variant_qs)
     )
 
-    changed_products_listings_to_update = []
-    changed_variants_listings_to_update = []
-
-    changed_variant_listing_promotion_rule_to_create = []
-    changed_variant_listing_promotion_rule_to_update = []
-
-    product_channel_listings = ProductChannelListing.objects.using(
-        settings.DATABASE_CONNECTION_REPLICA_NAME
-    ).filter(Exists(products.filter(id=OuterRef("product_id"))))
-    if only_dirty_products:
-        product_channel_listings.filter(discounted_price_dirty=True)
-
-    for product_channel_listing in product_channel_listings:
-        product_id = product_channel_listing.product_id
-        channel_id = product_channel_listing.channel_id
-        variant_listings = product_to_variant_listings_per_channel_map[product_id][
-            channel_id
-        ]
-        if not variant_listings:
-            continue
-        (
-            discounted_variants_price,
-            variant_listings_to_update,
-            variant_listing_promotion_rule_to_create,
-            variant_listing_promotion_rule_to_update,
-        ) = _get_discounted_variants_prices_for_promotions(
-            variant_listings,
-            rules_info_per_variant,
-            product_channel_listing.channel,
-            variant_listing_to_listing_rule_per_rule_map,
-        )
+    (
+        discounted_price_per_product_channel,
+        changed_variants_listings_to_update,
+        changed_variant_listing_promotion_rule_to_create,
+        changed_variant_listing_promotion_rule_to_update,
+        variant_listing_promotion_rule_ids_to_delete,
+    ) = _get_discounted_variants_prices_for_promotions(
+        variant_listings,
+        rules_info_per_variant,
+        variant_listing_to_listing_rule_per_rule_map,
+    )
 
-        product_discounted_price = min(discounted_variants_price)
-        changed_variants_listings_to_update.extend(variant_listings_to_update)
-        changed_variant_listing_promotion_rule_to_create.extend(
-            variant_listing_promotion_rule_to_create
-        )
-        changed_variant_listing_promotion_rule_to_update.extend(
-            variant_listing_promotion_rule_to_update
+    changed_products_listings_to_update = []
+    for listing_id, product_id, channel_id, discounted_price_amount in product_listings:
+        product_discounted_price_amount = discounted_price_per_product_channel.get(
+            (product_id, channel_id)
         )
-
+        if product_discounted_price_amount is None:
+            continue
         # check if the product discounted_price has changed
-        if product_channel_listing.discounted_price != product_discounted_price:
-            product_channel_listing.discounted_price_amount = (
-                product_discounted_price.amount
+        if discounted_price_amount != product_discounted_price_amount:
+            changed_products_listings_to_update.append(
+                (listing_id, product_discounted_price_amount)
             )
-            changed_products_listings_to_update.append(product_channel_listing)
 
+    if variant_listing_promotion_rule_ids_to_delete:
+        # delete variant listing - promotion rules relations that are not valid
+        # anymore
+        VariantChannelListingPromotionRule.objects.filter(
+            id__in=variant_listing_promotion_rule_ids_to_delete
+        ).delete()
     _update_or_create_listings(
         changed_products_listings_to_update,
         changed_variants_listings_to_update,
@@ -106,39 +124,61 @@ def update_discounted_prices_for_promotion(
 
 
 def _update_or_create_listings(
-    changed_products_listings_to_update: list[ProductChannelListing],
-    changed_variants_listings_to_update: list[ProductVariantChannelListing],
+    changed_products_listings_to_update: list[tuple[int, Decimal]],
+    changed_variants_listings_to_update: list[tuple[int, Decimal]],
     changed_variant_listing_promotion_rule_to_create: list[
         VariantChannelListingPromotionRule
     ],
-    changed_variant_listing_promotion_rule_to_update: list[
-        VariantChannelListingPromotionRule
-    ],
+    changed_variant_listing_promotion_rule_to_update: list[tuple[int, Decimal]],
 ):
     if changed_products_listings_to_update:
-        ProductChannelListing.objects.bulk_update(
-            sorted(changed_products_listings_to_update, key=lambda listing: listing.id),
-            ["discounted_price_amount"],
+        _bulk_update_amounts(
+            ProductChannelListing,
+            "discounted_price_amount",
+            changed_products_listings_to_update,
         )
     if changed_variants_listings_to_update:
-        ProductVariantChannelListing.objects.bulk_update(
-            sorted(changed_variants_listings_to_update, key=lambda listing: listing.id),
-            ["discounted_price_amount"],
+        _bulk_update_amounts(
+            ProductVariantChannelListing,
+            "discounted_price_amount",
+            changed_variants_listings_to_update,
         )
     if changed_variant_listing_promotion_rule_to_create:
         _create_variant_listing_promotion_rule(
             changed_variant_listing_promotion_rule_to_create
         )
     if changed_variant_listing_promotion_rule_to_update:
-        VariantChannelListingPromotionRule.objects.bulk_update(
-            sorted(
-                changed_variant_listing_promotion_rule_to_update,
-                key=lambda listing: listing.id,
-            ),
-            ["discount_amount"],
+        _bulk_update_amounts(
+            VariantChannelListingPromotionRule,
+            "discount_amount",
+            changed_variant_listing_promotion_rule_to_update,
         )
 
 
+def _bulk_update_amounts(
+    model: type[models.Model], field_name: str, values: list[tuple[int, Decimal]]
+):
+    """Set the amounts of many rows with one `UPDATE ... FROM (VALUES ...)` per batch.
+
+    Unlike `bulk_update`, which builds a `CASE` expression with a branch for each row,
+    the statement size and planning time grow linearly with the number of rows.
+    Rows are updated in the order of their IDs to avoid deadlocks.
+    """
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(model._meta.get_field(field_name).column)
+    values = sorted(values)
+    for start in range(0, len(values), UPDATE_AMOUNTS_BATCH_SIZE):
+        batch = values[start : start + UPDATE_AMOUNTS_BATCH_SIZE]
+        placeholders = ", ".join(["(%s, %s::numeric)"] * len(batch))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET {column} = v.amount "  # noqa: S608
+                f"FROM (VALUES {placeholders}) AS v(id, amount) "
+                f"WHERE {table}.id = v.id",
+                list(chain.from_iterable(batch)),
+            )
+
+
 def _create_variant_listing_promotion_rule(variant_listing_promotion_rule_to_create):
     with transaction.atomic():
         rule_ids = [
@@ -182,31 +222,24 @@ def _create_variant_listing_promotion_rule(variant_listing_promotion_rule_to_cre
         )
 
 
-def _get_product_to_variant_channel_listings_per_channel_map(
+def _get_variant_channel_listings_rows(
     variants: ProductVariantQueryset,
-):
+) -> list[VariantListingRow]:
     variant_channel_listings = ProductVariantChannelListing.objects.filter(
         Exists(variants.filter(id=OuterRef("variant_id"))), price_amount__isnull=False
     )
-    variant_to_product_id = {
-        variant_id: product_id
-        for variant_id, product_id in variants.values_list(
-            "id", "product_id"
+    return [
+        VariantListingRow(*row)
+        for row in variant_channel_listings.values_list(
+            "id",
+            "variant_id",
+            "variant__product_id",
+            "channel_id",
+            "channel__currency_code",
+            "price_amount",
+            "discounted_price_amount",
         ).iterator()
-    }
-
-    price_data: dict[int, dict[int, list[Money]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
-    for variant_channel_listing in variant_channel_listings.iterator():
-        try:
-            product_id = variant_to_product_id[variant_channel_listing.variant_id]
-        except KeyError:
-            continue
-        price_data[product_id][variant_channel_listing.channel_id].append(
-            variant_channel_listing
-        )
-    return price_data
+    ]
 
 
 def _get_variant_listings_to_listing_rule_per_rule_id_map(
@@ -217,13 +250,13 @@ def _get_variant_listings_to_listing_rule_per_rule_id_map(
     The map is in the format:
     {
         variant_channel_listing_id: {
-            rule_id: variant_channel_listing_promotion_rule
+            rule_id: (variant_channel_listing_promotion_rule_id, discount_amount)
         }
     }
     """
-    variant_listing_rule_data: dict[
-        int, dict[UUID, VariantChannelListingPromotionRule]
-    ] = defaultdict(dict)
+    variant_listing_rule_data: dict[int, dict[UUID, tuple[int, Decimal]]] = defaultdict(
+        dict
+    )
     variant_channel_listings = ProductVariantChannelListing.objects.filter(
         Exists(variants.filter(id=OuterRef("variant_id"))), price_amount__isnull=False
     )
@@ -231,102 +264,117 @@ def _get_variant_listings_to_listing_rule_per_rule_id_map(
         Exists(
             variant_channel_listings.filter(id=OuterRef("variant_channel_listing_id"))
         )
+    ).values_list(
+        "id", "variant_channel_listing_id", "promotion_rule_id", "discount_amount"
     )
-    for variant_listing_promotion_rule in variant_listing_promotion_rules:
-        listing_id = variant_listing_promotion_rule.variant_channel_listing_id
-        rule_id = variant_listing_promotion_rule.promotion_rule_id
-        variant_listing_rule_data[listing_id][rule_id] = variant_listing_promotion_rule
+    for (
+        listing_promotion_rule_id,
+        listing_id,
+        rule_id,
+        discount_amount,
+    ) in variant_listing_promotion_rules.iterator():
+        variant_listing_rule_data[listing_id][rule_id] = (
+            listing_promotion_rule_id,
+            discount_amount,
+        )
 
     return variant_listing_rule_data
 
 
 def _get_discounted_variants_prices_for_promotions(
-    variant_listings: list[ProductVariantChannelListing],
+    variant_listings: list[VariantListingRow],
     rules_info_per_variant: dict[int, list[PromotionRuleInfo]],
-    channel: Channel,
     variant_listing_to_listing_rule_per_rule_map: dict,
 ) -> tuple[
-    Money,
-    list[ProductVariantChannelListing],
-    list[VariantChannelListingPromotionRule],
+    dict[tuple[int, int], Decimal],
+    list[tuple[int, Decimal]],
     list[VariantChannelListingPromotionRule],
+    list[tuple[int, Decimal]],
+    list[int],
 ]:
-    variants_listings_to_update: list[ProductVariantChannelListing] = []
-    discounted_variants_price: list[Money] = []
+    """Calculate the discounted prices of variant listings with the best rules applied.
+
+    Return the minimal discounted price per product and channel, together with the
+    changes of variant listings and their promotion rule relations.
+    """
+    discounted_price_per_product_channel: dict[tuple[int, int], Decimal] = {}
+    variants_listings_to_update: list[tuple[int, Decimal]] = []
     variant_listing_promotion_rule_to_create: list[
         VariantChannelListingPromotionRule
     ] = []
-    variant_listing_promotion_rule_to_update: list[
-        VariantChannelListingPromotionRule
-    ] = []
+    variant_listing_promotion_rule_to_update: list[tuple[int, Decimal]] = []
+    variant_listing_promotion_rule_ids_to_delete: list[int] = []
+    # the discount functions are the same for all listings in the given currency
+    discounts: dict[tuple[UUID, str], Callable[[Money], Money]] = {}
+
     for variant_listing in variant_listings:
-        applied_discount = calculate_discounted_price_for_promotions(
-            price=variant_listing.price,
-            rules_info_per_variant=rules_info_per_variant,
-            channel=channel,
-            variant_id=variant_listing.variant_id,
-        )
-        discounted_variant_price = variant_listing.price
+        currency = variant_listing.currency
+        price = Money(variant_listing.price_amount, currency)
+        discounted_variant_price = price
 
         rule_id = None
-        if applied_discount:
-            rule_id, discount = applied_discount
-            discounted_variant_price -= discount
+        discounted_price_with_rule = None
+        for rule_info in rules_info_per_variant.get(variant_listing.variant_id, []):
+            if variant_listing.channel_id not in rule_info.channel_ids:
+                continue
+            rule = rule_info.rule
+            discount = discounts.get((rule.id, currency))
+            if discount is None:
+                discount = discounts[(rule.id, currency)] = rule.get_discount(currency)
+            rule_price = discount(price)
+            # the first rule with the lowest price is applied
+            if (
+                discounted_price_with_rule is None
+                or rule_price.amount < discounted_price_with_rule.amount
+            ):
+                rule_id, discounted_price_with_rule = rule.id, rule_price
+
+        listing_rules = variant_listing_to_listing_rule_per_rule_map.get(
+            variant_listing.id, {}
+        )
+        if discounted_price_with_rule is not None:
+            discount_amount = (price - discounted_price_with_rule).amount
             discounted_variant_price = max(
-                discounted_variant_price, zero_money(discounted_variant_price.currency)
+                discounted_price_with_rule, zero_money(currency)
             )
-
-            _handle_discount_rule_id(
-                variant_listing,
-                rule_id,
-                variant_listing_to_listing_rule_per_rule_map,
-                discount.amount,
-                channel.currency_code,
-                variant_listing_promotion_rule_to_update,
-                variant_listing_promotion_rule_to_create,
+            if rule_id in listing_rules:
+                listing_promotion_rule_id, current_discount_amount = listing_rules[
+                    rule_id
+                ]
+                if current_discount_amount != discount_amount:
+                    variant_listing_promotion_rule_to_update.append(
+                        (listing_promotion_rule_id, discount_amount)
+                    )
+            else:
+                variant_listing_promotion_rule_to_create.append(
+                    VariantChannelListingPromotionRule(
+                        variant_channel_listing_id=variant_listing.id,
+                        promotion_rule_id=rule_id,
+                        discount_amount=discount_amount,
+                        currency=currency,
+                    )
+                )
+
+        discounted_amount = discounted_variant_price.amount
+        if variant_listing.discounted_price_amount != discounted_amount:
+            variants_listings_to_update.append((variant_listing.id, discounted_amount))
+            variant_listing_promotion_rule_ids_to_delete.extend(
+                listing_promotion_rule_id
+                for listing_rule_id, (listing_promotion_rule_id, _) in (
+                    listing_rules.items()
+                )
+                if listing_rule_id != rule_id
             )
 
-        if variant_listing.discounted_price != discounted_variant_price:
-            variant_listing.discounted_price_amount = discounted_variant_price.amount
-            variants_listings_to_update.append(variant_listing)
-
-            # delete variant listing - promotion rules relations that are not valid
-            # anymore
-            VariantChannelListingPromotionRule.objects.filter(
-                variant_channel_listing_id=variant_listing.id
-            ).exclude(promotion_rule_id=rule_id).delete()
-
-        discounted_variants_price.append(discounted_variant_price)
+        key = (variant_listing.product_id, variant_listing.channel_id)
+        current_min = discounted_price_per_product_channel.get(key)
+        if current_min is None or discounted_amount < current_min:
+            discounted_price_per_product_channel[key] = discounted_amount
 
     return (
-        discounted_variants_price,
+        discounted_price_per_product_channel,
         variants_listings_to_update,
         variant_listing_promotion_rule_to_create,
         variant_listing_promotion_rule_to_update,
+        variant_listing_promotion_rule_ids_to_delete,
     )
-
-
-def _handle_discount_rule_id(
-    variant_listing: ProductVariantChannelListing,
-    rule_id: UUID,
-    variant_listing_to_listing_rule_per_rule_map: dict,
-    discount_amount: Decimal,
-    currency: str,
-    variant_listing_promotion_rule_to_update: list[VariantChannelListingPromotionRule],
-    variant_listing_promotion_rule_to_create: list[VariantChannelListingPromotionRule],
-):
-    listing_promotion_rule = variant_listing_to_listing_rule_per_rule_map[
-        variant_listing.id
-    ].get(rule_id)
-    if listing_promotion_rule:
-        listing_promotion_rule.discount_amount = discount_amount
-        variant_listing_promotion_rule_to_update.append(listing_promotion_rule)
-    else:
-        variant_listing_promotion_rule_to_create.append(
-            VariantChannelListingPromotionRule(
-                variant_channel_listing=variant_listing,
-                promotion_rule_id=rule_id,
-                discount_amount=discount_amount,
-                currency=currency,
-            )
-        )
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+import opentracing
+import opentracing.tags
+from django.conf import settings
+from django.core.cache import cache
+
+from ..core.utils.json_serializer import CustomJsonEncoder
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+TAX_RESULT_CACHE_KEY_PREFIX = "tax_result_"
+# Time for which a single caller is allowed to refresh a stale tax result.
+TAX_RESULT_REFRESH_LOCK_TIMEOUT = 30
+
+
+def get_tax_result_cache_key(provider: str, key_data: Any) -> str:
+    """Return the cache key for the canonical form of the tax-relevant input."""
+    key = json.dumps(key_data, sort_keys=True, cls=CustomJsonEncoder)
+    return (
+        f"{TAX_RESULT_CACHE_KEY_PREFIX}{provider}_"
+        f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
+    )
+
+
+def get_or_fetch_tax_result(
+    provider: str,
+    key_data: Any,
+    fetch: Callable[[], Optional[R]],
+    is_valid_result: Callable[[R], bool] = bool,
+) -> Optional[R]:
+    """Return the tax result shared by all calculations with the same input.
+
+    `key_data` must contain only the data the tax provider calculates taxes from, so
+    different checkouts with the same lines and addresses share the result.
+
+    A result older than `TAX_RESULT_CACHE_TIMEOUT` is stale. The first caller that
+    gets a stale result fetches a new one, while the others keep getting the stale
+    result for up to `TAX_RESULT_CACHE_STALE_TIMEOUT`. The cache is disabled when
+    `TAX_RESULT_CACHE_TIMEOUT` is 0.
+    """
+    timeout = settings.TAX_RESULT_CACHE_TIMEOUT.total_seconds()
+    if not timeout:
+        return fetch()
+
+    cache_key = get_tax_result_cache_key(provider, key_data)
+    refresh_lock_key = cache_key + "_refresh"
+    with opentracing.global_tracer().start_active_span("tax.cache") as scope:
+        span = scope.span
+        span.set_tag(opentracing.tags.COMPONENT, "tax")
+        span.set_tag("tax.provider", provider)
+
+        cached_data = cache.get(cache_key)
+        stale_result = None
+        if cached_data is not None:
+            fresh_until, stale_result = cached_data
+            if time.time() < fresh_until:
+                span.set_tag("tax.cache", "hit")
+                logger.debug("Tax result cache hit for provider %s.", provider)
+                return stale_result
+            if not cache.add(refresh_lock_key, True, TAX_RESULT_REFRESH_LOCK_TIMEOUT):
+                span.set_tag("tax.cache", "stale")
+                logger.debug("Tax result cache stale hit for provider %s.", provider)
+                return stale_result
+
+        span.set_tag("tax.cache", "miss")
+        logger.debug("Tax result cache miss for provider %s.", provider)
+        try:
+            result = fetch()
+        finally:
+            if cached_data is not None:
+                cache.delete(refresh_lock_key)
+
+        if result is not None and is_valid_result(result):
+            stale_timeout = settings.TAX_RESULT_CACHE_STALE_TIMEOUT.total_seconds()
+            cache.set(
+                cache_key, (time.time() + timeout, result), timeout + stale_timeout
+            )
+        elif stale_result is not None:
+            # keep serving the previous result when the tax provider fails
+            return stale_result
+        return result
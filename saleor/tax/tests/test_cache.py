@@ -0,0 +1,102 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..cache import get_or_fetch_tax_result, get_tax_result_cache_key
+
+
+def test_get_tax_result_cache_key_ignores_key_order():
+    # given
+    key_data = {"lines": [{"amount": "10.00", "taxCode": "P0000000"}], "zip": "10001"}
+    reordered_key_data = {
+        "zip": "10001",
+        "lines": [{"taxCode": "P0000000", "amount": "10.00"}],
+    }
+
+    # when
+    cache_key = get_tax_result_cache_key("tax-app", key_data)
+
+    # then
+    assert cache_key == get_tax_result_cache_key("tax-app", reordered_key_data)
+    assert cache_key != get_tax_result_cache_key("other-tax-app", key_data)
+
+
+@override_settings(TAX_RESULT_CACHE_TIMEOUT=timedelta(seconds=0))
+def test_get_or_fetch_tax_result_cache_disabled():
+    # given
+    fetch = Mock(return_value={"total": "10.00"})
+
+    # when
+    for _ in range(2):
+        result = get_or_fetch_tax_result("disabled-tax-app", {"zip": "10001"}, fetch)
+
+    # then
+    assert result == {"total": "10.00"}
+    assert fetch.call_count == 2
+
+
+@override_settings(TAX_RESULT_CACHE_TIMEOUT=timedelta(minutes=5))
+def test_get_or_fetch_tax_result_shares_result():
+    # given
+    fetch = Mock(return_value={"total": "10.00"})
+
+    # when
+    first_result = get_or_fetch_tax_result("shared-tax-app", {"zip": "10001"}, fetch)
+    second_result = get_or_fetch_tax_result("shared-tax-app", {"zip": "10001"}, fetch)
+
+    # then
+    assert first_result == second_result == {"total": "10.00"}
+    fetch.assert_called_once_with()
+
+
+@override_settings(TAX_RESULT_CACHE_TIMEOUT=timedelta(minutes=5))
+def test_get_or_fetch_tax_result_does_not_cache_invalid_result():
+    # given
+    fetch = Mock(return_value={"error": "Invalid address"})
+
+    # when
+    for _ in range(2):
+        result = get_or_fetch_tax_result(
+            "invalid-tax-app",
+            {"zip": "10001"},
+            fetch,
+            is_valid_result=lambda result: "error" not in result,
+        )
+
+    # then
+    assert result == {"error": "Invalid address"}
+    assert fetch.call_count == 2
+
+
+@override_settings(
+    TAX_RESULT_CACHE_TIMEOUT=timedelta(minutes=5),
+    TAX_RESULT_CACHE_STALE_TIMEOUT=timedelta(minutes=5),
+)
+@patch("saleor.tax.cache.time.time")
+def test_get_or_fetch_tax_result_returns_stale_result_while_refreshing(mock_time):
+    # given
+    mock_time.return_value = 1000
+    key_data = {"zip": "10001"}
+    get_or_fetch_tax_result("stale-tax-app", key_data, lambda: {"total": "10.00"})
+    mock_time.return_value = 1000 + 6 * 60
+    cache_key = get_tax_result_cache_key("stale-tax-app", key_data)
+    # another worker is already refreshing the result
+    cache.add(cache_key + "_refresh", True)
+    fetch = Mock(return_value={"total": "12.00"})
+
+    # when
+    result = get_or_fetch_tax_result("stale-tax-app", key_data, fetch)
+
+    # then
+    assert result == {"total": "10.00"}
+    fetch.assert_not_called()
+
+    # when
+    cache.delete(cache_key + "_refresh")
+    result = get_or_fetch_tax_result("stale-tax-app", key_data, fetch)
+
+    # then
+    assert result == {"total": "12.00"}
+    fetch.assert_called_once_with()
@@ -0,0 +1,67 @@
+from ..celeryconf import route_task
+from ..csv.tasks import export_products_task
+
+
+def test_route_task_to_priority_class_queue(settings):
+    # given
+    settings.BULK_CELERY_QUEUE_NAME = "bulk"
+
+    # when
+    route = route_task(export_products_task.name, (), {}, {})
+
+    # then
+    assert route == {"queue": "bulk"}
+
+
+def test_route_task_keeps_explicit_queue(settings):
+    # given
+    settings.BULK_CELERY_QUEUE_NAME = "bulk"
+
+    # when
+    route = route_task(export_products_task.name, (), {}, {"queue": "exports"})
+
+    # then
+    assert route is None
+
+
+def test_route_task_without_priority_class_queue(settings):
+    # given
+    settings.CRITICAL_CELERY_QUEUE_NAME = None
+
+    # when
+    route = route_task(
+        "saleor.payment.tasks.transaction_release_funds_for_checkout_task", (), {}, {}
+    )
+
+    # then
+    assert route is None
+
+
+def test_route_task_not_in_priority_class(settings):
+    # given
+    settings.CRITICAL_CELERY_QUEUE_NAME = "critical"
+    settings.INDEXING_CELERY_QUEUE_NAME = "indexing"
+    settings.BULK_CELERY_QUEUE_NAME = "bulk"
+
+    # when
+    route = route_task("saleor.plugins.webhook.tasks.unknown_task", (), {}, {})
+
+    # then
+    assert route is None
+
+
+def test_route_task_bulk_class_takes_precedence(settings):
+    # given
+    settings.CRITICAL_CELERY_QUEUE_NAME = "critical"
+    settings.BULK_CELERY_QUEUE_NAME = "bulk"
+
+    # when
+    route = route_task(
+        "saleor.payment.tasks.delete_processed_gateway_notifications_task",
+        (),
+        {},
+        {},
+    )
+
+    # then
+    assert route == {"queue": "bulk"}
@@ -51,8 +51,11 @@ def prepare_test_db_connections():
     refer to the Django documentation:
     https://docs.djangoproject.com/en/4.2/topics/testing/advanced/#testing-primary-replica-configurations
     """
-    replica = settings.DATABASE_CONNECTION_REPLICA_NAME
-    connections[replica] = FakeDbReplicaConnection(connections[replica])  # type: ignore
+    for replica in (
+        settings.DATABASE_CONNECTION_REPLICA_NAME,
+        settings.DATABASE_CONNECTION_REPLICA_FALLBACK_NAME,
+    ):
+        connections[replica] = FakeDbReplicaConnection(connections[replica])  # type: ignore
 
 
 def flush_post_commit_hooks():
@@ -1,6 +1,6 @@
 import math
 from collections import defaultdict, namedtuple
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any, Optional, cast
 from uuid import UUID
 
@@ -41,6 +41,56 @@ if TYPE_CHECKING:
 StockData = namedtuple("StockData", ["pk", "quantity"])
 
 
+class StockEventsCollector:
+    """Collect stock events and send them once the transaction is committed.
+
+    Each stock gets at most one availability event, the last one recorded, so
+    a stock that is deallocated and then fulfilled in a single operation is
+    reported only once.
+    """
+
+    def __init__(self, manager: PluginsManager):
+        self.manager = manager
+        self.availability_events: dict[int, tuple[Callable, Stock]] = {}
+        self.updated_stocks: dict[int, Stock] = {}
+
+    def out_of_stock(self, stock: Stock):
+        self.availability_events[stock.pk] = (
+            self.manager.product_variant_out_of_stock,
+            stock,
+        )
+
+    def back_in_stock(self, stock: Stock):
+        self.availability_events[stock.pk] = (
+            self.manager.product_variant_back_in_stock,
+            stock,
+        )
+
+    def stock_updated(self, stock: Stock):
+        self.updated_stocks[stock.pk] = stock
+
+    def send(self):
+        events = list(self.availability_events.values())
+        events.extend(
+            (self.manager.product_variant_stock_updated, stock)
+            for stock in self.updated_stocks.values()
+        )
+        self.availability_events = {}
+        self.updated_stocks = {}
+        if events:
+            transaction.on_commit(lambda: self._trigger_events(events))
+
+    @staticmethod
+    def _trigger_events(events: list[tuple[Callable, Stock]]):
+        for event, stock in events:
+            event(stock)
+
+
+def _get_stocks_with_available_quantity(stock_ids: Iterable[int]) -> dict[int, Stock]:
+    stocks = Stock.objects.filter(id__in=stock_ids).annotate_available_quantity()
+    return {stock.pk: stock for stock in stocks}
+
+
 @traced_atomic_transaction()
 def allocate_stocks(
     order_lines_info: Iterable["OrderLineInfo"],
@@ -149,17 +199,14 @@ def allocate_stocks(
             stocks_to_update.append(stock)
         Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
 
-        for allocation in allocations:
-            allocated_stock = (
-                Allocation.objects.filter(stock_id=allocation.stock_id).aggregate(
-                    Sum("quantity_allocated")
-                )["quantity_allocated__sum"]
-                or 0
-            )
-            if not max(allocation.stock.quantity - allocated_stock, 0):
-                transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(allocation.stock)
-                )
+        stock_events = StockEventsCollector(manager)
+        allocated_stocks = _get_stocks_with_available_quantity(
+            {allocation.stock_id for allocation in allocations}
+        )
+        for stock in allocated_stocks.values():
+            if stock.available_quantity <= 0:
+                stock_events.out_of_stock(stock)
+        stock_events.send()
 
 
 def _prepare_stock_to_reserved_quantity_map(
@@ -278,7 +325,9 @@ def _create_allocations(
 
 
 def deallocate_stock(
-    order_lines_data: Iterable["OrderLineInfo"], manager: PluginsManager
+    order_lines_data: Iterable["OrderLineInfo"],
+    manager: PluginsManager,
+    stock_events: Optional[StockEventsCollector] = None,
 ):
     """Deallocate stocks for given `order_lines`.
 
@@ -333,27 +382,19 @@ def deallocate_stock(
         if not quantity_dealocated == quantity:
             not_dellocated_lines.append(order_line)
 
-    allocations_before_update = list(
-        Allocation.objects.filter(
-            id__in=[a.id for a in allocations_to_update]
-        ).annotate_stock_available_quantity()
-    )
+    deallocated_stock_ids = {a.stock_id for a in allocations_to_update}
+    stocks_before_update = _get_stocks_with_available_quantity(deallocated_stock_ids)
 
     Allocation.objects.bulk_update(allocations_to_update, ["quantity_allocated"])
 
-    for allocation_before_update in allocations_before_update:
-        available_stock_now = Allocation.objects.available_quantity_for_stock(
-            allocation_before_update.stock
-        )
-        if (
-            allocation_before_update.stock_available_quantity <= 0
-            and available_stock_now > 0
-        ):
-            transaction.on_commit(
-                lambda: manager.product_variant_back_in_stock(
-                    allocation_before_update.stock
-                )
-            )
+    events = stock_events or StockEventsCollector(manager)
+    stocks_after_update = _get_stocks_with_available_quantity(deallocated_stock_ids)
+    for stock_pk, stock in stocks_after_update.items():
+        stock_before_update = stocks_before_update[stock_pk]
+        if stock_before_update.available_quantity <= 0 < stock.available_quantity:
+            events.back_in_stock(stock)
+    if stock_events is None:
+        events.send()
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
 
@@ -474,8 +515,9 @@ def decrease_stock(
     """
     variants = [line_info.variant for line_info in order_lines_info]
     warehouse_pks = [line_info.warehouse_pk for line_info in order_lines_info]
+    stock_events = StockEventsCollector(manager)
     try:
-        deallocate_stock(order_lines_info, manager)
+        deallocate_stock(order_lines_info, manager, stock_events=stock_events)
     except AllocationError as exc:
         Allocation.objects.filter(order_line__in=exc.order_lines).update(
             quantity_allocated=0
@@ -510,21 +552,22 @@ def decrease_stock(
             quantity_allocation_for_stocks[allocation["stock"]] += allocation[
                 "quantity_allocated__sum"
             ]
-        _decrease_stocks_quantity(
+        updated_stocks = _decrease_stocks_quantity(
             order_lines_info,
             variant_and_warehouse_to_stock,
             quantity_allocation_for_stocks,
             allow_stock_to_be_exceeded,
         )
+        updated_stock_ids = {stock.pk for stock in updated_stocks}
 
         stock_ids = (s.id for s in stocks)
-        for stock in Stock.objects.filter(
-            id__in=stock_ids
-        ).annotate_available_quantity():
+        for stock in _get_stocks_with_available_quantity(stock_ids).values():
             if stock.available_quantity <= 0:
-                transaction.on_commit(
-                    lambda: manager.product_variant_out_of_stock(stock)
-                )
+                stock_events.out_of_stock(stock)
+            if stock.pk in updated_stock_ids:
+                stock_events.stock_updated(stock)
+
+    stock_events.send()
 
 
 def _decrease_stocks_quantity(
@@ -532,7 +575,7 @@ def _decrease_stocks_quantity(
     variant_and_warehouse_to_stock: dict[int, dict[UUID, Stock]],
     quantity_allocation_for_stocks: dict[int, int],
     allow_stock_to_be_exceeded: bool = False,
-):
+) -> list[Stock]:
     insufficient_stocks: list[InsufficientStockData] = []
     stocks_to_update = []
     for line_info in order_lines_info:
@@ -579,6 +622,7 @@ def _decrease_stocks_quantity(
         raise InsufficientStock(insufficient_stocks)
 
     Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+    return stocks_to_update
 
 
 def get_order_lines_with_track_inventory(
@@ -608,11 +652,11 @@ def deallocate_stock_for_order(order: "Order", manager: PluginsManager):
         stock.quantity_allocated = F("quantity_allocated") - alloc.quantity_allocated
         stocks_to_update.append(stock)
 
+    stock_events = StockEventsCollector(manager)
     for allocation in allocations.annotate_stock_available_quantity():
         if allocation.stock_available_quantity <= 0:
-            transaction.on_commit(
-                lambda: manager.product_variant_back_in_stock(allocation.stock)
-            )
+            stock_events.back_in_stock(allocation.stock)
+    stock_events.send()
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
@@ -632,11 +676,11 @@ def deallocate_stock_for_orders(orders_id, manager: PluginsManager):
         stock.quantity_allocated = F("quantity_allocated") - alloc.quantity_allocated
         stocks_to_update.append(stock)
 
+    stock_events = StockEventsCollector(manager)
     for allocation in allocations.annotate_stock_available_quantity():
         if allocation.stock_available_quantity <= 0:
-            transaction.on_commit(
-                lambda: manager.product_variant_back_in_stock(allocation.stock)
-            )
+            stock_events.back_in_stock(allocation.stock)
+    stock_events.send()
 
     allocations.update(quantity_allocated=0)
     Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.15 on 2024-09-24 09:21
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("warehouse", "0034_warehouse_click_and_collect_option_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="reservation",
+            index=models.Index(
+                fields=["stock", "reserved_until"],
+                include=("quantity_reserved",),
+                name="reservation_stock_until_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="preorderreservation",
+            index=models.Index(
+                fields=["product_variant_channel_listing", "reserved_until"],
+                include=("quantity_reserved",),
+                name="preorder_res_listing_until_idx",
+            ),
+        ),
+    ]
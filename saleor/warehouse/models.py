@@ -587,6 +587,11 @@ class PreorderReservation(models.Model):
         unique_together = [["checkout_line", "product_variant_channel_listing"]]
         indexes = [
             models.Index(fields=["checkout_line", "reserved_until"]),
+            models.Index(
+                fields=["product_variant_channel_listing", "reserved_until"],
+                include=["quantity_reserved"],
+                name="preorder_res_listing_until_idx",
+            ),
         ]
         ordering = ("pk",)
 
@@ -615,5 +620,11 @@ class Reservation(models.Model):
         unique_together = [["checkout_line", "stock"]]
         indexes = [
             models.Index(fields=["checkout_line", "reserved_until"]),
+            # Allows summing active reservations of stocks with an index-only scan.
+            models.Index(
+                fields=["stock", "reserved_until"],
+                include=["quantity_reserved"],
+                name="reservation_stock_until_idx",
+            ),
         ]
         ordering = ("pk",)
@@ -12,6 +12,7 @@ from ...plugins.manager import get_plugins_manager
 from ...tests.utils import flush_post_commit_hooks
 from ...warehouse.models import Stock
 from ..management import (
+    StockEventsCollector,
     allocate_preorders,
     allocate_stocks,
     deallocate_stock,
@@ -1094,6 +1095,67 @@ def test_decrease_stock_with_out_of_stock_webhook_triggered(
     product_variant_out_of_stock_webhook_mock.assert_called_once()
 
 
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_stock_updated")
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_decrease_stock_sends_coalesced_stock_events(
+    product_variant_out_of_stock_webhook_mock,
+    product_variant_back_in_stock_webhook_mock,
+    product_variant_stock_updated_webhook_mock,
+    allocation,
+):
+    # given
+    stock = allocation.stock
+    stock.quantity = 50
+    stock.save(update_fields=["quantity"])
+    allocation.quantity_allocated = 50
+    allocation.save(update_fields=["quantity_allocated"])
+
+    # when
+    decrease_stock(
+        [
+            OrderLineInfo(
+                line=allocation.order_line,
+                quantity=50,
+                variant=stock.product_variant,
+                warehouse_pk=stock.warehouse_id,
+            )
+        ],
+        manager=get_plugins_manager(allow_replica=False),
+    )
+    flush_post_commit_hooks()
+
+    # then
+    # the stock is back in stock after deallocation only until it is decreased
+    product_variant_back_in_stock_webhook_mock.assert_not_called()
+    product_variant_out_of_stock_webhook_mock.assert_called_once_with(stock)
+    product_variant_stock_updated_webhook_mock.assert_called_once_with(stock)
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_stock_events_collector_sends_last_event_per_stock(
+    product_variant_out_of_stock_webhook_mock,
+    product_variant_back_in_stock_webhook_mock,
+    stock,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    stock_events = StockEventsCollector(get_plugins_manager(allow_replica=False))
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        stock_events.out_of_stock(stock)
+        stock_events.back_in_stock(stock)
+        stock_events.out_of_stock(stock)
+        stock_events.send()
+
+    # then
+    assert len(callbacks) == 1
+    product_variant_out_of_stock_webhook_mock.assert_called_once_with(stock)
+    product_variant_back_in_stock_webhook_mock.assert_not_called()
+
+
 def test_allocate_preorders(
     order_line, preorder_variant_channel_threshold, channel_USD
 ):
@@ -47,7 +47,7 @@ from ..shipping.interface import ShippingMethodData
 from ..tax.models import TaxClassCountryRate
 from ..tax.utils import get_charge_taxes_for_order
 from ..thumbnail.models import Thumbnail
-from ..warehouse.models import Stock, Warehouse
+from ..warehouse.models import Allocation, Stock, Warehouse
 from . import traced_payload_generator
 from .event_types import WebhookEventAsyncType
 from .payload_serializers import PayloadSerializer
@@ -164,28 +164,36 @@ def generate_metadata_updated_payload(
     )
 
 
-def prepare_order_lines_allocations_payload(line):
-    warehouse_id_quantity_allocated_map = list(
-        line.allocations.values(
-            "quantity_allocated", warehouse_id=F("stock__warehouse_id")
-        )
+def prepare_order_lines_allocations_map(line_ids: Iterable[uuid.UUID]):
+    """Return allocations payloads of all given lines, fetched in a single query."""
+    allocations_map: dict[uuid.UUID, list[dict]] = defaultdict(list)
+    allocations = Allocation.objects.filter(order_line_id__in=line_ids).values(
+        "order_line_id", "quantity_allocated", warehouse_id=F("stock__warehouse_id")
     )
-    for item in warehouse_id_quantity_allocated_map:
-        item["warehouse_id"] = graphene.Node.to_global_id(
-            "Warehouse", item["warehouse_id"]
+    for allocation in allocations:
+        order_line_id = allocation.pop("order_line_id")
+        allocation["warehouse_id"] = graphene.Node.to_global_id(
+            "Warehouse", allocation["warehouse_id"]
         )
-    return warehouse_id_quantity_allocated_map
+        allocations_map[order_line_id].append(allocation)
+    return allocations_map
 
 
 @allow_writer()
 @traced_payload_generator
 def generate_order_lines_payload(lines: Iterable[OrderLine]):
+    """Return payload of the order lines, built from two queries for any line count.
+
+    Lines are read with `values()`, so no model instances are created. The payload
+    has the same format as the one created by `PayloadSerializer`.
+    """
     line_fields = (
         "product_name",
         "variant_name",
         "translated_product_name",
         "translated_variant_name",
         "product_sku",
+        "product_variant_id",
         "quantity",
         "currency",
         "unit_price_net_amount",
@@ -215,20 +223,48 @@ def generate_order_lines_payload(lines: Iterable[OrderLine]):
         "undiscounted_total_price_gross_amount",
     )
 
-    for line in lines:
-        quantize_price_fields(line, line_price_fields, line.currency)
+    if not isinstance(lines, QuerySet):
+        lines = OrderLine.objects.filter(pk__in=[line.pk for line in lines])
+    lines_data = list(lines.values("id", *line_fields))
+    allocations_map = prepare_order_lines_allocations_map(
+        [line["id"] for line in lines_data]
+    )
 
-    serializer = PayloadSerializer()
-    return serializer.serialize(
-        lines,
-        fields=line_fields,
-        extra_dict_data={
-            "product_variant_id": (lambda line: line.product_variant_id),
-            "total_price_net_amount": (lambda line: line.total_price.net.amount),
-            "total_price_gross_amount": (lambda line: line.total_price.gross.amount),
-            "allocations": (lambda line: prepare_order_lines_allocations_payload(line)),
-        },
+    payload = []
+    for line in lines_data:
+        line_id = line.pop("id")
+        for field in line_price_fields:
+            line[field] = quantize_price(line[field] or Decimal(0), line["currency"])
+        payload.append(
+            {
+                "type": "OrderLine",
+                "id": graphene.Node.to_global_id("OrderLine", line_id),
+                **line,
+                "allocations": allocations_map.get(line_id, []),
+            }
+        )
+    return json.dumps(payload, cls=CustomJsonEncoder)
+
+
+def _generate_order_discounts_payload(order: "Order"):
+    discount_fields = (
+        "type",
+        "value_type",
+        "value",
+        "amount_value",
+        "name",
+        "translated_name",
+        "reason",
     )
+    discounts = []
+    for discount in order.discounts.values("id", *discount_fields):
+        discount["amount_value"] = quantize_price(
+            discount["amount_value"], order.currency
+        )
+        discount_id = graphene.Node.to_global_id("OrderDiscount", discount.pop("id"))
+        discounts.append({"id": discount_id, **discount})
+    # the serializer used before returned `None` for orders without discounts
+    return discounts or None
 
 
 def _generate_collection_point_payload(warehouse: "Warehouse"):
@@ -292,21 +328,10 @@ def generate_order_payload(
     )
     fulfillment_price_fields = ("shipping_refund_amount", "total_refund_amount")
     payment_price_fields = ("captured_amount", "total")
-    discount_fields = (
-        "type",
-        "value_type",
-        "value",
-        "amount_value",
-        "name",
-        "translated_name",
-        "reason",
-    )
-    discount_price_fields = ("amount_value",)
 
     lines = order.lines.all()
     fulfillments = order.fulfillments.all()
     payments = order.payments.all()
-    discounts = order.discounts.all()
 
     quantize_price_fields(order, ORDER_PRICE_FIELDS, order.currency)
 
@@ -316,9 +341,6 @@ def generate_order_payload(
     for payment in payments:
         quantize_price_fields(payment, payment_price_fields, order.currency)
 
-    for discount in discounts:
-        quantize_price_fields(discount, discount_price_fields, order.currency)
-
     fulfillments_data = serializer.serialize(
         fulfillments,
         fields=fulfillment_fields,
@@ -336,6 +358,7 @@ def generate_order_payload(
         "created": order.created_at,
         "original": graphene.Node.to_global_id("Order", order.original_id),
         "lines": json.loads(generate_order_lines_payload(lines)),
+        "discounts": _generate_order_discounts_payload(order),
         "fulfillments": json.loads(fulfillments_data),
         "collection_point": json.loads(
             _generate_collection_point_payload(order.collection_point)
@@ -359,7 +382,6 @@ def generate_order_payload(
             "channel": (lambda o: o.channel, CHANNEL_FIELDS),
             "shipping_address": (lambda o: o.shipping_address, ADDRESS_FIELDS),
             "billing_address": (lambda o: o.billing_address, ADDRESS_FIELDS),
-            "discounts": (lambda _: discounts, discount_fields),
         },
         extra_dict_data=extra_dict_data,
     )
@@ -0,0 +1,89 @@
+import json
+import uuid
+from copy import copy
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....order.models import OrderLine
+from ....warehouse.models import Allocation
+from ...payloads import generate_order_lines_payload, generate_order_payload
+
+LINES_COUNTS = [10, 100, 1000]
+
+
+@pytest.fixture
+def order_with_many_lines(order_with_lines):
+    def create_lines(how_many):
+        order = order_with_lines
+        template_line = order.lines.first()
+        stock = template_line.allocations.first().stock
+        order.lines.all().delete()
+
+        lines = []
+        for _ in range(how_many):
+            line = copy(template_line)
+            line.id = uuid.uuid4()
+            lines.append(line)
+        lines = OrderLine.objects.bulk_create(lines)
+        Allocation.objects.bulk_create(
+            [
+                Allocation(order_line=line, stock=stock, quantity_allocated=1)
+                for line in lines
+            ]
+        )
+        return order
+
+    return create_lines
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("lines_count", LINES_COUNTS)
+def test_generate_order_lines_payload(
+    lines_count, order_with_many_lines, django_assert_num_queries, count_queries
+):
+    # given
+    order = order_with_many_lines(lines_count)
+
+    # when
+    with django_assert_num_queries(2):
+        payload = json.loads(generate_order_lines_payload(order.lines.all()))
+
+    # then
+    assert len(payload) == lines_count
+    assert all(len(line["allocations"]) == 1 for line in payload)
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+@pytest.mark.parametrize("lines_count", LINES_COUNTS)
+def test_generate_order_payload(
+    lines_count, order_with_many_lines, customer_user, count_queries
+):
+    # given
+    order = order_with_many_lines(lines_count)
+
+    # when
+    payload = json.loads(generate_order_payload(order, customer_user))[0]
+
+    # then
+    assert len(payload["lines"]) == lines_count
+
+
+def test_generate_order_payload_queries_do_not_depend_on_lines_count(
+    order_with_many_lines, customer_user
+):
+    # given
+    order = order_with_many_lines(LINES_COUNTS[0])
+    with CaptureQueriesContext(connection) as queries_for_few_lines:
+        generate_order_payload(order, customer_user)
+    order = order_with_many_lines(LINES_COUNTS[-1])
+
+    # when
+    with CaptureQueriesContext(connection) as queries_for_many_lines:
+        generate_order_payload(order, customer_user)
+
+    # then
+    assert len(queries_for_many_lines) == len(queries_for_few_lines)
@@ -50,6 +50,7 @@ from ..payloads import (
     generate_list_gateways_payload,
     generate_meta,
     generate_metadata_updated_payload,
+    generate_order_lines_payload,
     generate_order_payload,
     generate_order_payload_for_tax_calculation,
     generate_payment_payload,
@@ -736,6 +737,27 @@ def test_order_lines_have_all_required_fields(
     }
 
 
+def test_generate_order_lines_payload_allocations(order_with_lines):
+    # given
+    lines = list(order_with_lines.lines.all())
+    assert len(lines) > 1
+
+    # when
+    payload = json.loads(generate_order_lines_payload(lines))
+
+    # then
+    for line, line_payload in zip(lines, payload):
+        assert line_payload["allocations"] == [
+            {
+                "warehouse_id": graphene.Node.to_global_id(
+                    "Warehouse", allocation.stock.warehouse_id
+                ),
+                "quantity_allocated": allocation.quantity_allocated,
+            }
+            for allocation in line.allocations.all()
+        ]
+
+
 @pytest.mark.parametrize(
     ("charge_taxes", "prices_entered_with_tax"),
     [(False, False), (False, True), (True, False), (True, True)],
@@ -8,6 +8,7 @@ from urllib.parse import urlparse
 from celery import group
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
 
 from ....celeryconf import app
@@ -47,6 +48,10 @@ task_logger = get_task_logger(f"{__name__}.celery")
 
 OBSERVABILITY_QUEUE_NAME = "observability"
 
+WEBHOOK_APP_CONCURRENCY_TIMEOUT = 600
+WEBHOOK_APP_CONCURRENCY_POSTPONE_DELAY = 5
+WEBHOOK_APP_CONCURRENCY_MAX_POSTPONES = 60
+
 
 def create_deliveries_for_subscriptions(
     event_type,
@@ -173,13 +178,55 @@ def create_event_delivery_list_for_webhooks(
 
 
 def get_queue_name_for_webhook(webhook, default_queue):
-    return {
+    queue = {
         WebhookSchemes.AWS_SQS: settings.WEBHOOK_SQS_CELERY_QUEUE_NAME,
         WebhookSchemes.GOOGLE_CLOUD_PUBSUB: settings.WEBHOOK_PUBSUB_CELERY_QUEUE_NAME,
     }.get(
         urlparse(webhook.target_url).scheme.lower(),
         default_queue,
     )
+    if shards := settings.WEBHOOK_CELERY_QUEUE_SHARDS:
+        queue = queue or app.conf.task_default_queue
+        return f"{queue}-{webhook.app_id % shards}"
+    return queue
+
+
+def _get_app_concurrency_key(app_id: int) -> str:
+    return f"webhook_app_concurrency_{app_id}"
+
+
+def acquire_app_delivery_slot(app_id: int) -> bool:
+    """Reserve a slot for sending a webhook delivery of the app.
+
+    Return `False` when the app already has `WEBHOOK_APP_MAX_CONCURRENCY`
+    deliveries in progress. The counter expires `WEBHOOK_APP_CONCURRENCY_TIMEOUT`
+    after the last acquired slot, so slots of killed workers are not lost.
+    """
+    max_concurrency = settings.WEBHOOK_APP_MAX_CONCURRENCY
+    if not max_concurrency:
+        return True
+    key = _get_app_concurrency_key(app_id)
+    if cache.add(key, 1, timeout=WEBHOOK_APP_CONCURRENCY_TIMEOUT):
+        return True
+    try:
+        in_progress = cache.incr(key)
+    except ValueError:
+        # the counter has just expired
+        return True
+    if in_progress > max_concurrency:
+        release_app_delivery_slot(app_id)
+        return False
+    cache.touch(key, WEBHOOK_APP_CONCURRENCY_TIMEOUT)
+    return True
+
+
+def release_app_delivery_slot(app_id: int):
+    if not settings.WEBHOOK_APP_MAX_CONCURRENCY:
+        return
+    try:
+        cache.decr(_get_app_concurrency_key(app_id))
+    except ValueError:
+        pass
 
 
 def trigger_webhooks_async(
@@ -257,20 +304,51 @@ def trigger_webhooks_async(
     retry_backoff=10,
     retry_kwargs={"max_retries": 5},
 )
-def send_webhook_request_async(self, event_delivery_id):
+def send_webhook_request_async(self, event_delivery_id, postpone_count=0):
     delivery = get_delivery_for_webhook(event_delivery_id)
     if not delivery:
         return None
 
+    app_id = delivery.webhook.app_id
+    slot_acquired = acquire_app_delivery_slot(app_id)
+    if not slot_acquired:
+        if postpone_count < WEBHOOK_APP_CONCURRENCY_MAX_POSTPONES:
+            # Postponed without using the retries of the delivery.
+            delivery_info = self.request.delivery_info or {}
+            send_webhook_request_async.apply_async(
+                kwargs={
+                    "event_delivery_id": event_delivery_id,
+                    "postpone_count": postpone_count + 1,
+                },
+                queue=delivery_info.get("routing_key")
+                or get_queue_name_for_webhook(
+                    delivery.webhook, settings.WEBHOOK_CELERY_QUEUE_NAME
+                ),
+                countdown=WEBHOOK_APP_CONCURRENCY_POSTPONE_DELAY,
+            )
+            return
+        task_logger.warning(
+            "Sending delivery %s over the concurrency limit of app %s after %s "
+            "postpones.",
+            event_delivery_id,
+            app_id,
+            postpone_count,
+        )
+    try:
+        _send_webhook_request(self, delivery)
+    finally:
+        if slot_acquired:
+            release_app_delivery_slot(app_id)
+
+
+def _send_webhook_request(task, delivery: EventDelivery):
     webhook = delivery.webhook
     domain = get_domain()
-    attempt = create_attempt(delivery, self.request.id)
+    attempt = create_attempt(delivery, task.request.id)
     delivery_status = EventDeliveryStatus.SUCCESS
     try:
         if not delivery.payload:
-            raise ValueError(
-                f"Event delivery id: %{event_delivery_id}r has no payload."
-            )
+            raise ValueError(f"Event delivery id: %{delivery.id}r has no payload.")
         data = delivery.payload.get_payload()
         with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
             response = send_webhook_using_scheme_method(
@@ -284,7 +362,7 @@ def send_webhook_request_async(self, event_delivery_id):
 
         attempt_update(attempt, response)
         if response.status == EventDeliveryStatus.FAILED:
-            handle_webhook_retry(self, webhook, response, delivery, attempt)
+            handle_webhook_retry(task, webhook, response, delivery, attempt)
             delivery_status = EventDeliveryStatus.FAILED
         elif response.status == EventDeliveryStatus.SUCCESS:
             task_logger.info(
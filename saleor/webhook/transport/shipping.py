@@ -2,6 +2,7 @@ import base64
 import json
 import logging
 from collections import defaultdict
+from functools import partial
 from typing import Any, Callable, Optional, Union
 
 from django.db.models import QuerySet
@@ -18,7 +19,10 @@ from ...settings import WEBHOOK_SYNC_TIMEOUT
 from ...shipping.interface import ShippingMethodData
 from ...webhook.utils import get_webhooks_for_event
 from ..const import APP_ID_PREFIX, CACHE_EXCLUDED_SHIPPING_TIME
-from .synchronous.transport import trigger_webhook_sync_if_not_cached
+from .synchronous.transport import (
+    run_sync_webhook_calls,
+    trigger_webhook_sync_if_not_cached,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -123,23 +127,29 @@ def get_excluded_shipping_methods_or_fetch(
     """Return data of all excluded shipping methods.
 
     The data will be fetched from the cache. If missing it will fetch it from all
-    defined webhooks by calling a request to each of them one by one.
+    defined webhooks by calling requests to all of them at once.
     """
     cache_data = get_cache_data_for_exclude_shipping_methods(payload)
     excluded_methods = []
     # Gather responses from webhooks
-    for webhook in webhooks:
-        response_data = trigger_webhook_sync_if_not_cached(
-            event_type=event_type,
-            payload=payload,
-            webhook=webhook,
-            cache_data=cache_data,
-            allow_replica=allow_replica,
-            subscribable_object=subscribable_object,
-            request_timeout=WEBHOOK_SYNC_TIMEOUT,
-            cache_timeout=CACHE_EXCLUDED_SHIPPING_TIME,
-            requestor=requestor,
-        )
+    responses = run_sync_webhook_calls(
+        [
+            partial(
+                trigger_webhook_sync_if_not_cached,
+                event_type=event_type,
+                payload=payload,
+                webhook=webhook,
+                cache_data=cache_data,
+                allow_replica=allow_replica,
+                subscribable_object=subscribable_object,
+                request_timeout=WEBHOOK_SYNC_TIMEOUT,
+                cache_timeout=CACHE_EXCLUDED_SHIPPING_TIME,
+                requestor=requestor,
+            )
+            for webhook in webhooks
+        ]
+    )
+    for response_data in responses:
         if response_data and isinstance(response_data, dict):
             excluded_methods.extend(
                 get_excluded_shipping_methods_from_response(response_data)
@@ -1,12 +1,15 @@
+import contextvars
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.core.cache import cache
-from django.db import transaction
+from django.db import connection, connections, transaction
 
 from ....celeryconf import app
 from ....core import EventDeliveryStatus
@@ -51,6 +54,8 @@ R = TypeVar("R")
 
 logger = logging.getLogger(__name__)
 
+_sync_webhooks_thread = threading.local()
+
 
 @app.task(
     bind=True,
@@ -276,6 +281,46 @@ def create_delivery_for_subscription_sync_event(
     return event_delivery
 
 
+def _run_sync_webhook_call(context: contextvars.Context, call: Callable[[], R]) -> R:
+    _sync_webhooks_thread.active = True
+    try:
+        return context.run(call)
+    finally:
+        _sync_webhooks_thread.active = False
+        # close the connections opened by the pool thread
+        connections.close_all()
+
+
+def run_sync_webhook_calls(calls: list[Callable[[], R]]) -> list[R]:
+    """Run independent synchronous webhook calls and return their results in order.
+
+    The first call runs in the caller thread and the others in a thread pool created
+    for these calls only, with at most `WEBHOOK_SYNC_MAX_CONCURRENCY` calls at once.
+    The request waits for the slowest app instead of the sum of all of them, and a
+    slow app doesn't hold up the calls of other requests. The calls are run one by
+    one in a database transaction, as other threads would not see its uncommitted
+    data.
+    """
+    if (
+        len(calls) < 2
+        or settings.WEBHOOK_SYNC_MAX_CONCURRENCY < 2
+        or connection.in_atomic_block
+        or getattr(_sync_webhooks_thread, "active", False)
+    ):
+        return [call() for call in calls]
+    first_call, *other_calls = calls
+    max_workers = min(len(other_calls), settings.WEBHOOK_SYNC_MAX_CONCURRENCY - 1)
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="sync-webhooks"
+    ) as executor:
+        futures = [
+            executor.submit(_run_sync_webhook_call, contextvars.copy_context(), call)
+            for call in other_calls
+        ]
+        first_result = first_call()
+        return [first_result, *(future.result() for future in futures)]
+
+
 def trigger_webhook_sync(
     event_type: str,
     payload: str,
@@ -0,0 +1,41 @@
+import threading
+
+from ..synchronous.transport import run_sync_webhook_calls
+
+
+def _make_call(result, threads):
+    def call():
+        threads.append((result, threading.get_ident()))
+        return result
+
+    return call
+
+
+def test_run_sync_webhook_calls_concurrently(settings):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENCY = 4
+    threads: list[tuple[int, int]] = []
+    calls = [_make_call(index, threads) for index in range(3)]
+
+    # when
+    results = run_sync_webhook_calls(calls)
+
+    # then
+    assert results == [0, 1, 2]
+    call_threads = dict(threads)
+    assert call_threads[0] == threading.get_ident()
+    assert threading.get_ident() not in (call_threads[1], call_threads[2])
+
+
+def test_run_sync_webhook_calls_in_transaction_one_by_one(settings, db):
+    # given
+    settings.WEBHOOK_SYNC_MAX_CONCURRENCY = 4
+    threads: list[tuple[int, int]] = []
+    calls = [_make_call(index, threads) for index in range(3)]
+
+    # when
+    results = run_sync_webhook_calls(calls)
+
+    # then
+    assert results == [0, 1, 2]
+    assert {thread for _, thread in threads} == {threading.get_ident()}